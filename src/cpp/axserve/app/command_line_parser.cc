@@ -106,6 +106,10 @@ CommandLineParser::CommandLineParser()
 
   app.option_defaults()->group("Server");
   app.add_option("--address-uri", config.addressUri, "Server address URI");
+  app.add_flag(
+      "--report-ready", config.reportReady,
+      "Print the bound address to stdout once the server is ready"
+  );
 
   app.option_defaults()->group("Server SSL/TLS");
   app.add_option("--ssl-root-cert-file", config.sslRootCertFile)
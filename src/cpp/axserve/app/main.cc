@@ -74,7 +74,15 @@ int main(int argc, char *argv[]) {
   mainWindow.setCentralWidget(serverWidget);
 
   if (config.startOnLaunch) {
-    server->start(serverWidget->getServerConfig());
+    bool started = server->start(serverWidget->getServerConfig());
+    if (config.reportReady) {
+      if (started) {
+        std::cout << "AXSERVE_READY " << server->boundAddressUri().toStdString()
+                  << std::endl;
+      } else {
+        std::cout << "AXSERVE_ERROR" << std::endl;
+      }
+    }
   }
 
   if (config.gui && !config.hideOnLaunch) {
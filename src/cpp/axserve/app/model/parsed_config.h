@@ -26,6 +26,7 @@
 
 struct ParsedConfig {
   std::string addressUri;
+  bool reportReady = false;
 
   std::string sslRootCertFile;
   std::string sslPrivateKeyFile;
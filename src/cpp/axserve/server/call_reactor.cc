@@ -0,0 +1,156 @@
+// Copyright 2023 Yunseong Hwang
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+// SPDX-FileCopyrightText: 2025 Yunseong Hwang
+//
+// SPDX-License-Identifier: Apache-2.0
+
+#include "call_reactor.h"
+
+#include <QMutexLocker>
+
+#include "executor.h"
+#include "inbound_item.h"
+
+CallReactor::CallReactor(
+    const QSharedPointer<Executor> &executor, CallbackServerContext *context
+)
+    : m_executor(executor),
+      m_context(context) {
+  m_reading = true;
+  m_finished = false;
+}
+
+QSharedPointer<CallReactor> CallReactor::create(
+    const QSharedPointer<Executor> &executor, CallbackServerContext *context
+) {
+  QSharedPointer<CallReactor> reactor =
+      QSharedPointer<CallReactor>::create(executor, context);
+  reactor->initialize();
+  return reactor;
+}
+
+void CallReactor::initialize() {
+  m_self = sharedFromThis();
+  StartRead(&m_request);
+}
+
+void CallReactor::send(const QSharedPointer<CallInboundItem> &item) {
+  {
+    QMutexLocker<QMutex> lock(&m_mutex);
+    if (!m_running.remove(item)) {
+      return;
+    }
+    m_pending.enqueue(item);
+  }
+  NextWrite();
+}
+
+void CallReactor::NextWrite() {
+  QSharedPointer<CallInboundItem> item;
+  {
+    QMutexLocker<QMutex> lock(&m_mutex);
+    if (m_finished || m_writing) {
+      return;
+    }
+    if (m_pending.empty()) {
+      if (m_reading || !m_running.empty()) {
+        return;
+      }
+      m_finished = true;
+    } else {
+      item = m_pending.dequeue();
+      m_writing = item;
+    }
+  }
+  if (item) {
+    StartWrite(item->response());
+  } else {
+    Finish(Status::OK);
+  }
+}
+
+void CallReactor::OnDone() {
+  QSharedPointer<CallReactor> self;
+  {
+    QMutexLocker<QMutex> lock(&m_mutex);
+    m_running.clear();
+    m_pending.clear();
+    m_writing.reset();
+    self.swap(m_self);
+  }
+}
+
+void CallReactor::OnCancel() {
+  QList<QSharedPointer<CallInboundItem>> running;
+  {
+    QMutexLocker<QMutex> lock(&m_mutex);
+    if (m_finished) {
+      return;
+    }
+    m_finished = true;
+    running = m_running.values();
+  }
+  for (const QSharedPointer<CallInboundItem> &item : running) {
+    item->cancel();
+  }
+  Finish(Status::CANCELLED);
+}
+
+void CallReactor::OnReadDone(bool ok) {
+  if (!ok) {
+    {
+      QMutexLocker<QMutex> lock(&m_mutex);
+      m_reading = false;
+    }
+    NextWrite();
+    return;
+  }
+  QSharedPointer<CallReactor> reactor = sharedFromThis();
+  QSharedPointer<CallInboundItem> item =
+      QSharedPointer<CallInboundItem>::create(m_context, reactor, m_request);
+  {
+    QMutexLocker<QMutex> lock(&m_mutex);
+    m_running.insert(item);
+  }
+  QSharedPointer<Executor> executor = m_executor;
+  if (executor) {
+    executor->schedule(item);
+  } else {
+    item->response()->set_code(static_cast<int>(StatusCode::UNAVAILABLE));
+    item->response()->set_message("Executor is not available");
+    send(item);
+  }
+  StartRead(&m_request);
+}
+
+void CallReactor::OnWriteDone(bool ok) {
+  {
+    QMutexLocker<QMutex> lock(&m_mutex);
+    m_writing.reset();
+    if (!ok) {
+      if (m_finished) {
+        return;
+      }
+      m_finished = true;
+    }
+  }
+  if (!ok) {
+    std::string msg = "Failed to send response";
+    Status status(StatusCode::UNKNOWN, msg);
+    Finish(status);
+  } else {
+    NextWrite();
+  }
+}
@@ -0,0 +1,82 @@
+/*
+ * Copyright 2023 Yunseong Hwang
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * SPDX-FileCopyrightText: 2025 Yunseong Hwang
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+#ifndef CALL_REACTOR_H
+#define CALL_REACTOR_H
+
+#include <QEnableSharedFromThis>
+#include <QMutex>
+#include <QQueue>
+#include <QSet>
+#include <QSharedPointer>
+#include <QWeakPointer>
+
+#include "active.grpc.pb.h"
+
+using grpc::CallbackServerContext;
+using grpc::ServerBidiReactor;
+
+using namespace axserve;
+
+class Executor;
+class CallInboundItem;
+
+class CallReactor : public ServerBidiReactor<CallRequest, CallResponse>,
+                    public QEnableSharedFromThis<CallReactor> {
+private:
+  QWeakPointer<Executor> m_executor;
+  CallbackServerContext *m_context;
+  QSharedPointer<CallReactor> m_self;
+  QSet<QSharedPointer<CallInboundItem>> m_running;
+  QQueue<QSharedPointer<CallInboundItem>> m_pending;
+  QSharedPointer<CallInboundItem> m_writing;
+  bool m_reading;
+  bool m_finished;
+  QMutex m_mutex;
+  CallRequest m_request;
+
+private:
+  CallReactor(
+      const QSharedPointer<Executor> &executor, CallbackServerContext *context
+  );
+
+public:
+  static QSharedPointer<CallReactor> create(
+      const QSharedPointer<Executor> &executor, CallbackServerContext *context
+  );
+
+private:
+  friend class QSharedPointer<CallReactor>;
+  void initialize();
+
+public:
+  void send(const QSharedPointer<CallInboundItem> &item);
+
+private:
+  void NextWrite();
+
+public:
+  void OnDone() override;
+  void OnCancel() override;
+  void OnReadDone(bool ok) override;
+  void OnWriteDone(bool ok) override;
+};
+
+#endif // CALL_REACTOR_H
@@ -21,6 +21,7 @@
 #include <exception>
 #include <sstream>
 
+#include "call_reactor.h"
 #include "control.h"
 #include "control_set.h"
 #include "inbound_channel.h"
@@ -125,6 +126,8 @@ bool Executor::execute(const QSharedPointer<InboundItem> &item) {
     return execute(item.staticCast<DescribeInboundItem>());
   case InboundItem::Type::GET_PROPERTY:
     return execute(item.staticCast<GetPropertyInboundItem>());
+  case InboundItem::Type::GET_PROPERTIES:
+    return execute(item.staticCast<GetPropertiesInboundItem>());
   case InboundItem::Type::SET_PROPERTY:
     return execute(item.staticCast<SetPropertyInboundItem>());
   case InboundItem::Type::INVOKE_METHOD:
@@ -133,26 +136,33 @@ bool Executor::execute(const QSharedPointer<InboundItem> &item) {
     return execute(item.staticCast<ConnectEventInboundItem>());
   case InboundItem::Type::DISCONNECT_EVENT:
     return execute(item.staticCast<DisconnectEventInboundItem>());
+  case InboundItem::Type::BATCH:
+    return execute(item.staticCast<BatchInboundItem>());
+  case InboundItem::Type::CALL:
+    return execute(item.staticCast<CallInboundItem>());
   default:
     qWarning() << "Unexpected inbound item type:" << item->type();
   }
   return false;
 }
 
-bool Executor::execute(const QSharedPointer<CreateInboundItem> &item) {
-  item->start();
-  QString clsid = QString::fromStdString(item->request()->clsid());
+Status
+Executor::create(const CreateRequest &request, CreateResponse *response) {
+  QString clsid = QString::fromStdString(request.clsid());
   QSharedPointer<Control> control = m_controls->create(clsid);
   if (!control) {
-    Status status(StatusCode::UNKNOWN, "Failed to create an instance");
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, "Failed to create an instance");
   }
-  item->response()->set_instance(control->instance().toString().toStdString());
-  item->reactor()->Finish(Status::OK);
+  response->set_instance(control->instance().toString().toStdString());
+  return Status::OK;
+}
+
+bool Executor::execute(const QSharedPointer<CreateInboundItem> &item) {
+  item->start();
+  Status status = create(*item->request(), item->response());
+  item->reactor()->Finish(status);
   item->finish();
-  return true;
+  return status.ok();
 }
 
 bool Executor::execute(const QSharedPointer<ReferInboundItem> &item) {
@@ -189,20 +199,23 @@ bool Executor::execute(const QSharedPointer<ReleaseInboundItem> &item) {
   return true;
 }
 
-bool Executor::execute(const QSharedPointer<DestroyInboundItem> &item) {
-  item->start();
-  QUuid uuid = QUuid::fromString(item->request()->instance());
+Status
+Executor::destroy(const DestroyRequest &request, DestroyResponse *response) {
+  QUuid uuid = QUuid::fromString(request.instance());
   bool successful = m_controls->destroy(uuid, true);
   if (!successful) {
-    Status status(StatusCode::UNKNOWN, "Failed to destroy the instance");
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, "Failed to destroy the instance");
   }
-  item->response()->set_successful(successful);
-  item->reactor()->Finish(Status::OK);
+  response->set_successful(successful);
+  return Status::OK;
+}
+
+bool Executor::execute(const QSharedPointer<DestroyInboundItem> &item) {
+  item->start();
+  Status status = destroy(*item->request(), item->response());
+  item->reactor()->Finish(status);
   item->finish();
-  return true;
+  return status.ok();
 }
 
 bool Executor::execute(const QSharedPointer<ListInboundItem> &item) {
@@ -275,88 +288,97 @@ bool Executor::execute(const QSharedPointer<DescribeInboundItem> &item) {
   return true;
 }
 
-bool Executor::execute(const QSharedPointer<GetPropertyInboundItem> &item) {
-  item->start();
-  QUuid uuid = QUuid::fromString(item->request()->instance());
+Status Executor::getProperty(
+    const GetPropertyRequest &request, GetPropertyResponse *response
+) {
+  QUuid uuid = QUuid::fromString(request.instance());
   bool contains = m_controls->contains(uuid);
   if (!contains) {
-    Status status(StatusCode::UNKNOWN, "Target instance does not exist");
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, "Target instance does not exist");
   }
   QSharedPointer<Control> control = m_controls->find(uuid);
-  int index = item->request()->index();
+  int index = request.index();
   QVariant qt_value;
   try {
     qt_value = control->getProperty(index);
   } catch (const std::exception &e) {
-    Status status(StatusCode::UNKNOWN, e.what());
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, e.what());
   }
   bool successful = qt_value.isValid();
   if (!successful) {
-    Status status(StatusCode::UNKNOWN, "Failed to get property");
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, "Failed to get property");
   }
-  Variant &proto_value = *item->response()->mutable_value();
+  Variant &proto_value = *response->mutable_value();
   QVariantToProtoVariant(qt_value, proto_value);
-  item->reactor()->Finish(Status::OK);
-  item->finish();
-  return true;
+  return Status::OK;
 }
 
-bool Executor::execute(const QSharedPointer<SetPropertyInboundItem> &item) {
-  item->start();
-  QUuid uuid = QUuid::fromString(item->request()->instance());
+Status Executor::getProperties(
+    const GetPropertiesRequest &request, GetPropertiesResponse *response
+) {
+  QUuid uuid = QUuid::fromString(request.instance());
   bool contains = m_controls->contains(uuid);
   if (!contains) {
-    Status status(StatusCode::UNKNOWN, "Target instance does not exist");
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, "Target instance does not exist");
   }
   QSharedPointer<Control> control = m_controls->find(uuid);
-  int index = item->request()->index();
-  QVariant qt_value = ProtoVariantToQVariant(item->request()->value());
+  for (int index : request.indexes()) {
+    QVariant qt_value;
+    try {
+      qt_value = control->getProperty(index);
+    } catch (const std::exception &e) {
+      return Status(StatusCode::UNKNOWN, e.what());
+    }
+    bool successful = qt_value.isValid();
+    if (!successful) {
+      return Status(
+          StatusCode::UNKNOWN,
+          QStringLiteral("Failed to get property at index %1")
+              .arg(index)
+              .toStdString()
+      );
+    }
+    Variant &proto_value = *response->add_values();
+    QVariantToProtoVariant(qt_value, proto_value);
+  }
+  return Status::OK;
+}
+
+Status Executor::setProperty(
+    const SetPropertyRequest &request, SetPropertyResponse *response
+) {
+  QUuid uuid = QUuid::fromString(request.instance());
+  bool contains = m_controls->contains(uuid);
+  if (!contains) {
+    return Status(StatusCode::UNKNOWN, "Target instance does not exist");
+  }
+  QSharedPointer<Control> control = m_controls->find(uuid);
+  int index = request.index();
+  QVariant qt_value = ProtoVariantToQVariant(request.value());
   bool successful = false;
   try {
     successful = control->setProperty(index, std::move(qt_value));
   } catch (const std::exception &e) {
-    Status status(StatusCode::UNKNOWN, e.what());
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, e.what());
   }
   if (!successful) {
-    Status status(StatusCode::UNKNOWN, "Failed to set property");
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, "Failed to set property");
   }
-  item->reactor()->Finish(Status::OK);
-  item->finish();
-  return true;
+  return Status::OK;
 }
 
-bool Executor::execute(const QSharedPointer<InvokeMethodInboundItem> &item) {
-  item->start();
-  QUuid uuid = QUuid::fromString(item->request()->instance());
+Status Executor::invokeMethod(
+    const InvokeMethodRequest &request, InvokeMethodResponse *response
+) {
+  QUuid uuid = QUuid::fromString(request.instance());
   bool contains = m_controls->contains(uuid);
   if (!contains) {
-    Status status(StatusCode::UNKNOWN, "Target instance does not exist");
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, "Target instance does not exist");
   }
   QSharedPointer<Control> control = m_controls->find(uuid);
-  int index = item->request()->index();
+  int index = request.index();
   QVariantList args;
-  for (auto const &a : item->request()->arguments()) {
+  for (auto const &a : request.arguments()) {
     QVariant arg = ProtoVariantToQVariant(a);
     args.push_back(std::move(arg));
   }
@@ -364,93 +386,197 @@ bool Executor::execute(const QSharedPointer<InvokeMethodInboundItem> &item) {
   try {
     qt_value = control->invokeMethod(index, args);
   } catch (const std::exception &e) {
-    Status status(StatusCode::UNKNOWN, e.what());
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, e.what());
   }
   bool successful = qt_value.isValid();
   if (!successful) {
-    Status status(
+    return Status(
         StatusCode::OK, "Returning null due to invalid return value."
     );
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
   }
-  Variant &proto_value = *item->response()->mutable_return_value();
+  Variant &proto_value = *response->mutable_return_value();
   QVariantToProtoVariant(qt_value, proto_value);
-  item->reactor()->Finish(Status::OK);
+  return Status::OK;
+}
+
+bool Executor::execute(const QSharedPointer<GetPropertyInboundItem> &item) {
+  item->start();
+  Status status = getProperty(*item->request(), item->response());
+  item->reactor()->Finish(status);
   item->finish();
-  return true;
+  return status.ok();
 }
 
-bool Executor::execute(const QSharedPointer<ConnectEventInboundItem> &item) {
+bool Executor::execute(const QSharedPointer<GetPropertiesInboundItem> &item) {
   item->start();
-  QUuid uuid = QUuid::fromString(item->request()->instance());
+  Status status = getProperties(*item->request(), item->response());
+  item->reactor()->Finish(status);
+  item->finish();
+  return status.ok();
+}
+
+bool Executor::execute(const QSharedPointer<SetPropertyInboundItem> &item) {
+  item->start();
+  Status status = setProperty(*item->request(), item->response());
+  item->reactor()->Finish(status);
+  item->finish();
+  return status.ok();
+}
+
+bool Executor::execute(const QSharedPointer<InvokeMethodInboundItem> &item) {
+  item->start();
+  Status status = invokeMethod(*item->request(), item->response());
+  item->reactor()->Finish(status);
+  item->finish();
+  return status.ok() && item->response()->has_return_value();
+}
+
+Status Executor::connectEvent(
+    const ConnectEventRequest &request, ConnectEventResponse *response,
+    const QString &peer
+) {
+  QUuid uuid = QUuid::fromString(request.instance());
   bool contains = m_controls->contains(uuid);
   if (!contains) {
-    Status status(StatusCode::UNKNOWN, "Target instance does not exist");
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, "Target instance does not exist");
   }
   QSharedPointer<Control> control = m_controls->find(uuid);
-  int index = item->request()->index();
-  QString peer = item->peer();
+  int index = request.index();
   bool successful = false;
   try {
     successful = control->connectEvent(index, peer);
   } catch (const std::exception &e) {
-    Status status(StatusCode::UNKNOWN, e.what());
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, e.what());
   }
   if (!successful) {
-    Status status(StatusCode::UNKNOWN, "Failed to connect event");
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, "Failed to connect event");
   }
-  item->response()->set_successful(true);
-  item->reactor()->Finish(Status::OK);
-  item->finish();
-  return true;
+  response->set_successful(true);
+  return Status::OK;
 }
 
-bool Executor::execute(const QSharedPointer<DisconnectEventInboundItem> &item) {
-  item->start();
-  QUuid uuid = QUuid::fromString(item->request()->instance());
+Status Executor::disconnectEvent(
+    const DisconnectEventRequest &request, DisconnectEventResponse *response,
+    const QString &peer
+) {
+  QUuid uuid = QUuid::fromString(request.instance());
   bool contains = m_controls->contains(uuid);
   if (!contains) {
-    Status status(StatusCode::UNKNOWN, "Target instance does not exist");
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, "Target instance does not exist");
   }
   QSharedPointer<Control> control = m_controls->find(uuid);
-  int index = item->request()->index();
-  QString peer = item->peer();
+  int index = request.index();
   bool successful = false;
   try {
     successful = control->disconnectEvent(index, peer);
   } catch (const std::exception &e) {
-    Status status(StatusCode::UNKNOWN, e.what());
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, e.what());
   }
   if (!successful) {
-    Status status(StatusCode::UNKNOWN, "Failed to disconnect event");
-    item->reactor()->Finish(status);
-    item->finish();
-    return false;
+    return Status(StatusCode::UNKNOWN, "Failed to disconnect event");
+  }
+  response->set_successful(true);
+  return Status::OK;
+}
+
+bool Executor::execute(const QSharedPointer<ConnectEventInboundItem> &item) {
+  item->start();
+  Status status =
+      connectEvent(*item->request(), item->response(), item->peer());
+  item->reactor()->Finish(status);
+  item->finish();
+  return status.ok();
+}
+
+bool Executor::execute(const QSharedPointer<DisconnectEventInboundItem> &item) {
+  item->start();
+  Status status =
+      disconnectEvent(*item->request(), item->response(), item->peer());
+  item->reactor()->Finish(status);
+  item->finish();
+  return status.ok();
+}
+
+bool Executor::execute(const QSharedPointer<BatchInboundItem> &item) {
+  item->start();
+  bool successful = true;
+  for (const BatchRequestItem &request : item->request()->items()) {
+    BatchResponseItem *response = item->response()->add_items();
+    Status status;
+    switch (request.request_case()) {
+    case BatchRequestItem::kGetProperty:
+      status =
+          getProperty(request.get_property(), response->mutable_get_property());
+      break;
+    case BatchRequestItem::kSetProperty:
+      status =
+          setProperty(request.set_property(), response->mutable_set_property());
+      break;
+    case BatchRequestItem::kInvokeMethod:
+      status = invokeMethod(
+          request.invoke_method(), response->mutable_invoke_method()
+      );
+      break;
+    case BatchRequestItem::kCreate:
+      status = create(request.create(), response->mutable_create());
+      break;
+    case BatchRequestItem::kDestroy:
+      status = destroy(request.destroy(), response->mutable_destroy());
+      break;
+    case BatchRequestItem::kConnectEvent:
+      status = connectEvent(
+          request.connect_event(), response->mutable_connect_event(),
+          item->peer()
+      );
+      break;
+    case BatchRequestItem::kDisconnectEvent:
+      status = disconnectEvent(
+          request.disconnect_event(), response->mutable_disconnect_event(),
+          item->peer()
+      );
+      break;
+    default:
+      status = Status(StatusCode::INVALID_ARGUMENT, "Empty batch request item");
+    }
+    response->set_code(static_cast<int>(status.error_code()));
+    response->set_message(status.error_message());
+    successful = successful && status.ok();
   }
-  item->response()->set_successful(true);
   item->reactor()->Finish(Status::OK);
   item->finish();
-  return true;
+  return successful;
+}
+
+bool Executor::execute(const QSharedPointer<CallInboundItem> &item) {
+  item->start();
+  const CallRequest *request = item->request();
+  CallResponse *response = item->response();
+  Status status;
+  switch (request->request_case()) {
+  case CallRequest::kGetProperty:
+    status =
+        getProperty(request->get_property(), response->mutable_get_property());
+    break;
+  case CallRequest::kSetProperty:
+    status =
+        setProperty(request->set_property(), response->mutable_set_property());
+    break;
+  case CallRequest::kInvokeMethod:
+    status = invokeMethod(
+        request->invoke_method(), response->mutable_invoke_method()
+    );
+    break;
+  default:
+    status = Status(StatusCode::INVALID_ARGUMENT, "Empty call request");
+  }
+  response->set_code(static_cast<int>(status.error_code()));
+  response->set_message(status.error_message());
+  item->finish();
+  QSharedPointer<CallReactor> reactor = item->callReactor();
+  if (reactor) {
+    reactor->send(item);
+  }
+  return status.ok();
 }
 
 void Executor::establish(const QSharedPointer<OutboundReactor> &reactor) {
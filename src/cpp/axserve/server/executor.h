@@ -60,6 +60,28 @@ private:
 public:
   bool addControl(const QString &classId);
 
+private:
+  Status create(const CreateRequest &request, CreateResponse *response);
+  Status destroy(const DestroyRequest &request, DestroyResponse *response);
+  Status
+  getProperty(const GetPropertyRequest &request, GetPropertyResponse *response);
+  Status getProperties(
+      const GetPropertiesRequest &request, GetPropertiesResponse *response
+  );
+  Status
+  setProperty(const SetPropertyRequest &request, SetPropertyResponse *response);
+  Status invokeMethod(
+      const InvokeMethodRequest &request, InvokeMethodResponse *response
+  );
+  Status connectEvent(
+      const ConnectEventRequest &request, ConnectEventResponse *response,
+      const QString &peer
+  );
+  Status disconnectEvent(
+      const DisconnectEventRequest &request, DisconnectEventResponse *response,
+      const QString &peer
+  );
+
 signals:
   void inbound();
   void outbound();
@@ -84,10 +106,13 @@ public:
   bool execute(const QSharedPointer<ListInboundItem> &item);
   bool execute(const QSharedPointer<DescribeInboundItem> &item);
   bool execute(const QSharedPointer<GetPropertyInboundItem> &item);
+  bool execute(const QSharedPointer<GetPropertiesInboundItem> &item);
   bool execute(const QSharedPointer<SetPropertyInboundItem> &item);
   bool execute(const QSharedPointer<InvokeMethodInboundItem> &item);
   bool execute(const QSharedPointer<ConnectEventInboundItem> &item);
   bool execute(const QSharedPointer<DisconnectEventInboundItem> &item);
+  bool execute(const QSharedPointer<BatchInboundItem> &item);
+  bool execute(const QSharedPointer<CallInboundItem> &item);
 
   void establish(const QSharedPointer<OutboundReactor> &reactor);
   bool dissolve(const QSharedPointer<OutboundReactor> &reactor);
@@ -23,8 +23,10 @@
 
 #include <QFuture>
 #include <QPromise>
+#include <QSharedPointer>
 #include <QString>
 #include <QUuid>
+#include <QWeakPointer>
 
 #include "active.grpc.pb.h"
 
@@ -33,6 +35,8 @@ using grpc::ServerUnaryReactor;
 
 using namespace axserve;
 
+class CallReactor;
+
 class InboundItem {
 public:
   enum Type {
@@ -43,10 +47,13 @@ public:
     LIST,
     DESCRIBE,
     GET_PROPERTY,
+    GET_PROPERTIES,
     SET_PROPERTY,
     INVOKE_METHOD,
     CONNECT_EVENT,
     DISCONNECT_EVENT,
+    BATCH,
+    CALL,
   };
 
 protected:
@@ -256,6 +263,26 @@ public:
             InboundItem::Type::GET_PROPERTY, context, reactor, request, response
         ) {}
 };
+class GetPropertiesInboundItem
+    : public FullInboundItem<GetPropertiesRequest, GetPropertiesResponse> {
+public:
+  GetPropertiesInboundItem(
+      InboundItem::Type type, CallbackServerContext *context,
+      ServerUnaryReactor *reactor, const GetPropertiesRequest *request,
+      GetPropertiesResponse *response
+  )
+      : FullInboundItem<GetPropertiesRequest, GetPropertiesResponse>(
+            type, context, reactor, request, response
+        ) {}
+  GetPropertiesInboundItem(
+      CallbackServerContext *context, ServerUnaryReactor *reactor,
+      const GetPropertiesRequest *request, GetPropertiesResponse *response
+  )
+      : GetPropertiesInboundItem(
+            InboundItem::Type::GET_PROPERTIES, context, reactor, request,
+            response
+        ) {}
+};
 class SetPropertyInboundItem
     : public FullInboundItem<SetPropertyRequest, SetPropertyResponse> {
 public:
@@ -336,4 +363,73 @@ public:
         ) {}
 };
 
+class BatchInboundItem : public FullInboundItem<BatchRequest, BatchResponse> {
+public:
+  BatchInboundItem(
+      InboundItem::Type type, CallbackServerContext *context,
+      ServerUnaryReactor *reactor, const BatchRequest *request,
+      BatchResponse *response
+  )
+      : FullInboundItem<BatchRequest, BatchResponse>(
+            type, context, reactor, request, response
+        ) {}
+  BatchInboundItem(
+      CallbackServerContext *context, ServerUnaryReactor *reactor,
+      const BatchRequest *request, BatchResponse *response
+  )
+      : BatchInboundItem(
+            InboundItem::Type::BATCH, context, reactor, request, response
+        ) {}
+};
+
+class CallInboundItem : public InboundItem {
+protected:
+  CallRequest m_request;
+  CallResponse m_response;
+  QWeakPointer<CallReactor> m_callReactor;
+
+  ContextType m_contextType;
+  QUuid m_contextId;
+
+public:
+  CallInboundItem(
+      CallbackServerContext *context,
+      const QSharedPointer<CallReactor> &callReactor, const CallRequest &request
+  )
+      : InboundItem(InboundItem::Type::CALL, context, nullptr),
+        m_request(request),
+        m_callReactor(callReactor) {
+    m_response.set_id(m_request.id());
+    m_contextType = this->context().context_type();
+    std::string id = this->context().context_info().id();
+    if (!id.empty()) {
+      m_contextId = QUuid::fromString(id);
+    }
+  }
+
+  virtual ~CallInboundItem() = default;
+
+  const CallRequest *request() const { return &m_request; }
+  CallResponse *response() { return &m_response; }
+
+  QSharedPointer<CallReactor> callReactor() const {
+    return m_callReactor.toStrongRef();
+  }
+
+  const Context &context() const override {
+    switch (m_request.request_case()) {
+    case CallRequest::kGetProperty:
+      return m_request.get_property().context();
+    case CallRequest::kSetProperty:
+      return m_request.set_property().context();
+    case CallRequest::kInvokeMethod:
+      return m_request.invoke_method().context();
+    default:
+      return Context::default_instance();
+    }
+  }
+  const ContextType &contextType() const override { return m_contextType; }
+  const QUuid &contextId() const override { return m_contextId; }
+};
+
 #endif // INBOUND_ITEM_H
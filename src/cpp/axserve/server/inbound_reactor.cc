@@ -86,6 +86,15 @@ InboundReactor::InboundReactor(
   );
   executor->schedule(m_item);
 }
+InboundReactor::InboundReactor(
+    const QSharedPointer<Executor> &executor, CallbackServerContext *context,
+    const GetPropertiesRequest *request, GetPropertiesResponse *response
+) {
+  m_item = QSharedPointer<GetPropertiesInboundItem>::create(
+      context, this, request, response
+  );
+  executor->schedule(m_item);
+}
 InboundReactor::InboundReactor(
     const QSharedPointer<Executor> &executor, CallbackServerContext *context,
     const SetPropertyRequest *request, SetPropertyResponse *response
@@ -123,6 +132,16 @@ InboundReactor::InboundReactor(
   executor->schedule(m_item);
 }
 
+InboundReactor::InboundReactor(
+    const QSharedPointer<Executor> &executor, CallbackServerContext *context,
+    const BatchRequest *request, BatchResponse *response
+) {
+  m_item = QSharedPointer<BatchInboundItem>::create(
+      context, this, request, response
+  );
+  executor->schedule(m_item);
+}
+
 void InboundReactor::OnDone() { delete this; }
 
 void InboundReactor::OnCancel() {
@@ -69,6 +69,10 @@ public:
       const QSharedPointer<Executor> &executor, CallbackServerContext *context,
       const GetPropertyRequest *request, GetPropertyResponse *response
   );
+  InboundReactor(
+      const QSharedPointer<Executor> &executor, CallbackServerContext *context,
+      const GetPropertiesRequest *request, GetPropertiesResponse *response
+  );
   InboundReactor(
       const QSharedPointer<Executor> &executor, CallbackServerContext *context,
       const SetPropertyRequest *request, SetPropertyResponse *response
@@ -85,6 +89,10 @@ public:
       const QSharedPointer<Executor> &executor, CallbackServerContext *context,
       const DisconnectEventRequest *request, DisconnectEventResponse *response
   );
+  InboundReactor(
+      const QSharedPointer<Executor> &executor, CallbackServerContext *context,
+      const BatchRequest *request, BatchResponse *response
+  );
 
 public:
   void OnDone() override;
@@ -29,6 +29,8 @@ OutboundReactor::OutboundReactor(
     : m_executor(executor) {
   m_uuid = QUuid::createUuid();
   m_peer = QString::fromStdString(context->peer());
+  m_sequence = 0;
+  m_batchEvents = false;
   m_writing = false;
   m_pongs = 0;
   m_pong.set_is_pong(true);
@@ -78,7 +80,8 @@ void OutboundReactor::NextWrite() {
       return;
     }
   }
-  QSharedPointer<OutboundItem> item;
+  QList<QSharedPointer<OutboundItem>> items;
+  bool batchEvents;
   {
     QMutexLocker<QMutex> pendingLock(&m_pendingMutex);
     if (m_pending.empty()) {
@@ -91,13 +94,39 @@ void OutboundReactor::NextWrite() {
         m_writing = true;
       }
     }
-    item = m_pending.dequeue();
+    batchEvents = m_batchEvents;
+    do {
+      items.append(m_pending.dequeue());
+    } while (batchEvents && !m_pending.empty() && items.size() < maxBatchSize);
   }
+  if (!batchEvents) {
+    const QSharedPointer<OutboundItem> &item = items.first();
+    {
+      QMutexLocker<QMutex> runningLock(&m_runningMutex);
+      m_running[item->uuid()] = item;
+    }
+    StartWrite(&item->request());
+    return;
+  }
+  m_frame.Clear();
   {
     QMutexLocker<QMutex> runningLock(&m_runningMutex);
-    m_running[item->uuid()] = item;
+    for (const QSharedPointer<OutboundItem> &item : items) {
+      HandleEventRequest *event = m_frame.add_events();
+      *event = item->request();
+      event->set_sequence(++m_sequence);
+      m_running[item->uuid()] = item;
+      m_sequences[m_sequence] = item->uuid();
+    }
+  }
+  StartWrite(&m_frame);
+}
+
+void OutboundReactor::NotifyHandled(const QSharedPointer<OutboundItem> &item) {
+  QSharedPointer<OutboundReactor> reactor = sharedFromThis();
+  if (item && reactor) {
+    item->notifyHandledBy(reactor);
   }
-  StartWrite(&item->request());
 }
 
 void OutboundReactor::OnDone() {
@@ -110,6 +139,7 @@ void OutboundReactor::OnDone() {
       }
     }
     m_running.clear();
+    m_sequences.clear();
   }
   {
     QMutexLocker<QMutex> pendingLock(&m_pendingMutex);
@@ -139,17 +169,42 @@ void OutboundReactor::OnReadDone(bool ok) {
       m_pongs++;
     }
     StartRead(&m_response);
+  } else if (m_response.batch_events()) {
+    {
+      QMutexLocker<QMutex> pendingLock(&m_pendingMutex);
+      m_batchEvents = true;
+    }
+    StartRead(&m_response);
+  } else if (m_response.acked_sequence() > 0) {
+    QList<QSharedPointer<OutboundItem>> items;
+    {
+      QMutexLocker<QMutex> runningLock(&m_runningMutex);
+      auto it = m_sequences.begin();
+      while (it != m_sequences.end() &&
+             it.key() <= m_response.acked_sequence()) {
+        QSharedPointer<OutboundItem> item = m_running.take(it.value());
+        if (item) {
+          items.append(item);
+        }
+        it = m_sequences.erase(it);
+      }
+    }
+    for (const QSharedPointer<OutboundItem> &item : items) {
+      NotifyHandled(item);
+    }
+    StartRead(&m_response);
   } else {
     QSharedPointer<OutboundItem> item;
     {
       QMutexLocker<QMutex> runningLock(&m_runningMutex);
       QUuid uuid = QUuid::fromString(m_response.id());
       item = m_running.take(uuid);
+      while (!m_sequences.isEmpty() &&
+             !m_running.contains(m_sequences.first())) {
+        m_sequences.erase(m_sequences.begin());
+      }
     }
-    QSharedPointer<OutboundReactor> reactor = sharedFromThis();
-    if (item && reactor) {
-      item->notifyHandledBy(reactor);
-    }
+    NotifyHandled(item);
     StartRead(&m_response);
   }
 }
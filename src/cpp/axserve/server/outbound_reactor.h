@@ -23,6 +23,7 @@
 
 #include <QEnableSharedFromThis>
 #include <QHash>
+#include <QMap>
 #include <QMutex>
 #include <QQueue>
 #include <QSharedPointer>
@@ -49,6 +50,9 @@ private:
   QWeakPointer<Executor> m_executor;
   QQueue<QSharedPointer<OutboundItem>> m_pending;
   QHash<QUuid, QSharedPointer<OutboundItem>> m_running;
+  QMap<quint64, QUuid> m_sequences;
+  quint64 m_sequence;
+  bool m_batchEvents;
   bool m_writing;
   int m_pongs;
   QMutex m_pendingMutex;
@@ -57,6 +61,9 @@ private:
   QMutex m_pongsMutex;
   HandleEventResponse m_response;
   HandleEventRequest m_pong;
+  HandleEventRequest m_frame;
+
+  static const int maxBatchSize = 256;
 
 private:
   OutboundReactor(
@@ -80,6 +87,7 @@ public:
 
 private:
   void NextWrite();
+  void NotifyHandled(const QSharedPointer<OutboundItem> &item);
 
 public:
   void OnDone() override;
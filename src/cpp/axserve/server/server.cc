@@ -38,6 +38,8 @@ void Server::initialize() {
   m_serverBuilder.reset(new grpc::ServerBuilder());
   m_serverBuilder->RegisterService(m_service.get());
   m_server.reset();
+  m_selectedPort = 0;
+  m_boundAddressUri.clear();
 }
 
 bool Server::addControl(const QString &classId) {
@@ -52,6 +54,8 @@ void Server::addListeningPort(const QString &addressUri) {
 
 bool Server::isRunning() { return m_server.get() != nullptr; }
 
+QString Server::boundAddressUri() { return m_boundAddressUri; }
+
 bool Server::start(const ServerConfig &config) {
   shutdown();
   emit statusChanged(ServerStatus::Starting);
@@ -126,12 +130,19 @@ bool Server::start(const ServerConfig &config) {
       serverCredentials->SetAuthMetadataProcessor(authProcessor);
     }
     m_serverBuilder->AddListeningPort(
-        config.addressUri.toStdString(), serverCredentials
+        config.addressUri.toStdString(), serverCredentials, &m_selectedPort
     );
   }
   m_server = m_serverBuilder->BuildAndStart();
   bool is_running = isRunning();
   if (is_running) {
+    m_boundAddressUri = config.addressUri;
+    qsizetype portIndex = m_boundAddressUri.lastIndexOf(':');
+    if (!m_boundAddressUri.startsWith("unix:") && portIndex >= 0 &&
+        m_selectedPort > 0) {
+      m_boundAddressUri.truncate(portIndex + 1);
+      m_boundAddressUri.append(QString::number(m_selectedPort));
+    }
     emit statusChanged(ServerStatus::Running);
   } else {
     emit statusChanged(ServerStatus::Error);
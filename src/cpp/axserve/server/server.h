@@ -44,6 +44,9 @@ private:
   std::unique_ptr<grpc::ServerBuilder> m_serverBuilder;
   std::unique_ptr<grpc::Server> m_server;
 
+  int m_selectedPort = 0;
+  QString m_boundAddressUri;
+
 private:
   void initialize();
 
@@ -55,6 +58,7 @@ public:
   void addListeningPort(const QString &addressUri);
 
   bool isRunning();
+  QString boundAddressUri();
 
 signals:
   void statusChanged(ServerStatus status);
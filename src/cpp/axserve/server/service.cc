@@ -18,6 +18,7 @@
 
 #include "service.h"
 
+#include "call_reactor.h"
 #include "inbound_reactor.h"
 #include "outbound_reactor.h"
 
@@ -70,6 +71,12 @@ ServerUnaryReactor *Service::GetProperty(
 ) {
   return new InboundReactor(m_executor, context, request, response);
 }
+ServerUnaryReactor *Service::GetProperties(
+    CallbackServerContext *context, const GetPropertiesRequest *request,
+    GetPropertiesResponse *response
+) {
+  return new InboundReactor(m_executor, context, request, response);
+}
 ServerUnaryReactor *Service::SetProperty(
     CallbackServerContext *context, const SetPropertyRequest *request,
     SetPropertyResponse *response
@@ -95,9 +102,23 @@ ServerUnaryReactor *Service::DisconnectEvent(
   return new InboundReactor(m_executor, context, request, response);
 }
 
+ServerUnaryReactor *Service::Batch(
+    CallbackServerContext *context, const BatchRequest *request,
+    BatchResponse *response
+) {
+  return new InboundReactor(m_executor, context, request, response);
+}
+
 ServerBidiReactor<HandleEventResponse, HandleEventRequest> *
 Service::HandleEvent(CallbackServerContext *context) {
   QSharedPointer<OutboundReactor> reactor =
       OutboundReactor::create(m_executor, context);
   return reactor.get();
 }
+
+ServerBidiReactor<CallRequest, CallResponse> *
+Service::Call(CallbackServerContext *context) {
+  QSharedPointer<CallReactor> reactor =
+      CallReactor::create(m_executor, context);
+  return reactor.get();
+}
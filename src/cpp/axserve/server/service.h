@@ -76,6 +76,10 @@ public:
       CallbackServerContext *context, const GetPropertyRequest *request,
       GetPropertyResponse *response
   ) override;
+  ServerUnaryReactor *GetProperties(
+      CallbackServerContext *context, const GetPropertiesRequest *request,
+      GetPropertiesResponse *response
+  ) override;
   ServerUnaryReactor *SetProperty(
       CallbackServerContext *context, const SetPropertyRequest *request,
       SetPropertyResponse *response
@@ -92,10 +96,16 @@ public:
       CallbackServerContext *context, const DisconnectEventRequest *request,
       DisconnectEventResponse *response
   ) override;
+  ServerUnaryReactor *Batch(
+      CallbackServerContext *context, const BatchRequest *request,
+      BatchResponse *response
+  ) override;
 
 public:
   ServerBidiReactor<HandleEventResponse, HandleEventRequest> *
   HandleEvent(CallbackServerContext *context) override;
+  ServerBidiReactor<CallRequest, CallResponse> *
+  Call(CallbackServerContext *context) override;
 };
 
 #endif // SERVICE_H
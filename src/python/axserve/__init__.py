@@ -18,5 +18,7 @@
 
 from __future__ import annotations
 
+from .client.pool import *
 from .client.stub import *
+from .common.describe_cache import *
 from .server.process import *
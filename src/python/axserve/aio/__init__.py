@@ -18,5 +18,6 @@
 
 from __future__ import annotations
 
+from .client.pool import *
 from .client.stub import *
 from .server.process import *
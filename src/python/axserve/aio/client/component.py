@@ -20,10 +20,18 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import contextvars
+import functools
+import inspect
+import itertools
+import logging
+import time
 
 from asyncio import Lock
 from asyncio import Task
 from collections import defaultdict
+from collections import deque
+from contextvars import ContextVar
 from typing import TYPE_CHECKING
 from typing import TypeVar
 from weakref import WeakValueDictionary
@@ -35,33 +43,55 @@ from axserve.aio.client.descriptor import AxServeMember
 from axserve.aio.client.descriptor import AxServeMethod
 from axserve.aio.client.descriptor import AxServeProperty
 from axserve.aio.common.async_initializable import AsyncInitializable
+from axserve.common.call import add_batch_request_item
+from axserve.common.call import set_request_item
+from axserve.common.call import set_response_item_result
+from axserve.common.event_handler import AxServeEarlyAckHandler
 from axserve.proto import active_pb2
 from axserve.proto.active_pb2_conversion import ValueFromVariant
 
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterable
+    from collections.abc import Awaitable
     from collections.abc import Callable
+    from collections.abc import Hashable
     from collections.abc import Mapping
+    from concurrent.futures import Executor
+    from contextvars import Token
+    from types import TracebackType
+    from typing import Any
 
     from axserve.aio.client.stub import AxServeObject
     from axserve.aio.common.async_acquireable import AsyncAcquireable
+    from axserve.common.describe_cache import AxServeDescribeCache
     from axserve.proto.active_pb2_grpc import ActiveAsyncStub
 
 
+logger = logging.getLogger(__name__)
+
+
 T = TypeVar("T")
 
 
 class AxServeEventContextManager:
     def __init__(self):
-        self._handle_event_context_stack = []
+        self._current_handle_event: ContextVar[active_pb2.HandleEventRequest | None] = (
+            ContextVar("_current_handle_event", default=None)
+        )
+
+    def _push_handle_event(
+        self, handle_event: active_pb2.HandleEventRequest
+    ) -> Token[active_pb2.HandleEventRequest | None]:
+        return self._current_handle_event.set(handle_event)
 
-    def _get_handle_event_context_stack(self) -> list[active_pb2.HandleEventRequest]:
-        return self._handle_event_context_stack
+    def _pop_handle_event(
+        self, token: Token[active_pb2.HandleEventRequest | None]
+    ) -> None:
+        self._current_handle_event.reset(token)
 
     def _get_current_handle_event(self) -> active_pb2.HandleEventRequest | None:
-        handle_event_context_stack = self._get_handle_event_context_stack()
-        return handle_event_context_stack[-1] if handle_event_context_stack else None
+        return self._current_handle_event.get()
 
     def _contextualize_request(self, request):
         current_handle_event = self._get_current_handle_event()
@@ -75,6 +105,155 @@ class AxServeEventContextManager:
         return request
 
 
+class AxServeBatchManager:
+    def __init__(self):
+        self._current_batch: ContextVar[AxServeBatch | None] = ContextVar(
+            "_current_batch", default=None
+        )
+
+    def _get_current_batch(self) -> AxServeBatch | None:
+        return self._current_batch.get()
+
+
+class AxServeCallOptionsManager:
+    def __init__(self, timeout: float | None = None):
+        self._timeout = timeout
+        self._current_call_options: ContextVar[AxServeCallOptions | None] = ContextVar(
+            "_current_call_options", default=None
+        )
+        self._keyed_calls: dict[Hashable, grpc.aio.Call] = {}
+
+    def _get_current_call_options(self) -> AxServeCallOptions | None:
+        return self._current_call_options.get()
+
+    def _get_timeout(self) -> float | None:
+        options = self._get_current_call_options()
+        while options is not None:
+            if options._timeout is not None:
+                return options._timeout
+            options = options._parent
+        return self._timeout
+
+    def _get_key(self) -> Hashable | None:
+        options = self._get_current_call_options()
+        while options is not None:
+            if options._key is not None:
+                return options._key
+            options = options._parent
+        return None
+
+    def _supersede(self, key: Hashable, call: grpc.aio.Call) -> None:
+        previous = self._keyed_calls.get(key)
+        self._keyed_calls[key] = call
+        if previous is not None:
+            previous.cancel()
+
+    def _release(self, key: Hashable, call: grpc.aio.Call) -> None:
+        if self._keyed_calls.get(key) is call:
+            del self._keyed_calls[key]
+
+
+class AxServeCallOptions:
+    def __init__(
+        self,
+        call_options_manager: AxServeCallOptionsManager,
+        timeout: float | None = None,
+        key: Hashable | None = None,
+    ):
+        self._call_options_manager = call_options_manager
+        self._timeout = timeout
+        self._key = key
+        self._parent: AxServeCallOptions | None = None
+        self._token: Token[AxServeCallOptions | None] | None = None
+
+    def __enter__(self):
+        current_call_options = self._call_options_manager._current_call_options
+        self._parent = current_call_options.get()
+        self._token = current_call_options.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        if self._token is not None:
+            self._call_options_manager._current_call_options.reset(self._token)
+            self._token = None
+        self._parent = None
+
+
+class AxServeBatch:
+    def __init__(
+        self,
+        stub: ActiveAsyncStub,
+        event_context_manager: AxServeEventContextManager,
+        batch_manager: AxServeBatchManager,
+        call_options_manager: AxServeCallOptionsManager | None = None,
+    ):
+        self._stub = stub
+        self._event_context_manager = event_context_manager
+        self._batch_manager = batch_manager
+        self._call_options_manager = call_options_manager
+        self._items: list[tuple[Any, asyncio.Future]] = []
+        self._token: Token[AxServeBatch | None] | None = None
+
+    def _add_request(self, request) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._items.append((request, future))
+        return future
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def flush(self) -> None:
+        items, self._items = self._items, []
+        items = [(request, future) for request, future in items if not future.done()]
+        if not items:
+            return
+        request = active_pb2.BatchRequest()
+        for item_request, _ in items:
+            add_batch_request_item(request, item_request)
+        self._event_context_manager._contextualize_request(request)
+        timeout = None
+        if self._call_options_manager is not None:
+            timeout = self._call_options_manager._get_timeout()
+        try:
+            response = await self._stub.Batch(request, timeout=timeout)
+        except grpc.RpcError as exc:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(exc)
+            raise
+        for (_, future), response_item in zip(items, response.items, strict=True):
+            if not future.done():
+                set_response_item_result(future, response_item)
+
+    def cancel(self) -> None:
+        items, self._items = self._items, []
+        for _, future in items:
+            future.cancel()
+
+    async def __aenter__(self):
+        self._token = self._batch_manager._current_batch.set(self)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        if self._token is not None:
+            self._batch_manager._current_batch.reset(self._token)
+            self._token = None
+        if exc_type is None:
+            await self.flush()
+        else:
+            self.cancel()
+
+
 class AxServeEventHandlersManager:
     def __init__(self):
         self._event_handlers_mapping: Mapping[int, list[Callable]] = defaultdict(list)
@@ -90,8 +269,10 @@ class AxServeEventHandlersManager:
 
 
 class AxServeEventStreamManager:
-    def __init__(self, stub: ActiveAsyncStub):
+    def __init__(self, stub: ActiveAsyncStub, *, batch_events: bool = False):
         self._handle_event_requests = stub.HandleEvent()
+        self._handle_event_write_lock = Lock()
+        self._batch_events_pending = batch_events
 
     def _get_handle_event_requests(
         self,
@@ -101,15 +282,155 @@ class AxServeEventStreamManager:
     async def _put_handle_event_response(
         self, response: active_pb2.HandleEventResponse
     ) -> None:
-        return await self._handle_event_requests.write(response)
+        async with self._handle_event_write_lock:
+            return await self._handle_event_requests.write(response)
+
+    async def _request_batch_events(self) -> None:
+        if not self._batch_events_pending:
+            return
+        self._batch_events_pending = False
+        response = active_pb2.HandleEventResponse(batch_events=True)
+        await self._put_handle_event_response(response)
 
     async def _close_event_stream(self) -> None:
-        return await self._handle_event_requests.done_writing()
+        async with self._handle_event_write_lock:
+            return await self._handle_event_requests.done_writing()
 
     def _cancel_event_stream(self) -> bool:
         return self._handle_event_requests.cancel()
 
 
+class AxServeDestroyQueue:
+    def __init__(
+        self,
+        destroy: Callable[[list[str]], Awaitable[list[Any]]],
+        max_batch_size: int = 100,
+    ):
+        self._destroy = destroy
+        self._max_batch_size = max_batch_size
+        self._pending: list[str] = []
+        self._submitted = 0
+        self._completed = 0
+        self._failures = 0
+        self._is_closed = False
+        self._wakeup = asyncio.Event()
+        self._waiters: list[tuple[int, asyncio.Future[None]]] = []
+        self._worker = asyncio.create_task(self._run())
+
+    @property
+    def pending(self) -> int:
+        return self._submitted - self._completed
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def _put(self, instance: str) -> bool:
+        if self._is_closed:
+            return False
+        self._pending.append(instance)
+        self._submitted += 1
+        self._wakeup.set()
+        return True
+
+    def _notify_waiters(self) -> None:
+        waiters = []
+        for submitted, future in self._waiters:
+            if self._completed < submitted:
+                waiters.append((submitted, future))
+            elif not future.done():
+                future.set_result(None)
+        self._waiters = waiters
+
+    async def _run(self) -> None:
+        while not (self._is_closed and not self._pending):
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                batch = self._pending[: self._max_batch_size]
+                del self._pending[: self._max_batch_size]
+                failures = 0
+                try:
+                    results = await self._destroy(batch)
+                except Exception:
+                    logger.exception("Failed to destroy axserve instances")
+                    failures = len(batch)
+                else:
+                    failures = sum(1 for result in results if result is not True)
+                self._completed += len(batch)
+                self._failures += failures
+                self._notify_waiters()
+
+    async def _flush(self) -> None:
+        if self._completed >= self._submitted:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((self._submitted, future))
+        await future
+
+    async def _close(self) -> None:
+        self._is_closed = True
+        self._wakeup.set()
+        await self._worker
+
+
+class AxServeCallStreamManager:
+    def __init__(self, stub: ActiveAsyncStub):
+        self._call_requests = stub.Call()
+        self._call_ids = itertools.count(1)
+        self._call_futures: dict[int, asyncio.Future] = {}
+        self._call_write_lock = Lock()
+        self._call_error: grpc.RpcError | None = None
+        self._call_response_reader = asyncio.create_task(self._read_call_responses())
+
+    async def _read_call_responses(self) -> None:
+        error: grpc.RpcError
+        try:
+            async for response in self._call_requests:
+                future = self._call_futures.pop(response.id, None)
+                if future is not None and not future.done():
+                    set_response_item_result(future, response)
+        except grpc.RpcError as exc:
+            error = exc
+        else:
+            error = grpc.RpcError("Call stream is closed")
+        self._call_error = error
+        futures = list(self._call_futures.values())
+        self._call_futures.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def _is_call_stream_available(self) -> bool:
+        return self._call_error is None
+
+    async def _call(self, request) -> asyncio.Future | None:
+        if self._call_error is not None:
+            return None
+        call_request = active_pb2.CallRequest()
+        call_request.id = next(self._call_ids)
+        set_request_item(call_request, request)
+        future = asyncio.get_running_loop().create_future()
+        self._call_futures[call_request.id] = future
+        try:
+            async with self._call_write_lock:
+                await self._call_requests.write(call_request)
+        except (grpc.RpcError, asyncio.InvalidStateError):
+            self._call_futures.pop(call_request.id, None)
+            if future.done():
+                future.exception()
+            return None
+        return future
+
+    async def _close_call_stream(self) -> None:
+        async with self._call_write_lock:
+            await self._call_requests.done_writing()
+        await self._call_response_reader
+
+    def _cancel_call_stream(self) -> bool:
+        return self._call_requests.cancel()
+
+
 class AxServeInstancesManager:
     _instances: WeakValueDictionary[str, AxServeObject]
 
@@ -127,6 +448,9 @@ class AxServeInstancesManager:
     def _has_instance(self, i: str) -> bool:
         return i in self._instances
 
+    def _count_instances(self) -> int:
+        return len(self._instances)
+
     def _get_instance(
         self, i: str, default: T | None = None
     ) -> AxServeObject | T | None:
@@ -138,6 +462,7 @@ class AxServeMembersManager(AsyncInitializable["AxServeMembersManager"]):
     _stub: ActiveAsyncStub
     _context_manager: AxServeEventContextManager
 
+    _response: active_pb2.DescribeResponse | None
     _members_dict: dict[str, AxServeMember]
     _properties_list: list[AxServeProperty]
     _properties_dict: dict[str, AxServeProperty]
@@ -151,10 +476,12 @@ class AxServeMembersManager(AsyncInitializable["AxServeMembersManager"]):
         instance: str,
         stub: ActiveAsyncStub,
         context_manager: AxServeEventContextManager,
+        response: active_pb2.DescribeResponse | None = None,
     ):
         self._instance = instance
         self._stub = stub
         self._context_manager = context_manager
+        self._response = response
 
         self._members_dict = {}
         self._properties_list = []
@@ -165,33 +492,57 @@ class AxServeMembersManager(AsyncInitializable["AxServeMembersManager"]):
         self._events_dict = {}
 
     async def __ainit__(self):
-        request = active_pb2.DescribeRequest()
-        request.instance = self._instance
-        self._context_manager._contextualize_request(request)
-        response = await self._stub.Describe(request)
+        response = self._response
+        if response is None:
+            request = active_pb2.DescribeRequest()
+            request.instance = self._instance
+            self._context_manager._contextualize_request(request)
+            response = await self._stub.Describe(request)
+
+        self._load(response)
+
+    def _load(self, response: active_pb2.DescribeResponse) -> None:
+        members_dict: dict[str, AxServeMember] = {}
+        properties_list = []
+        properties_dict = {}
+        methods_list = []
+        methods_dict = {}
+        events_list = []
+        events_dict = {}
 
         for info in response.properties:
             prop = AxServeProperty(info)
-            self._properties_list.append(prop)
-            self._properties_dict[info.name] = prop
-            if info.name not in self._members_dict:
-                self._members_dict[info.name] = AxServeMember()
-            self._members_dict[info.name]._property = prop
+            properties_list.append(prop)
+            properties_dict[info.name] = prop
+            if info.name not in members_dict:
+                members_dict[info.name] = AxServeMember()
+            members_dict[info.name]._property = prop
         for info in response.methods:
             method = AxServeMethod(info)
-            self._methods_list.append(method)
-            self._methods_dict[info.name] = method
-            if info.name not in self._members_dict:
-                self._members_dict[info.name] = AxServeMember()
-            self._members_dict[info.name]._method = method
-        for info in response.events:
+            methods_list.append(method)
+            methods_dict[info.name] = method
+            if info.name not in members_dict:
+                members_dict[info.name] = AxServeMember()
+            members_dict[info.name]._method = method
+        for event_info in response.events:
+            info = active_pb2.EventInfo()
+            info.CopyFrom(event_info)
             info.name = self._make_event_method_name(info.name)
             event = AxServeEvent(info)
-            self._events_list.append(event)
-            self._events_dict[info.name] = event
-            if info.name not in self._members_dict:
-                self._members_dict[info.name] = AxServeMember()
-            self._members_dict[info.name]._event = event
+            events_list.append(event)
+            events_dict[info.name] = event
+            if info.name not in members_dict:
+                members_dict[info.name] = AxServeMember()
+            members_dict[info.name]._event = event
+
+        self._response = response
+        self._members_dict = members_dict
+        self._properties_list = properties_list
+        self._properties_dict = properties_dict
+        self._methods_list = methods_list
+        self._methods_dict = methods_dict
+        self._events_list = events_list
+        self._events_dict = events_dict
 
     @classmethod
     def _make_event_method_name(cls, name: str) -> str:
@@ -217,26 +568,252 @@ class AxServeMembersManager(AsyncInitializable["AxServeMembersManager"]):
     def _get_member_names(self) -> list[str]:
         return list(self._members_dict.keys())
 
+    def _get_property_index(self, name: str) -> int:
+        prop = self._properties_dict.get(name)
+        if prop is None or prop._index is None:
+            msg = f"Object has no property '{name}'"
+            raise ValueError(msg)
+        return prop._index
+
+    def _get_readable_property_names(self) -> list[str]:
+        return [
+            info.name
+            for prop in self._properties_list
+            if (info := prop._info) is not None and info.is_readable
+        ]
+
 
 class AxServeMembersManagerCache:
     def __init__(
         self,
         stub: ActiveAsyncStub,
         context_manager: AxServeEventContextManager,
+        describe_cache: AxServeDescribeCache | None = None,
     ):
         self._stub = stub
         self._context_manager = context_manager
+        self._describe_cache = describe_cache
         self._members_managers: dict[str, AxServeMembersManager] = {}
+        self._pending: dict[str, asyncio.Future[AxServeMembersManager]] = {}
+        self._validate_tasks: set[asyncio.Task] = set()
+        self._collapsed = 0
+
+    @property
+    def collapsed(self) -> int:
+        return self._collapsed
 
     async def _get_members_manager(self, c: str, i: str) -> AxServeMembersManager:
-        if c not in self._members_managers:
+        while (future := self._pending.get(c)) is not None:
+            self._collapsed += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+        members_manager = self._members_managers.get(c)
+        if members_manager is not None:
+            return members_manager
+        future = self._pending[c] = asyncio.get_running_loop().create_future()
+        try:
+            members_manager = await self._create_members_manager(c, i)
+        except asyncio.CancelledError:
+            del self._pending[c]
+            future.cancel()
+            raise
+        except BaseException as exc:
+            del self._pending[c]
+            future.set_exception(exc)
+            future.exception()
+            raise
+        self._members_managers[c] = members_manager
+        del self._pending[c]
+        future.set_result(members_manager)
+        return members_manager
+
+    async def _create_members_manager(self, c: str, i: str) -> AxServeMembersManager:
+        describe_cache = self._describe_cache
+        if describe_cache is None:
+            return await AxServeMembersManager(i, self._stub, self._context_manager)
+        response = await asyncio.to_thread(describe_cache.load, c)
+        if response is None:
             members_manager = await AxServeMembersManager(
                 i, self._stub, self._context_manager
             )
-            self._members_managers[c] = members_manager
-        members_manager = self._members_managers[c]
+            if members_manager._response is not None:
+                await asyncio.to_thread(
+                    describe_cache.store, c, members_manager._response
+                )
+            return members_manager
+        members_manager = await AxServeMembersManager(
+            i, self._stub, self._context_manager, response
+        )
+        task = asyncio.create_task(
+            self._validate_members_manager(c, i, members_manager)
+        )
+        self._validate_tasks.add(task)
+        task.add_done_callback(self._validate_tasks.discard)
         return members_manager
 
+    async def _validate_members_manager(
+        self, c: str, i: str, members_manager: AxServeMembersManager
+    ) -> None:
+        describe_cache = self._describe_cache
+        if describe_cache is None:
+            return
+        request = active_pb2.DescribeRequest()
+        request.instance = i
+        self._context_manager._contextualize_request(request)
+        try:
+            response = await self._stub.Describe(request)
+        except grpc.RpcError:
+            return
+        cached = members_manager._response
+        if cached is not None and cached.SerializeToString(
+            deterministic=True
+        ) == response.SerializeToString(deterministic=True):
+            return
+        await asyncio.to_thread(describe_cache._mark_stale, c, response)
+        members_manager._load(response)
+
+
+class AxServeEventPartition:
+    def __init__(self, key: Hashable):
+        self._key = key
+        self._queue: deque[Callable[[], Awaitable[None]]] = deque()
+        self._task: Task | None = None
+        self._max_depth = 0
+        self._handled = 0
+        self._handler_time = 0.0
+
+    @property
+    def key(self) -> Hashable:
+        return self._key
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    @property
+    def handled(self) -> int:
+        return self._handled
+
+    @property
+    def handler_time(self) -> float:
+        return self._handler_time
+
+
+class AxServeEventDispatcher:
+    def __init__(
+        self,
+        max_in_flight: int | None = 100,
+        *,
+        ordered: bool = True,
+        key: Callable[[AxServeObject], Hashable] | None = None,
+        executor: Executor | None = None,
+    ):
+        if max_in_flight is not None and max_in_flight <= 0:
+            msg = f"Invalid max_in_flight: {max_in_flight}"
+            raise ValueError(msg)
+        self._semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self._ordered = ordered
+        self._key = key
+        self._executor = executor
+        self._partitions: dict[Hashable, AxServeEventPartition] = {}
+        self._tasks: set[Task] = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._handled = 0
+
+    @property
+    def partitions(self) -> dict[Hashable, AxServeEventPartition]:
+        return dict(self._partitions)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    @property
+    def handled(self) -> int:
+        return self._handled
+
+    def _get_key(self, instance: AxServeObject, instance_id: str) -> Hashable:
+        if self._key is None:
+            return instance_id
+        return self._key(instance)
+
+    async def _call_handler(self, handler: Callable, *args: Any) -> None:
+        if inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
+            type(handler).__call__
+        ):
+            await handler(*args)
+            return
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        res = await loop.run_in_executor(
+            self._executor, functools.partial(context.run, handler, *args)
+        )
+        if inspect.isawaitable(res):
+            await res
+
+    async def _dispatch(
+        self, key: Hashable, func: Callable[[], Awaitable[None]]
+    ) -> None:
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        self._in_flight += 1
+        self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        self._idle.clear()
+        if not self._ordered:
+            task = asyncio.create_task(self._run_one(func))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return
+        partition = self._partitions.get(key)
+        if partition is None:
+            partition = self._partitions[key] = AxServeEventPartition(key)
+        partition._queue.append(func)
+        partition._max_depth = max(partition._max_depth, len(partition._queue))
+        if partition._task is None:
+            partition._task = asyncio.create_task(self._run(partition))
+
+    async def _run_one(self, func: Callable[[], Awaitable[None]]) -> float:
+        start_time = time.perf_counter()
+        try:
+            await func()
+        except Exception:
+            logger.exception("Unhandled exception in axserve event handler")
+        finally:
+            self._handled += 1
+            self._in_flight -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+            if not self._in_flight:
+                self._idle.set()
+        return time.perf_counter() - start_time
+
+    async def _run(self, partition: AxServeEventPartition) -> None:
+        try:
+            while partition._queue:
+                func = partition._queue.popleft()
+                elapsed_time = await self._run_one(func)
+                partition._handled += 1
+                partition._handler_time += elapsed_time
+        finally:
+            partition._task = None
+
+    async def join(self) -> None:
+        await self._idle.wait()
+
 
 class AxServeEventLoop:
     def __init__(
@@ -244,10 +821,13 @@ class AxServeEventLoop:
         instances_manager: AxServeInstancesManager,
         event_context_manager: AxServeEventContextManager,
         event_stream_manager: AxServeEventStreamManager,
+        event_dispatcher: AxServeEventDispatcher | None = None,
     ):
         self._instances_manager = instances_manager
         self._event_context_manager = event_context_manager
         self._event_stream_manager = event_stream_manager
+        self._event_dispatcher = event_dispatcher
+        self._early_ack_dispatcher: AxServeEventDispatcher | None = None
 
         self._state_lock = Lock()
         self._is_exitting = False
@@ -266,45 +846,133 @@ class AxServeEventLoop:
                 self._is_exitting = False
                 self._is_running = False
 
-    @contextlib.asynccontextmanager
-    async def _create_handle_event_context(
+    async def _call_handler(self, handler: Callable, args: list[Any]) -> None:
+        if self._event_dispatcher is not None:
+            await self._event_dispatcher._call_handler(handler, *args)
+            return
+        res = handler(*args)
+        if inspect.isawaitable(res):
+            await res
+
+    async def _get_event_handlers(
         self, handle_event: active_pb2.HandleEventRequest
-    ):
-        event_context_stack = (
-            self._event_context_manager._get_handle_event_context_stack()
+    ) -> tuple[list[Callable], list[Any]]:
+        instance = self._instances_manager._get_instance(handle_event.instance)
+        if instance is None:
+            return [], []
+        ax = instance.__axserve__
+        if ax is None:
+            return [], []
+        mm = ax._members_manager
+        if mm is None:
+            return [], []
+        event_callback = mm._get_event(handle_event.index)
+        args = [ValueFromVariant(arg) for arg in handle_event.arguments]
+        return await event_callback._get_handlers(instance), args
+
+    async def _handle_event(
+        self, handle_event: active_pb2.HandleEventRequest
+    ) -> list[Callable]:
+        handlers, args = await self._get_event_handlers(handle_event)
+        early_ack_calls = []
+        for handler in handlers:
+            if isinstance(handler, AxServeEarlyAckHandler):
+                early_ack_calls.append(
+                    functools.partial(self._call_handler, handler, args)
+                )
+            else:
+                await self._call_handler(handler, args)
+        return early_ack_calls
+
+    async def _run_event_calls(self, calls: list[Callable]) -> None:
+        for call in calls:
+            await call()
+
+    async def _dispatch_early_ack_calls(self, early_ack_calls: list[Callable]) -> None:
+        if self._early_ack_dispatcher is None:
+            self._early_ack_dispatcher = AxServeEventDispatcher(None)
+        await self._early_ack_dispatcher._dispatch(
+            None, functools.partial(self._run_event_calls, early_ack_calls)
+        )
+
+    async def _ack_event(self, handle_event: active_pb2.HandleEventRequest) -> None:
+        response = active_pb2.HandleEventResponse(
+            id=handle_event.id,
+            instance=handle_event.instance,
+            index=handle_event.index,
         )
-        event_context_stack.append(handle_event)
+        await self._event_stream_manager._put_handle_event_response(response)
+
+    async def _handle_event_in_context(
+        self, handle_event: active_pb2.HandleEventRequest, *, ack: bool = True
+    ) -> None:
+        token = self._event_context_manager._push_handle_event(handle_event)
+        early_ack_calls = []
         try:
-            yield
+            early_ack_calls = await self._handle_event(handle_event)
+        finally:
+            self._event_context_manager._pop_handle_event(token)
+            if ack:
+                await self._ack_event(handle_event)
+        if early_ack_calls:
+            await self._dispatch_early_ack_calls(early_ack_calls)
+
+    async def _handle_event_frame(self, frame: active_pb2.HandleEventRequest) -> None:
+        acked_sequence = 0
+        try:
+            for handle_event in frame.events:
+                if await self._dispatch_event(handle_event):
+                    continue
+                if not handle_event.sequence:
+                    await self._handle_event_in_context(handle_event)
+                    continue
+                acked_sequence = handle_event.sequence
+                await self._handle_event_in_context(handle_event, ack=False)
         finally:
-            event_context_stack.pop()
-            response = active_pb2.HandleEventResponse()
-            response.id = handle_event.id
-            response.instance = handle_event.instance
-            response.index = handle_event.index
-            await self._event_stream_manager._put_handle_event_response(response)
+            if acked_sequence:
+                response = active_pb2.HandleEventResponse(acked_sequence=acked_sequence)
+                await self._event_stream_manager._put_handle_event_response(response)
+
+    async def _dispatch_event(
+        self, handle_event: active_pb2.HandleEventRequest
+    ) -> bool:
+        event_dispatcher = self._event_dispatcher
+        if event_dispatcher is None:
+            return False
+        instance = self._instances_manager._get_instance(handle_event.instance)
+        if instance is None:
+            return False
+        key = event_dispatcher._get_key(instance, handle_event.instance)
+        try:
+            handlers, args = await self._get_event_handlers(handle_event)
+            if handlers:
+                calls = [
+                    functools.partial(self._call_handler, handler, args)
+                    for handler in handlers
+                ]
+                await event_dispatcher._dispatch(
+                    key, functools.partial(self._run_event_calls, calls)
+                )
+        finally:
+            await self._ack_event(handle_event)
+        return True
 
     async def exec(self) -> int:
         async with self._create_exec_context():
             handle_events = self._event_stream_manager._get_handle_event_requests()
             try:
+                await self._event_stream_manager._request_batch_events()
                 async for handle_event in handle_events:
                     if handle_event.is_pong:
+                        if self._event_dispatcher is not None:
+                            await self._event_dispatcher.join()
+                        if self._early_ack_dispatcher is not None:
+                            await self._early_ack_dispatcher.join()
                         return self._return_code
-                    async with self._create_handle_event_context(handle_event):
-                        instance_id = handle_event.instance
-                        instance = self._instances_manager._get_instance(instance_id)
-                        if instance is None:
-                            continue
-                        ax = instance.__axserve__
-                        if ax is None:
-                            continue
-                        mm = ax._members_manager
-                        if mm is None:
-                            continue
-                        event_callback = mm._get_event(handle_event.index)
-                        args = [ValueFromVariant(arg) for arg in handle_event.arguments]
-                        await event_callback(instance, *args)
+                    if handle_event.events:
+                        await self._handle_event_frame(handle_event)
+                    elif not await self._dispatch_event(handle_event):
+                        await self._handle_event_in_context(handle_event)
             except grpc.RpcError as exc:
                 if not (
                     self._is_exitting
@@ -336,10 +1004,12 @@ class AxServeEventLoopManager:
         instances_manager: AxServeInstancesManager,
         event_context_manager: AxServeEventContextManager,
         event_stream_manager: AxServeEventStreamManager,
+        event_dispatcher: AxServeEventDispatcher | None = None,
     ):
         self._instances_manager = instances_manager
         self._event_context_manager = event_context_manager
         self._event_stream_manager = event_stream_manager
+        self._event_dispatcher = event_dispatcher
 
         self._event_loop: AxServeEventLoop | None = None
         self._event_loop_exec_task: Task | None = None
@@ -372,6 +1042,7 @@ class AxServeEventLoopManager:
                 self._instances_manager,
                 self._event_context_manager,
                 self._event_stream_manager,
+                self._event_dispatcher,
             )
         if not self._event_loop_exec_task:
             self._event_loop_exec_task = asyncio.create_task(
@@ -381,6 +1052,21 @@ class AxServeEventLoopManager:
     def is_running(self) -> bool:
         return self._event_loop.is_running() if self._event_loop else False
 
+    def _has_failed(self) -> bool:
+        task = self._event_loop_exec_task
+        return self._event_loop_exception is not None or (
+            task is not None and task.done()
+        )
+
+    async def _abort(self) -> None:
+        task = self._event_loop_exec_task
+        self._event_loop = None
+        self._event_loop_exec_task = None
+        if task is not None:
+            await asyncio.wait([task])
+            if not task.cancelled():
+                task.exception()
+
     async def stop(self) -> None:
         if self._event_loop:
             await self._event_loop.exit()
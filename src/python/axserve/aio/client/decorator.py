@@ -31,6 +31,7 @@ from axserve.aio.client.descriptor import AxServeProperty
 if TYPE_CHECKING:
     from collections.abc import Awaitable
     from collections.abc import Callable
+    from collections.abc import Iterable
 
 
 T = TypeVar("T")
@@ -42,9 +43,31 @@ def event(f: Callable[Concatenate[T, P], Awaitable[R]]):
     return AxServeEvent(f)
 
 
-def method(f: Callable[Concatenate[T, P], Awaitable[R]]):
-    return AxServeMethod(f)
+def method(
+    f: Callable[Concatenate[T, P], Awaitable[R]] | None = None,
+    *,
+    pure: bool = False,
+    cache_size: int | None = 128,
+    ttl: float | None = None,
+):
+    def decorate(f: Callable[Concatenate[T, P], Awaitable[R]]):
+        return AxServeMethod(f, cache=pure, cache_size=cache_size, ttl=ttl)
 
+    if f is None:
+        return decorate
+    return decorate(f)
 
-def property(f: Callable[Concatenate[T, P], Awaitable[R]]):  # noqa: A001
-    return AxServeProperty(f)
+
+def property(  # noqa: A001
+    f: Callable[Concatenate[T, P], Awaitable[R]] | None = None,
+    *,
+    cache: bool = False,
+    ttl: float | None = None,
+    invalidated_by: Iterable[str] = (),
+):
+    def decorate(f: Callable[Concatenate[T, P], Awaitable[R]]):
+        return AxServeProperty(f, cache=cache, ttl=ttl, invalidated_by=invalidated_by)
+
+    if f is None:
+        return decorate
+    return decorate(f)
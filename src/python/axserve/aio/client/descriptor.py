@@ -21,6 +21,7 @@ from __future__ import annotations
 import asyncio
 import functools
 import inspect
+import typing
 
 from asyncio import Task
 from typing import TYPE_CHECKING
@@ -34,6 +35,9 @@ from typing import overload
 from wrapt import ObjectProxy
 
 from axserve.aio.common.async_connectable import AsyncConnectable
+from axserve.aio.common.conflation import AxServeConflatedHandler
+from axserve.aio.common.event_handler import AxServeEarlyAckHandler
+from axserve.common.event_handler import AxServeEventHandlerWrapper
 from axserve.proto import active_pb2
 from axserve.proto.active_pb2_conversion import AnnotationFromTypeName
 from axserve.proto.active_pb2_conversion import ValueFromVariant
@@ -43,9 +47,14 @@ from axserve.proto.active_pb2_conversion import ValueToVariant
 if TYPE_CHECKING:
     from collections.abc import Awaitable
     from collections.abc import Callable
+    from collections.abc import Hashable
+    from collections.abc import Iterable
     from collections.abc import Sequence
 
+    from axserve.aio.client.stub import AxServeClient
     from axserve.aio.client.stub import AxServeObject
+    from axserve.common.method_cache import AxServeMethodCache
+    from axserve.common.property_cache import AxServePropertyCache
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -67,19 +76,51 @@ class AxServePropertyType(ObjectProxy, Generic[T]):
     def set(self, value: T) -> Awaitable[active_pb2.SetPropertyResponse]:
         return self._self_prop._set(self._self_instance, value)
 
+    def invalidate(self) -> None:
+        cache = self._self_prop._get_property_cache(self._self_instance)
+        if cache is not None and self._self_prop._name:
+            cache.invalidate(self._self_prop._name)
+
 
 class AxServeProperty(Generic[T]):
     @overload
-    def __init__(self) -> None: ...
+    def __init__(
+        self,
+        *,
+        cache: bool = ...,
+        ttl: float | None = ...,
+        invalidated_by: Iterable[str] = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: int) -> None: ...
+    def __init__(
+        self,
+        arg: int,
+        *,
+        cache: bool = ...,
+        ttl: float | None = ...,
+        invalidated_by: Iterable[str] = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: active_pb2.PropertyInfo) -> None: ...
+    def __init__(
+        self,
+        arg: active_pb2.PropertyInfo,
+        *,
+        cache: bool = ...,
+        ttl: float | None = ...,
+        invalidated_by: Iterable[str] = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: Callable[[Any], Awaitable[T]]) -> None: ...
+    def __init__(
+        self,
+        arg: Callable[[Any], Awaitable[T]],
+        *,
+        cache: bool = ...,
+        ttl: float | None = ...,
+        invalidated_by: Iterable[str] = ...,
+    ) -> None: ...
 
     def __init__(
         self,
@@ -87,10 +128,17 @@ class AxServeProperty(Generic[T]):
         | active_pb2.PropertyInfo
         | Callable[[Any], Awaitable[T]]
         | None = None,
+        *,
+        cache: bool = False,
+        ttl: float | None = None,
+        invalidated_by: Iterable[str] = (),
     ) -> None:
         self._index: int | None = None
         self._name: str | None = None
         self._info: active_pb2.PropertyInfo | None = None
+        self._cache = cache or ttl is not None or bool(invalidated_by)
+        self._ttl = ttl
+        self._invalidated_by = list(invalidated_by)
 
         if isinstance(arg, int):
             self._index = arg
@@ -141,11 +189,9 @@ class AxServeProperty(Generic[T]):
             raise ValueError(msg)
         return index
 
-    async def _get_value(
-        self,
-        instance: AxServeObject,
-        owner: type | None = None,  # noqa: ARG002
-    ) -> T:
+    def _make_get_request(
+        self, instance: AxServeObject
+    ) -> tuple[AxServeClient, active_pb2.GetPropertyRequest]:
         ax = instance.__axserve__
         if ax is None:
             msg = "Internal values are not initialized"
@@ -166,10 +212,64 @@ class AxServeProperty(Generic[T]):
         request = active_pb2.GetPropertyRequest()
         request.instance = instance_id
         request.index = index
+        return client, request
+
+    def _get_property_cache(
+        self, instance: AxServeObject
+    ) -> AxServePropertyCache | None:
+        if not self._cache:
+            return None
+        ax = instance.__axserve__
+        if ax is None:
+            return None
+        return ax._property_cache
+
+    async def _connect_invalidating_events(
+        self, instance: AxServeObject, cache: AxServePropertyCache, name: str
+    ) -> None:
+        for event in self._invalidated_by:
+            if not cache._register_invalidation(event, name):
+                continue
+            try:
+                await getattr(instance, event).connect(
+                    functools.partial(cache._invalidate_by_event, event)
+                )
+            except BaseException:
+                cache._unregister_invalidation(event, name)
+                raise
+
+    async def _get_remote_value(
+        self, client: AxServeClient, request: active_pb2.GetPropertyRequest
+    ) -> T:
         client._event_context_manager._contextualize_request(request)
-        response = await client._stub.GetProperty(request)
+        future = await client._stream_call(request)
+        if future is not None:
+            return await client._wait_call(future)
+        response = await client._call_unary(client._stub.GetProperty, request)
         return ValueFromVariant(response.value)
 
+    async def _get_value(
+        self,
+        instance: AxServeObject,
+        owner: type | None = None,  # noqa: ARG002
+    ) -> T:
+        client, request = self._make_get_request(instance)
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            return batch._add_request(request)  # type: ignore
+        cache = self._get_property_cache(instance)
+        if cache is None or not self._name:
+            return await self._get_remote_value(client, request)
+        name = self._name
+        found, value = cache._lookup(name)
+        if found:
+            return value
+        await self._connect_invalidating_events(instance, cache, name)
+        generation = cache._get_generation(name)
+        value = await self._get_remote_value(client, request)
+        cache._store(name, value, self._ttl, generation)
+        return value
+
     async def _get(
         self,
         instance: AxServeObject | None = None,
@@ -205,9 +305,27 @@ class AxServeProperty(Generic[T]):
         request.instance = instance_id
         request.index = index
         ValueToVariant(value, request.value)
+        cache = self._get_property_cache(instance)
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            future = batch._add_request(request)
+            if cache is not None and self._name:
+                future.add_done_callback(functools.partial(self._invalidate, cache))
+            return future  # type: ignore
         client._event_context_manager._contextualize_request(request)
-        response = await client._stub.SetProperty(request)
-        return response
+        try:
+            future = await client._stream_call(request)
+            if future is not None:
+                return await client._wait_call(future)
+            response = await client._call_unary(client._stub.SetProperty, request)
+            return response
+        finally:
+            if cache is not None and self._name:
+                cache.invalidate(self._name)
+
+    def _invalidate(self, cache: AxServePropertyCache, *args) -> None:  # noqa: ARG002
+        if self._name:
+            cache.invalidate(self._name)
 
     def __call__(self, instance: AxServeObject) -> Awaitable[T]:
         return self._get_value(instance)
@@ -249,19 +367,51 @@ class AxServeMethodType(ObjectProxy, Generic[P, R]):
     def call(self, *args: P.args, **kwargs: P.kwargs) -> Awaitable[R]:
         return self.__call__(*args, **kwargs)
 
+    def cache_clear(self) -> None:
+        ax = self._self_instance.__axserve__
+        if ax is not None and ax._method_cache is not None and self._self_func._name:
+            ax._method_cache.clear(self._self_func._name)
+
 
 class AxServeMethod(Generic[P, R]):
     @overload
-    def __init__(self) -> None: ...
+    def __init__(
+        self,
+        *,
+        cache: bool = ...,
+        cache_size: int | None = ...,
+        ttl: float | None = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: int) -> None: ...
+    def __init__(
+        self,
+        arg: int,
+        *,
+        cache: bool = ...,
+        cache_size: int | None = ...,
+        ttl: float | None = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: active_pb2.MethodInfo) -> None: ...
+    def __init__(
+        self,
+        arg: active_pb2.MethodInfo,
+        *,
+        cache: bool = ...,
+        cache_size: int | None = ...,
+        ttl: float | None = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: Callable[Concatenate[Any, P], Awaitable[R]]) -> None: ...
+    def __init__(
+        self,
+        arg: Callable[Concatenate[Any, P], Awaitable[R]],
+        *,
+        cache: bool = ...,
+        cache_size: int | None = ...,
+        ttl: float | None = ...,
+    ) -> None: ...
 
     def __init__(
         self,
@@ -269,11 +419,19 @@ class AxServeMethod(Generic[P, R]):
         | active_pb2.MethodInfo
         | Callable[Concatenate[Any, P], Awaitable[R]]
         | None = None,
+        *,
+        cache: bool = False,
+        cache_size: int | None = 128,
+        ttl: float | None = None,
     ) -> None:
         self._index: int | None = None
         self._name: str | None = None
         self._signature: inspect.Signature | None = None
+        self._arity: int | None = None
         self._info: active_pb2.MethodInfo | None = None
+        self._cache = cache or ttl is not None
+        self._cache_size = cache_size
+        self._ttl = ttl
 
         if isinstance(arg, int):
             self._index = arg
@@ -282,7 +440,7 @@ class AxServeMethod(Generic[P, R]):
         elif callable(arg):
             functools.update_wrapper(self, arg)
             self._name = arg.__name__
-            self._signature = inspect.signature(functools.partial(arg, None))
+            self._set_signature(inspect.signature(functools.partial(arg, None)))
         elif arg is not None:
             msg = f"Invalid argument: {arg!r}"
             raise ValueError(msg)
@@ -293,7 +451,7 @@ class AxServeMethod(Generic[P, R]):
     def _set_info(self, info: active_pb2.MethodInfo) -> None:
         self._index = info.index
         self._name = info.name
-        self._signature = inspect.Signature(
+        signature = inspect.Signature(
             parameters=[
                 inspect.Parameter(
                     name=arg.name,
@@ -304,8 +462,21 @@ class AxServeMethod(Generic[P, R]):
             ],
             return_annotation=AnnotationFromTypeName(info.return_type),
         )
+        self._set_signature(signature)
         self._info = info
 
+    def _set_signature(self, signature: inspect.Signature) -> None:
+        self._signature = signature
+        self._arity = len(signature.parameters)
+        positional_kinds = {
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        }
+        for param in signature.parameters.values():
+            if param.kind not in positional_kinds:
+                self._arity = None
+                break
+
     def _get_index(self, instance: AxServeObject) -> int:
         index = self._index
         if index is not None:
@@ -339,13 +510,53 @@ class AxServeMethod(Generic[P, R]):
     def _bind_args(self, *args, **kwargs) -> Sequence[Any]:
         if not self._signature:
             return args
+        if not kwargs and len(args) == self._arity:
+            return args
         bound_args = self._signature.bind(*args, **kwargs)
         bound_args.apply_defaults()
         return bound_args.args
 
+    def _get_method_cache(self, instance: AxServeObject) -> AxServeMethodCache | None:
+        if not (self._cache and self._name):
+            return None
+        ax = instance.__axserve__
+        if ax is None:
+            return None
+        client = ax._client
+        if (
+            client is not None
+            and client._batch_manager._get_current_batch() is not None
+        ):
+            return None
+        return ax._method_cache
+
+    @classmethod
+    def _make_cache_key(cls, bound_args: Sequence[Any]) -> Any:
+        key = tuple((type(arg), arg) for arg in bound_args)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     async def _call(
         self, instance: AxServeObject, *args: P.args, **kwargs: P.kwargs
     ) -> R:
+        bound_args = self._bind_args(*args, **kwargs)
+        cache = self._get_method_cache(instance)
+        key = self._make_cache_key(bound_args) if cache is not None else None
+        if cache is None or key is None:
+            return await self._invoke(instance, bound_args)
+        name = typing.cast(str, self._name)
+        found, value = cache._lookup(name, key)
+        if found:
+            return value
+        generation = cache._get_generation(name)
+        value = await self._invoke(instance, bound_args)
+        cache._store(name, key, value, self._cache_size, self._ttl, generation)
+        return value
+
+    async def _invoke(self, instance: AxServeObject, bound_args: Sequence[Any]) -> R:
         ax = instance.__axserve__
         if ax is None:
             msg = "Internal values are not initialized"
@@ -359,11 +570,16 @@ class AxServeMethod(Generic[P, R]):
         request = active_pb2.InvokeMethodRequest()
         request.instance = instance_id
         request.index = index
-        bound_args = self._bind_args(*args, **kwargs)
         for arg in bound_args:
             ValueToVariant(arg, request.arguments.add())
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            return batch._add_request(request)  # type: ignore
         client._event_context_manager._contextualize_request(request)
-        response = await client._stub.InvokeMethod(request)
+        future = await client._stream_call(request)
+        if future is not None:
+            return await client._wait_call(future)
+        response = await client._call_unary(client._stub.InvokeMethod, request)
         return ValueFromVariant(response.return_value)
 
     def __call__(
@@ -389,6 +605,66 @@ class AxServeMethod(Generic[P, R]):
         return AxServeMethodType(self, instance)
 
 
+class AxServePreparedMethod(Generic[P, R]):
+    def __init__(
+        self,
+        method: AxServeMethod[P, R],
+        instance: AxServeObject,
+        *,
+        validate: bool = True,
+    ) -> None:
+        ax = instance.__axserve__
+        if ax is None:
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        client = ax._client
+        instance_id = ax._instance
+        if not (client and instance_id):
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        self._method = method
+        self._client = client
+        self._internals = ax
+        self._validate = validate and method._signature is not None
+        self._template = active_pb2.InvokeMethodRequest()
+        self._template.index = method._get_index(instance)
+
+    def _make_request(self, args, kwargs) -> active_pb2.InvokeMethodRequest:
+        if self._validate:
+            args = self._method._bind_args(*args, **kwargs)
+        elif kwargs:
+            msg = "Keyword arguments require signature validation"
+            raise TypeError(msg)
+        # requests are serialized lazily by grpc.aio, so each call gets its own copy
+        instance_id = self._internals._instance
+        if instance_id is None:
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        request = active_pb2.InvokeMethodRequest()
+        request.CopyFrom(self._template)
+        request.instance = instance_id
+        arguments = request.arguments
+        for arg in args:
+            ValueToVariant(arg, arguments.add())
+        self._client._event_context_manager._contextualize_request(request)
+        return request
+
+    async def _call(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        client = self._client
+        request = self._make_request(args, kwargs)
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            return batch._add_request(request)  # type: ignore
+        future = await client._stream_call(request)
+        if future is not None:
+            return await client._wait_call(future)
+        response = await client._call_unary(client._stub.InvokeMethod, request)
+        return ValueFromVariant(response.return_value)
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Awaitable[R]:
+        return self._call(*args, **kwargs)
+
+
 class AxServeEventType(
     ObjectProxy,
     AsyncConnectable[
@@ -410,8 +686,17 @@ class AxServeEventType(
         return self.__call__(*args, **kwargs)
 
     async def connect(
-        self, handler: Callable[P, Any]
+        self,
+        handler: Callable[P, Any],
+        *,
+        conflate: Callable[P, Hashable] | None = None,
+        max_rate: float | None = None,
+        early_ack: bool = False,
     ) -> active_pb2.ConnectEventResponse | None:
+        if conflate is not None or max_rate is not None:
+            handler = AxServeConflatedHandler(handler, conflate, max_rate)
+        elif early_ack:
+            handler = AxServeEarlyAckHandler(handler)
         response = None
         instance = self._self_instance
         ax = instance.__axserve__
@@ -433,7 +718,8 @@ class AxServeEventType(
                 request.instance = instance_id
                 request.index = index
                 client._event_context_manager._contextualize_request(request)
-                response = await client._stub.ConnectEvent(request)
+                timeout = client._call_options_manager._get_timeout()
+                response = await client._stub.ConnectEvent(request, timeout=timeout)
                 if not response.successful:
                     msg = "Failed to connect event"
                     raise RuntimeError(msg)
@@ -459,18 +745,36 @@ class AxServeEventType(
         handlers = handlers_manager._get_event_handlers(index)
         handlers_lock = handlers_manager._get_event_handlers_lock(index)
         async with handlers_lock:
-            handlers.remove(handler)
+            removed = handlers.pop(handlers.index(handler))
+            if isinstance(removed, AxServeEventHandlerWrapper):
+                removed.close()
             if not handlers:
                 request = active_pb2.DisconnectEventRequest()
                 request.instance = instance_id
                 request.index = index
                 client._event_context_manager._contextualize_request(request)
-                response = await client._stub.DisconnectEvent(request)
+                timeout = client._call_options_manager._get_timeout()
+                response = await client._stub.DisconnectEvent(request, timeout=timeout)
                 if not response.successful:
                     msg = "Failed to disconnect event"
                     raise RuntimeError(msg)
         return response
 
+    def get_conflated_handler(
+        self, handler: Callable[P, Any]
+    ) -> AxServeConflatedHandler[P] | None:
+        instance = self._self_instance
+        ax = instance.__axserve__
+        handlers_manager = ax._event_handlers_manager if ax else None
+        if not handlers_manager:
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        index = self._self_func._get_index(instance)
+        for item in list(handlers_manager._get_event_handlers(index)):
+            if isinstance(item, AxServeConflatedHandler) and item == handler:
+                return item
+        return None
+
 
 class AxServeEvent(Generic[P]):
     @overload
@@ -557,9 +861,7 @@ class AxServeEvent(Generic[P]):
             raise ValueError(msg)
         return index
 
-    async def _call(
-        self, instance: AxServeObject, *args: P.args, **kwargs: P.kwargs
-    ) -> None:
+    async def _get_handlers(self, instance: AxServeObject) -> list[Callable]:
         ax = instance.__axserve__
         if ax is None:
             msg = "Internal values are not initialized"
@@ -572,8 +874,12 @@ class AxServeEvent(Generic[P]):
         handlers = handlers_manager._get_event_handlers(index)
         handlers_lock = handlers_manager._get_event_handlers_lock(index)
         async with handlers_lock:
-            handlers = list(handlers)
-        for handler in handlers:
+            return list(handlers)
+
+    async def _call(
+        self, instance: AxServeObject, *args: P.args, **kwargs: P.kwargs
+    ) -> None:
+        for handler in await self._get_handlers(instance):
             res = handler(*args, **kwargs)
             if inspect.isawaitable(res):
                 await res
@@ -648,9 +954,16 @@ class AxServeMemberType(
         return await self.__call__(*args, **kwargs)
 
     async def connect(
-        self, handler: Callable[Q, Any]
+        self,
+        handler: Callable[Q, Any],
+        *,
+        conflate: Callable[Q, Hashable] | None = None,
+        max_rate: float | None = None,
+        early_ack: bool = False,
     ) -> active_pb2.ConnectEventResponse | None:
-        return await self.event.connect(handler)
+        return await self.event.connect(
+            handler, conflate=conflate, max_rate=max_rate, early_ack=early_ack
+        )
 
     async def disconnect(
         self, handler: Callable[Q, Any]
@@ -0,0 +1,354 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import os
+import time
+
+from collections import deque
+from typing import TYPE_CHECKING
+from typing import Any
+
+from axserve.aio.client.stub import AxServeClient
+from axserve.aio.client.stub import AxServeObject
+from axserve.aio.common.async_initializable import AsyncInitializable
+from axserve.client.pool import POOL_POLICIES
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+
+logger = logging.getLogger(__name__)
+
+
+async def _call_hook(hook: Callable[[AxServeObject], Any], o: AxServeObject) -> Any:
+    result = hook(o)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+class AxServeServerPool(AsyncInitializable["AxServeServerPool"]):
+    _size: int
+    _machine: str | None
+    _transport: str
+    _clients: list[AxServeClient]
+    _managed_clients: list[AxServeClient]
+    _policy: str
+    _alpha: float
+    _pending: list[int]
+    _latencies: list[float]
+
+    def __init__(
+        self,
+        size: int | None = None,
+        *,
+        machine: str | None = None,
+        transport: str = "tcp",
+        policy: str = "least_loaded",
+        alpha: float = 0.2,
+        clients: Iterable[AxServeClient] | None = None,
+    ) -> None:
+        if policy not in POOL_POLICIES:
+            msg = f"Unknown pool policy: {policy}"
+            raise ValueError(msg)
+        if not size:
+            size = os.cpu_count() or 1
+        self._size = size
+        self._machine = machine
+        self._transport = transport
+        self._clients = list(clients) if clients is not None else []
+        self._managed_clients = []
+        self._policy = policy
+        self._alpha = alpha
+        self._pending = []
+        self._latencies = []
+
+    async def __ainit__(self) -> None:
+        if not self._clients:
+            try:
+                for _ in range(self._size):
+                    client = await AxServeClient._spawn(self._machine, self._transport)
+                    self._managed_clients.append(client)
+            except BaseException:
+                await self.close()
+                raise
+            self._clients = list(self._managed_clients)
+        self._pending = [0] * len(self._clients)
+        self._latencies = [0.0] * len(self._clients)
+
+    @property
+    def clients(self) -> list[AxServeClient]:
+        return list(self._clients)
+
+    @property
+    def latencies(self) -> list[float]:
+        return list(self._latencies)
+
+    def _get_load(self, index: int) -> int:
+        client = self._clients[index]
+        return client._instances_manager._count_instances() + self._pending[index]
+
+    def _get_score(self, index: int) -> tuple[float, int]:
+        load = self._get_load(index)
+        if self._policy == "ewma":
+            return ((load + 1) * self._latencies[index], load)
+        return (load, load)
+
+    def _select_index(self) -> int:
+        if not self._clients:
+            msg = "Server pool is not initialized"
+            raise ValueError(msg)
+        return min(range(len(self._clients)), key=self._get_score)
+
+    def _update_latency(self, index: int, latency: float) -> None:
+        if self._latencies[index]:
+            latency = self._alpha * latency + (1 - self._alpha) * self._latencies[index]
+        self._latencies[index] = latency
+
+    def observe(self, client: AxServeClient, latency: float) -> None:
+        self._update_latency(self._clients.index(client), latency)
+
+    def select(self) -> AxServeClient:
+        return self._clients[self._select_index()]
+
+    async def create(self, c: str | type[AxServeObject]) -> AxServeObject:
+        index = self._select_index()
+        client = self._clients[index]
+        self._pending[index] += 1
+        start_time = time.perf_counter()
+        try:
+            if isinstance(c, type):
+                return await c(client=client)
+            return await AxServeObject(c, client=client)
+        finally:
+            self._pending[index] -= 1
+            self._update_latency(index, time.perf_counter() - start_time)
+
+    async def close(self, timeout: float | None = None) -> None:
+        for client in self._managed_clients:
+            await client.close(timeout)
+        self._managed_clients.clear()
+
+    async def __afinalize__(self) -> None:
+        await self.close()
+
+
+class AxServeObjectPool(AsyncInitializable["AxServeObjectPool"]):
+    _c: str | type[AxServeObject]
+    _client: AxServeClient | AxServeServerPool | None
+    _min_size: int
+    _max_size: int | None
+    _init: Callable[[AxServeObject], Any] | None
+    _reset: Callable[[AxServeObject], Any] | None
+    _check: Callable[[AxServeObject], Any] | None
+    _idle_timeout: float | None
+
+    _idle: deque[tuple[AxServeObject, float]]
+    _size: int
+    _closed: bool
+    _condition: asyncio.Condition
+
+    def __init__(
+        self,
+        c: str | type[AxServeObject],
+        min_size: int = 0,
+        max_size: int | None = None,
+        *,
+        client: AxServeClient | AxServeServerPool | None = None,
+        init: Callable[[AxServeObject], Any] | None = None,
+        reset: Callable[[AxServeObject], Any] | None = None,
+        check: Callable[[AxServeObject], Any] | None = None,
+        idle_timeout: float | None = None,
+    ) -> None:
+        if max_size is not None and max_size < max(min_size, 1):
+            msg = f"Invalid pool sizes: min_size={min_size}, max_size={max_size}"
+            raise ValueError(msg)
+        self._c = c
+        self._client = client
+        self._min_size = min_size
+        self._max_size = max_size
+        self._init = init
+        self._reset = reset
+        self._check = check
+        self._idle_timeout = idle_timeout
+        self._idle = deque()
+        self._size = 0
+        self._closed = False
+        self._condition = asyncio.Condition()
+
+    async def __ainit__(self) -> None:
+        try:
+            for _ in range(self._min_size - self._size):
+                self._size += 1
+                o = await self._create()
+                self._idle.append((o, time.monotonic()))
+        except BaseException:
+            await self.close()
+            raise
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle_size(self) -> int:
+        return len(self._idle)
+
+    async def _notify(self) -> None:
+        async with self._condition:
+            self._condition.notify()
+
+    async def _create(self) -> AxServeObject:
+        try:
+            if isinstance(self._client, AxServeServerPool):
+                o = await self._client.create(self._c)
+            elif isinstance(self._c, type):
+                o = await self._c(client=self._client)
+            else:
+                o = await AxServeObject(self._c, client=self._client)
+            if self._init:
+                try:
+                    await _call_hook(self._init, o)
+                except BaseException:
+                    await o.__afinalize__()
+                    raise
+        except BaseException:
+            self._size -= 1
+            await self._notify()
+            raise
+        return o
+
+    async def _destroy(self, o: AxServeObject) -> None:
+        self._size -= 1
+        await self._notify()
+        try:
+            await o.__afinalize__()
+        except Exception:
+            logger.exception("Failed to destroy a pooled axserve object")
+
+    async def _is_healthy(self, o: AxServeObject) -> bool:
+        ax = o.__axserve__
+        if not (
+            ax
+            and (client := ax._client)
+            and (instance := ax._instance)
+            and client._instances_manager._has_instance(instance)
+        ):
+            return False
+        if self._check is None:
+            return True
+        try:
+            return bool(await _call_hook(self._check, o))
+        except Exception:
+            logger.exception("Health check of a pooled axserve object failed")
+            return False
+
+    def _pop_expired(self) -> list[AxServeObject]:
+        expired = []
+        if self._idle_timeout is None:
+            return expired
+        deadline = time.monotonic() - self._idle_timeout
+        while (
+            self._idle
+            and self._idle[0][1] <= deadline
+            and self._size - len(expired) > self._min_size
+        ):
+            expired.append(self._idle.popleft()[0])
+        return expired
+
+    async def evict_idle(self) -> int:
+        expired = self._pop_expired()
+        for o in expired:
+            await self._destroy(o)
+        return len(expired)
+
+    async def _acquire(self) -> AxServeObject:
+        while True:
+            if self._closed:
+                msg = "Object pool is closed"
+                raise RuntimeError(msg)
+            await self.evict_idle()
+            if self._idle:
+                o = self._idle.pop()[0]
+                if await self._is_healthy(o):
+                    return o
+                await self._destroy(o)
+            elif self._max_size is None or self._size < self._max_size:
+                self._size += 1
+                return await self._create()
+            else:
+                async with self._condition:
+                    await self._condition.wait_for(self._can_acquire)
+
+    def _can_acquire(self) -> bool:
+        return (
+            self._closed
+            or bool(self._idle)
+            or self._max_size is None
+            or self._size < self._max_size
+        )
+
+    async def acquire(self, timeout: float | None = None) -> AxServeObject:
+        async with asyncio.timeout(timeout):
+            return await self._acquire()
+
+    async def release(self, o: AxServeObject) -> None:
+        if self._reset:
+            try:
+                await _call_hook(self._reset, o)
+            except Exception:
+                logger.exception("Failed to reset a pooled axserve object")
+                await self._destroy(o)
+                return
+        if self._closed:
+            await self._destroy(o)
+            return
+        self._idle.append((o, time.monotonic()))
+        await self._notify()
+
+    async def discard(self, o: AxServeObject) -> None:
+        await self._destroy(o)
+
+    @contextlib.asynccontextmanager
+    async def lease(self, timeout: float | None = None) -> AsyncIterator[AxServeObject]:
+        o = await self.acquire(timeout)
+        try:
+            yield o
+        finally:
+            await self.release(o)
+
+    async def close(self) -> None:
+        self._closed = True
+        idle = [o for o, _ in self._idle]
+        self._idle.clear()
+        async with self._condition:
+            self._condition.notify_all()
+        for o in idle:
+            await self._destroy(o)
+
+    async def __afinalize__(self) -> None:
+        await self.close()
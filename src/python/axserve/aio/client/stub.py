@@ -19,33 +19,59 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import platform
 
 from asyncio import Lock
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import ClassVar
+from typing import TypeVar
 
 import grpc
 
+from axserve.aio.client.component import AxServeBatch
+from axserve.aio.client.component import AxServeBatchManager
+from axserve.aio.client.component import AxServeCallOptions
+from axserve.aio.client.component import AxServeCallOptionsManager
+from axserve.aio.client.component import AxServeCallStreamManager
+from axserve.aio.client.component import AxServeDestroyQueue
 from axserve.aio.client.component import AxServeEventContextManager
+from axserve.aio.client.component import AxServeEventDispatcher
 from axserve.aio.client.component import AxServeEventHandlersManager
 from axserve.aio.client.component import AxServeEventLoopManager
 from axserve.aio.client.component import AxServeEventStreamManager
 from axserve.aio.client.component import AxServeInstancesManager
 from axserve.aio.client.component import AxServeMembersManager
 from axserve.aio.client.component import AxServeMembersManagerCache
+from axserve.aio.client.descriptor import AxServeEventType
 from axserve.aio.client.descriptor import AxServeMemberType
+from axserve.aio.client.descriptor import AxServeMethod
+from axserve.aio.client.descriptor import AxServePreparedMethod
+from axserve.aio.client.descriptor import AxServeProperty
+from axserve.aio.client.supervisor import AxServeSupervisor
 from axserve.aio.common.async_initializable import AsyncInitializable
 from axserve.aio.server.process import AxServeServerProcess
+from axserve.common.call import AxServeCallError
+from axserve.common.call import add_batch_request_item
+from axserve.common.call import get_response_item_result_or_error
+from axserve.common.describe_cache import AxServeDescribeCache
+from axserve.common.describe_cache import get_describe_cache
 from axserve.common.local import LoopLocal
+from axserve.common.method_cache import AxServeMethodCache
+from axserve.common.property_cache import AxServePropertyCache
 from axserve.common.registry import check_machine_for_clsid
-from axserve.common.socket import find_free_port
+from axserve.common.socket import make_local_address
 from axserve.proto import active_pb2
+from axserve.proto.active_pb2_conversion import ValueFromVariant
 from axserve.proto.active_pb2_grpc import ActiveStub
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
     from collections.abc import Iterable
+    from collections.abc import Mapping
     from collections.abc import MutableMapping
 
     from grpc.aio import Channel
@@ -53,12 +79,18 @@ if TYPE_CHECKING:
     from axserve.proto.active_pb2_grpc import ActiveAsyncStub
 
 
+T = TypeVar("T")
+
+
 class AxServeObjectInternals:
     _clsid: str | None = None
     _client: AxServeClient | None = None
     _instance: str | None = None
     _members_manager: AxServeMembersManager | None = None
     _event_handlers_manager: AxServeEventHandlersManager | None = None
+    _property_cache: AxServePropertyCache | None = None
+    _method_cache: AxServeMethodCache | None = None
+    _initial_properties: dict[str, Any]
 
     def __init__(
         self,
@@ -68,6 +100,7 @@ class AxServeObjectInternals:
     ) -> None:
         self._clsid = c
         self._client = client
+        self._initial_properties = {}
 
     @property
     def clsid(self) -> str:
@@ -104,30 +137,39 @@ class AxServeObjectInternals:
             raise ValueError(msg)
         return self._event_handlers_manager
 
+    @property
+    def property_cache(self) -> AxServePropertyCache:
+        if self._property_cache is None:
+            msg = "Property cache is not set"
+            raise ValueError(msg)
+        return self._property_cache
+
+    @property
+    def method_cache(self) -> AxServeMethodCache:
+        if self._method_cache is None:
+            msg = "Method cache is not set"
+            raise ValueError(msg)
+        return self._method_cache
+
 
 class AxServeClientStore(LoopLocal):
-    _clients: MutableMapping[str, AxServeClient]
+    _clients: MutableMapping[tuple[str, str], AxServeClient]
     _clients_lock: Lock
 
     def __init__(self):
         self._clients = {}
         self._clients_lock = Lock()
 
-    async def instance(self, machine: str | None = None):
+    async def instance(self, machine: str | None = None, transport: str = "tcp"):
         if not machine:
             machine = platform.machine()
-        if machine not in self._clients:
+        key = (machine, transport)
+        if key not in self._clients:
             async with self._clients_lock:
-                if machine not in self._clients:
-                    port = find_free_port()
-                    address = f"localhost:{port}"
-                    process = await AxServeServerProcess(address, machine=machine)
-                    channel = grpc.aio.insecure_channel(address)
-                    instance = await AxServeClient(channel)
-                    instance._managed_channel = channel
-                    instance._managed_process = process
-                    self._clients[machine] = instance
-        instance = self._clients[machine]
+                if key not in self._clients:
+                    instance = await AxServeClient._spawn(machine, transport)
+                    self._clients[key] = instance
+        instance = self._clients[key]
         return instance
 
 
@@ -141,35 +183,82 @@ class AxServeClient(AsyncInitializable["AxServeClient"]):
 
     _instances_manager: AxServeInstancesManager
     _event_context_manager: AxServeEventContextManager
+    _batch_manager: AxServeBatchManager
+    _call_options_manager: AxServeCallOptionsManager
     _members_managers: AxServeMembersManagerCache
     _event_stream_manager: AxServeEventStreamManager | None = None
     _event_loop_manager: AxServeEventLoopManager | None = None
+    _call_stream_manager: AxServeCallStreamManager | None = None
+    _destroy_queue: AxServeDestroyQueue | None = None
 
     _managed_channel: Channel | None = None
     _managed_process: AxServeServerProcess | None = None
+    _managed_spawn_args: tuple[str | None, str] | None = None
+    _supervisor: AxServeSupervisor | None = None
 
     @classmethod
-    async def instance(cls, machine: str | None = None):
-        return await cls._instances_store.instance(machine)
+    async def instance(cls, machine: str | None = None, transport: str = "tcp"):
+        return await cls._instances_store.instance(machine, transport)
+
+    @classmethod
+    async def _spawn(cls, machine: str | None = None, transport: str = "tcp"):
+        process, channel = await cls._spawn_process(machine, transport)
+        try:
+            client = await cls(channel)
+        except BaseException:
+            await channel.close()
+            with contextlib.suppress(ProcessLookupError):
+                process.terminate()
+            await process.wait()
+            raise
+        client._managed_channel = channel
+        client._managed_process = process
+        client._managed_spawn_args = (machine, transport)
+        return client
+
+    @staticmethod
+    async def _spawn_process(
+        machine: str | None = None, transport: str = "tcp"
+    ) -> tuple[AxServeServerProcess, Channel]:
+        address = make_local_address(transport)
+        process = await AxServeServerProcess(address, machine=machine)
+        channel = grpc.aio.insecure_channel(process.address)
+        return process, channel
 
     def __init__(
         self,
         channel: Channel,
         timeout: float | None = None,
+        *,
+        call_stream: bool = False,
+        call_timeout: float | None = None,
+        describe_cache: AxServeDescribeCache | None = None,
+        deferred_destroy: bool = False,
+        event_dispatcher: AxServeEventDispatcher | None = None,
+        batch_events: bool = False,
     ) -> None:
         if not timeout:
             timeout = 15
+        if describe_cache is None:
+            describe_cache = get_describe_cache()
 
         self._channel = channel
         self._timeout = timeout
+        self._call_stream = call_stream
+        self._deferred_destroy = deferred_destroy
+        self._event_dispatcher = event_dispatcher
+        self._batch_events = batch_events
 
         self._stub = ActiveStub(self._channel)  # type:ignore
 
         self._instances_manager = AxServeInstancesManager()
         self._event_context_manager = AxServeEventContextManager()
+        self._batch_manager = AxServeBatchManager()
+        self._call_options_manager = AxServeCallOptionsManager(call_timeout)
         self._members_managers = AxServeMembersManagerCache(
             self._stub,
             self._event_context_manager,
+            describe_cache,
         )
 
     async def __ainit__(self) -> None:
@@ -177,17 +266,26 @@ class AxServeClient(AsyncInitializable["AxServeClient"]):
             await self._channel.channel_ready()
 
         if not self._event_stream_manager:
-            self._event_stream_manager = AxServeEventStreamManager(self._stub)
+            self._event_stream_manager = AxServeEventStreamManager(
+                self._stub, batch_events=self._batch_events
+            )
         if not self._event_loop_manager:
             self._event_loop_manager = AxServeEventLoopManager(
                 self._instances_manager,
                 self._event_context_manager,
                 self._event_stream_manager,
+                self._event_dispatcher,
             )
 
         if not self._event_loop_manager.is_running():
             self._event_loop_manager.start()
 
+        if self._call_stream and not self._call_stream_manager:
+            self._call_stream_manager = AxServeCallStreamManager(self._stub)
+
+        if self._deferred_destroy and not self._destroy_queue:
+            self._destroy_queue = AxServeDestroyQueue(self._destroy_instances)
+
     async def _create_instance(self, c: str) -> str:
         request = active_pb2.CreateRequest()
         request.clsid = c
@@ -201,12 +299,86 @@ class AxServeClient(AsyncInitializable["AxServeClient"]):
         response = await self._stub.Destroy(request)
         return response.successful
 
+    async def _destroy_instances(self, instances: list[str]) -> list[Any]:
+        requests = []
+        for i in instances:
+            request = active_pb2.DestroyRequest()
+            request.instance = i
+            requests.append(request)
+        return [
+            result if isinstance(result, AxServeCallError) else result.successful
+            for result in await self._execute_batch_items(requests)
+        ]
+
+    async def _schedule_destroy_instance(self, i: str) -> None:
+        if self._destroy_queue is not None and self._destroy_queue._put(i):
+            return
+        await self._destroy_instance(i)
+
+    async def flush(self) -> None:
+        if self._destroy_queue is not None:
+            await self._destroy_queue._flush()
+
+    async def _get_properties(self, i: str, indexes: Iterable[int]) -> list[Any]:
+        request = active_pb2.GetPropertiesRequest()
+        request.instance = i
+        request.indexes.extend(indexes)
+        self._event_context_manager._contextualize_request(request)
+        response = await self._call_unary(self._stub.GetProperties, request)
+        return [ValueFromVariant(value) for value in response.values]
+
+    def _get_call_stream_manager(self) -> AxServeCallStreamManager | None:
+        call_stream_manager = self._call_stream_manager
+        if (
+            call_stream_manager is None
+            or not call_stream_manager._is_call_stream_available()
+            or self._call_options_manager._get_key() is not None
+            or self._call_options_manager._get_timeout() is not None
+        ):
+            return None
+        return call_stream_manager
+
+    async def _stream_call(self, request: Any) -> asyncio.Future | None:
+        call_stream_manager = self._get_call_stream_manager()
+        if call_stream_manager is None:
+            return None
+        return await call_stream_manager._call(request)
+
+    async def _wait_call(self, future: asyncio.Future[T]) -> T:
+        timeout = self._call_options_manager._get_timeout()
+        try:
+            async with asyncio.timeout(timeout):
+                return await future
+        except TimeoutError:
+            msg = "Deadline Exceeded"
+            raise AxServeCallError(grpc.StatusCode.DEADLINE_EXCEEDED, msg) from None
+
+    async def _call_unary(
+        self, method: grpc.aio.UnaryUnaryMultiCallable, request: Any
+    ) -> Any:
+        timeout = self._call_options_manager._get_timeout()
+        key = self._call_options_manager._get_key()
+        call = method(request, timeout=timeout)
+        if key is None:
+            return await call
+        self._call_options_manager._supersede(key, call)
+        try:
+            return await call
+        finally:
+            self._call_options_manager._release(key, call)
+
     async def _create_internals(
-        self, c: str, internals: AxServeObjectInternals | None = None
+        self,
+        c: str,
+        internals: AxServeObjectInternals | None = None,
+        i: str | None = None,
     ) -> AxServeObjectInternals:
-        i = await self._create_instance(c)
+        if i is None:
+            i = await self._create_instance(c)
         members_manager = await self._members_managers._get_members_manager(c, i)
         event_handlers_manager = AxServeEventHandlersManager()
+        property_cache = AxServePropertyCache()
+        method_cache = AxServeMethodCache()
         if not internals:
             internals = AxServeObjectInternals()
         internals._clsid = c
@@ -214,11 +386,15 @@ class AxServeClient(AsyncInitializable["AxServeClient"]):
         internals._instance = i
         internals._members_manager = members_manager
         internals._event_handlers_manager = event_handlers_manager
+        internals._property_cache = property_cache
+        internals._method_cache = method_cache
         return internals
 
-    async def _initialize_internals(self, o: AxServeObject, c: str) -> None:
+    async def _initialize_internals(
+        self, o: AxServeObject, c: str, instance: str | None = None
+    ) -> None:
         i = o.__axserve__
-        i = await self._create_internals(c, i)
+        i = await self._create_internals(c, i, instance)
         o.__dict__["__axserve__"] = i  # skip __setattr__
         if not i._instance:
             msg = "Instance id is empty"
@@ -232,8 +408,248 @@ class AxServeClient(AsyncInitializable["AxServeClient"]):
     async def destroy(self, o: AxServeObject) -> None:
         await o.__afinalize__()
 
+    async def _execute_batch_items(self, requests: list[Any]) -> list[Any]:
+        if not requests:
+            return []
+        batch_request = active_pb2.BatchRequest()
+        for request in requests:
+            add_batch_request_item(batch_request, request)
+        self._event_context_manager._contextualize_request(batch_request)
+        response = await self._call_unary(self._stub.Batch, batch_request)
+        return [get_response_item_result_or_error(item) for item in response.items]
+
+    async def create_many(
+        self, c: str, n: int, *, return_exceptions: bool = False
+    ) -> list[AxServeObject | AxServeCallError]:
+        requests = []
+        for _ in range(n):
+            request = active_pb2.CreateRequest()
+            request.clsid = c
+            requests.append(request)
+        results = await self._execute_batch_items(requests)
+        objects: list[AxServeObject | AxServeCallError] = []
+        for result in results:
+            if isinstance(result, AxServeCallError):
+                objects.append(result)
+                continue
+            o = AxServeObject(c, client=self)
+            await self._initialize_internals(o, c, result.instance)
+            objects.append(o)
+        errors = [o for o in objects if isinstance(o, AxServeCallError)]
+        if errors and not return_exceptions:
+            created = [o for o in objects if isinstance(o, AxServeObject)]
+            await self.destroy_many(created, return_exceptions=True)
+            raise errors[0]
+        return objects
+
+    async def destroy_many(
+        self, objects: Iterable[AxServeObject], *, return_exceptions: bool = False
+    ) -> list[bool | AxServeCallError]:
+        objects = list(objects)
+        results: list[bool | AxServeCallError] = [False] * len(objects)
+        targets = []
+        requests = []
+        for position, o in enumerate(objects):
+            ax = o.__axserve__
+            if not (ax and ax._client is self and (instance := ax._instance)):
+                continue
+            request = active_pb2.DestroyRequest()
+            request.instance = instance
+            targets.append((position, ax))
+            requests.append(request)
+        for (position, ax), result in zip(
+            targets, await self._execute_batch_items(requests), strict=True
+        ):
+            if isinstance(result, AxServeCallError):
+                results[position] = result
+                continue
+            results[position] = result.successful
+            if result.successful and (instance := ax._instance):
+                self._instances_manager._unregister_instance(instance)
+                ax._instance = None
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, AxServeCallError):
+                    raise result
+        return results
+
+    async def _connect_events(
+        self,
+        o: AxServeObject,
+        handlers: list[tuple[int, Callable]],
+        *,
+        return_exceptions: bool = False,
+    ) -> list[active_pb2.ConnectEventResponse | AxServeCallError | None]:
+        ax = o.__axserve__
+        if not (
+            ax
+            and ax._client is self
+            and (instance := ax._instance)
+            and (handlers_manager := ax._event_handlers_manager)
+        ):
+            msg = "Object is not initialized with this client"
+            raise ValueError(msg)
+        async with contextlib.AsyncExitStack() as stack:
+            for index in sorted({index for index, _ in handlers}):
+                lock = handlers_manager._get_event_handlers_lock(index)
+                await stack.enter_async_context(lock)
+            positions: dict[int, int] = {}
+            requests = []
+            for index, _ in handlers:
+                if index in positions or handlers_manager._get_event_handlers(index):
+                    continue
+                request = active_pb2.ConnectEventRequest()
+                request.instance = instance
+                request.index = index
+                positions[index] = len(requests)
+                requests.append(request)
+            responses = await self._execute_batch_items(requests)
+            results: list[active_pb2.ConnectEventResponse | AxServeCallError | None]
+            results = []
+            failed: dict[int, AxServeCallError] = {}
+            for index, handler in handlers:
+                result = None
+                if index in failed:
+                    result = failed[index]
+                elif (position := positions.pop(index, None)) is not None:
+                    result = responses[position]
+                    if not isinstance(result, AxServeCallError) and not (
+                        result.successful
+                    ):
+                        result = AxServeCallError(
+                            grpc.StatusCode.UNKNOWN, "Failed to connect event"
+                        )
+                    if isinstance(result, AxServeCallError):
+                        failed[index] = result
+                if not isinstance(result, AxServeCallError):
+                    handlers_manager._get_event_handlers(index).append(handler)
+                results.append(result)
+        if failed and not return_exceptions:
+            raise next(iter(failed.values()))
+        return results
+
+    def prepare(
+        self, o: AxServeObject, name: str, *, validate: bool = True
+    ) -> AxServePreparedMethod:
+        ax = o.__axserve__
+        if not (ax and ax._client is self and (mm := ax._members_manager)):
+            msg = "Object is not initialized with this client"
+            raise ValueError(msg)
+        method = getattr(type(o), name, None)
+        if not isinstance(method, AxServeMethod):
+            method = None
+            if mm._has_member_name(name):
+                method = mm._get_member_by_name(name)._method
+        if method is None:
+            msg = f"Object has no method '{name}'"
+            raise ValueError(msg)
+        return AxServePreparedMethod(method, o, validate=validate)
+
+    def batch(self) -> AxServeBatch:
+        return AxServeBatch(
+            self._stub,
+            self._event_context_manager,
+            self._batch_manager,
+            self._call_options_manager,
+        )
+
+    def call_options(
+        self, *, timeout: float | None = None, key: Hashable | None = None
+    ) -> AxServeCallOptions:
+        return AxServeCallOptions(self._call_options_manager, timeout, key)
+
+    def supervise(
+        self, *, interval: float = 0.5, max_restarts: int | None = None
+    ) -> AxServeSupervisor:
+        if self._supervisor is None:
+            self._supervisor = AxServeSupervisor(
+                self,
+                interval=interval,
+                max_restarts=max_restarts,
+            )
+            self._supervisor.start()
+        return self._supervisor
+
+    @property
+    def supervisor(self) -> AxServeSupervisor | None:
+        return self._supervisor
+
+    @property
+    def members_managers(self) -> AxServeMembersManagerCache:
+        return self._members_managers
+
+    async def _terminate_managed_process(self) -> None:
+        if self._managed_process:
+            with contextlib.suppress(ProcessLookupError):
+                self._managed_process.terminate()
+            await self._managed_process.wait()
+            self._managed_process = None
+
+    async def _restart(self) -> None:
+        if self._call_stream_manager:
+            self._call_stream_manager._cancel_call_stream()
+            self._call_stream_manager = None
+        if self._event_stream_manager:
+            self._event_stream_manager._cancel_event_stream()
+            self._event_stream_manager = None
+        if self._event_loop_manager:
+            await self._event_loop_manager._abort()
+            self._event_loop_manager = None
+        if self._managed_spawn_args:
+            if self._managed_channel:
+                await self._managed_channel.close()
+                self._managed_channel = None
+            await self._terminate_managed_process()
+            machine, transport = self._managed_spawn_args
+            process, channel = await self._spawn_process(machine, transport)
+            self._managed_process = process
+            self._managed_channel = channel
+            self._channel = channel
+        self._stub = ActiveStub(self._channel)  # type: ignore
+        self._members_managers._stub = self._stub
+        await self.__ainit__()
+        await self._recreate_instances()
+
+    async def _recreate_instances(self) -> None:
+        instances = list(self._instances_manager._instances.items())
+        for i, o in instances:
+            ax = o.__axserve__
+            if not (ax and ax._clsid):
+                continue
+            instance = await self._create_instance(ax._clsid)
+            self._instances_manager._unregister_instance(i)
+            ax._instance = instance
+            self._instances_manager._register_instance(instance, o)
+            if ax._property_cache:
+                ax._property_cache.invalidate()
+            if ax._method_cache:
+                ax._method_cache.clear()
+            if handlers_manager := ax._event_handlers_manager:
+                for index in list(handlers_manager._event_handlers_mapping):
+                    handlers = handlers_manager._get_event_handlers(index)
+                    if not handlers:
+                        continue
+                    request = active_pb2.ConnectEventRequest()
+                    request.instance = instance
+                    request.index = index
+                    response = await self._stub.ConnectEvent(request)
+                    if not response.successful:
+                        msg = "Failed to connect event"
+                        raise RuntimeError(msg)
+            for name, value in ax._initial_properties.items():
+                await o._set_member(name, value)
+
     async def close(self, timeout: float | None = None) -> None:
+        if self._supervisor:
+            await self._supervisor.stop()
+            self._supervisor = None
         async with asyncio.timeout(timeout):
+            if self._destroy_queue:
+                await self._destroy_queue._close()
+                self._destroy_queue = None
+            if self._call_stream_manager:
+                await self._call_stream_manager._close_call_stream()
+                self._call_stream_manager = None
             if self._event_loop_manager:
                 await self._event_loop_manager.stop()
                 self._event_loop_manager = None
@@ -243,15 +659,7 @@ class AxServeClient(AsyncInitializable["AxServeClient"]):
             if self._managed_channel:
                 await self._managed_channel.close()
                 self._managed_channel = None
-            if self._managed_process:
-                try:
-                    self._managed_process.terminate()
-                except ProcessLookupError:
-                    pass
-                else:
-                    await self._managed_process.wait()
-                finally:
-                    self._managed_process = None
+            await self._terminate_managed_process()
 
     async def __afinalize__(self) -> None:
         await self.close()
@@ -308,6 +716,8 @@ class AxServeObject(AsyncInitializable["AxServeObject"]):
         return super().__getattribute__(name)
 
     def __setattr__(self, name, value):  # type: ignore
+        if isinstance(prop := getattr(type(self), name, None), AxServeProperty):
+            return prop.__set__(self, value)
         if (
             (ax := self.__axserve__)
             and (mm := ax._members_manager)
@@ -325,6 +735,66 @@ class AxServeObject(AsyncInitializable["AxServeObject"]):
             return attrs
         return super().__dir__()
 
+    async def get_many(self, names: Iterable[str]) -> dict[str, Any]:
+        ax = self.__axserve__
+        if not (
+            ax
+            and (client := ax._client)
+            and (instance := ax._instance)
+            and (mm := ax._members_manager)
+        ):
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        names = list(names)
+        if not names:
+            return {}
+        indexes = [mm._get_property_index(name) for name in names]
+        values = await client._get_properties(instance, indexes)
+        return dict(zip(names, values, strict=True))
+
+    async def connect_many(
+        self,
+        handlers: Mapping[str | AxServeEventType, Callable],
+        *,
+        return_exceptions: bool = False,
+    ) -> list[active_pb2.ConnectEventResponse | AxServeCallError | None]:
+        ax = self.__axserve__
+        if not (ax and (client := ax._client)):
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        events = []
+        for event, handler in handlers.items():
+            event_type = getattr(self, event) if isinstance(event, str) else event
+            if not isinstance(event_type, AxServeEventType):
+                msg = f"Not an event: {event!r}"
+                raise TypeError(msg)
+            index = event_type._self_func._get_index(self)
+            events.append((index, handler))
+        return await client._connect_events(
+            self, events, return_exceptions=return_exceptions
+        )
+
+    async def snapshot(self) -> dict[str, Any]:
+        ax = self.__axserve__
+        if not (ax and (mm := ax._members_manager)):
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        return await self.get_many(mm._get_readable_property_names())
+
+    async def _set_member(self, name: str, value: Any) -> None:
+        result = self.__setattr__(name, value)
+        if result is not None:
+            await result
+
+    async def initialize(self, values: Mapping[str, Any]) -> None:
+        ax = self.__axserve__
+        if not ax:
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        for name, value in values.items():
+            await self._set_member(name, value)
+            ax._initial_properties[name] = value
+
     async def __afinalize__(self):
         if (
             (ax := self.__axserve__)
@@ -332,4 +802,4 @@ class AxServeObject(AsyncInitializable["AxServeObject"]):
             and (instance := ax._instance)
         ):
             client._instances_manager._unregister_instance(instance)
-            await client._destroy_instance(instance)
+            await client._schedule_destroy_instance(instance)
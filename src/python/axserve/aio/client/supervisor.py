@@ -0,0 +1,152 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from asyncio import Task
+
+    from axserve.aio.client.stub import AxServeClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class AxServeSupervisor:
+    _client: AxServeClient
+    _interval: float
+    _max_restarts: int | None
+
+    _restarts: int
+    _failures: int
+    _last_exception: Exception | None
+    _error: RuntimeError | None
+    _recovery_times: list[float]
+    _recovering: bool
+    _recovery_start_time: float
+
+    _task: Task | None
+
+    def __init__(
+        self,
+        client: AxServeClient,
+        *,
+        interval: float = 0.5,
+        max_restarts: int | None = None,
+    ) -> None:
+        self._client = client
+        self._interval = interval
+        self._max_restarts = max_restarts
+        self._restarts = 0
+        self._failures = 0
+        self._last_exception = None
+        self._error = None
+        self._recovery_times = []
+        self._recovering = False
+        self._recovery_start_time = 0.0
+        self._task = None
+
+    @property
+    def restarts(self) -> int:
+        return self._restarts
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    @property
+    def attempts(self) -> int:
+        return self._restarts + self._failures
+
+    @property
+    def error(self) -> RuntimeError | None:
+        return self._error
+
+    @property
+    def recovery_times(self) -> list[float]:
+        return list(self._recovery_times)
+
+    @property
+    def last_recovery_time(self) -> float | None:
+        return self._recovery_times[-1] if self._recovery_times else None
+
+    def _is_healthy(self) -> bool:
+        client = self._client
+        process = client._managed_process
+        if process is not None and process.returncode is not None:
+            return False
+        event_loop_manager = client._event_loop_manager
+        return not (event_loop_manager and event_loop_manager._has_failed())
+
+    async def _recover(self) -> None:
+        if not self._recovering:
+            self._recovering = True
+            self._recovery_start_time = time.perf_counter()
+        try:
+            await self._client._restart()
+        except Exception as exc:
+            self._failures += 1
+            self._last_exception = exc
+            logger.exception("Failed to recover the axserve client")
+            return
+        self._recovering = False
+        self._restarts += 1
+        self._recovery_times.append(time.perf_counter() - self._recovery_start_time)
+
+    def _give_up(self) -> None:
+        msg = f"Gave up recovering the axserve client after {self.attempts} attempts"
+        logger.error(msg)
+        self._error = RuntimeError(msg)
+        self._error.__cause__ = self._last_exception
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            if not self._recovering and self._is_healthy():
+                continue
+            if self._max_restarts is not None and self.attempts >= self._max_restarts:
+                self._give_up()
+                return
+            await self._recover()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def wait(self, timeout: float | None = None) -> None:
+        if self._task is not None:
+            await asyncio.wait([self._task], timeout=timeout)
+        if self._error is not None:
+            raise self._error
+
+    async def stop(self) -> None:
+        task = self._task
+        self._task = None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            await asyncio.wait([task])
@@ -0,0 +1,77 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ParamSpec
+
+from axserve.common.conflation import AxServeConflatedHandlerBase
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
+
+
+logger = logging.getLogger(__name__)
+
+
+P = ParamSpec("P")
+
+
+class AxServeConflatedHandler(AxServeConflatedHandlerBase[P]):
+    def __init__(
+        self,
+        handler: Callable[P, Any],
+        conflate: Callable[P, Hashable] | None = None,
+        max_rate: float | None = None,
+    ) -> None:
+        super().__init__(handler, conflate, max_rate)
+        self._task: asyncio.Task | None = None
+
+    async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> None:
+        self._put(args, kwargs)
+        if self._pending and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            while self._pending:
+                delay = self._get_delay()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+                args, kwargs = self._pop()
+                self._delivering()
+                try:
+                    res = self._handler(*args, **kwargs)
+                    if inspect.isawaitable(res):
+                        await res
+                except Exception:
+                    logger.exception("Unhandled exception in axserve event handler")
+        finally:
+            self._task = None
+
+    def close(self) -> None:
+        self._discard()
@@ -0,0 +1,39 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import inspect
+
+from typing import Any
+from typing import ParamSpec
+
+from axserve.common.event_handler import (
+    AxServeEarlyAckHandler as _AxServeEarlyAckHandler,
+)
+
+
+P = ParamSpec("P")
+
+
+class AxServeEarlyAckHandler(_AxServeEarlyAckHandler[P]):
+    async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Any:
+        res = self._handler(*args, **kwargs)
+        if inspect.isawaitable(res):
+            res = await res
+        return res
@@ -19,8 +19,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import platform
 
+from asyncio.subprocess import PIPE
 from asyncio.subprocess import Process
 from typing import TYPE_CHECKING
 from typing import Any
@@ -28,7 +30,10 @@ from typing import Any
 from axserve.aio.common.async_initializable import AsyncInitializable
 from axserve.common.process import assign_process_to_job_object
 from axserve.common.process import create_job_object_for_cleanup
+from axserve.common.socket import remove_unix_socket
 from axserve.server.process import find_server_executable_for_machine
+from axserve.server.process import forward_output
+from axserve.server.process import parse_ready_line
 
 
 if TYPE_CHECKING:
@@ -38,6 +43,7 @@ if TYPE_CHECKING:
 class AxServeServerProcess(Process, AsyncInitializable["AxServeServerProcess"]):
     _address: str
     _machine: str
+    _ready_timeout: float
 
     _program: Path
     _args: list[str]
@@ -45,25 +51,42 @@ class AxServeServerProcess(Process, AsyncInitializable["AxServeServerProcess"]):
 
     _underlying_proc: Process
     _job_handle: int
+    _stdout_task: asyncio.Task | None = None
 
     def __init__(
         self,
-        address: str,
+        address: str = "localhost:0",
         *,
         machine: str | None = None,
+        ready_timeout: float | None = None,
         **kwargs,
     ):
         if not machine:
             machine = platform.machine()
+        if not ready_timeout:
+            ready_timeout = 15
 
         self._address = address
         self._machine = machine
+        self._ready_timeout = ready_timeout
 
         self._program = find_server_executable_for_machine(self._machine)
-        self._args = ["--preset", "service", "--address-uri", address]
+        self._args = [
+            "--preset",
+            "service",
+            "--address-uri",
+            address,
+            "--report-ready",
+        ]
         self._kwargs = kwargs
+        self._kwargs["stdout"] = PIPE
+
+    @property
+    def address(self) -> str:
+        return self._address
 
     async def __ainit__(self):
+        remove_unix_socket(self._address)
         self._underlying_proc = await asyncio.create_subprocess_exec(
             self._program,
             *self._args,
@@ -77,7 +100,45 @@ class AxServeServerProcess(Process, AsyncInitializable["AxServeServerProcess"]):
         )
         self._job_handle = create_job_object_for_cleanup()
         assign_process_to_job_object(self._job_handle, self.pid)
+        try:
+            async with asyncio.timeout(self._ready_timeout):
+                await self._read_ready()
+        except BaseException:
+            self._underlying_proc.terminate()
+            await self.wait()
+            raise
+        self._stdout_task = asyncio.create_task(self._forward_stdout())
+
+    async def _read_ready(self) -> None:
+        stdout = self._underlying_proc.stdout
+        if stdout is None:
+            return
+        async for line in stdout:
+            address = parse_ready_line(line)
+            if address is not None:
+                self._address = address
+                return
+            forward_output(line)
+        msg = "Server exited before reporting readiness"
+        raise RuntimeError(msg)
+
+    async def _forward_stdout(self) -> None:
+        stdout = self._underlying_proc.stdout
+        if stdout is None:
+            return
+        async for line in stdout:
+            forward_output(line)
+
+    async def wait(self) -> int:
+        returncode = await self._underlying_proc.wait()
+        remove_unix_socket(self._address)
+        return returncode
 
     async def __afinalize__(self):
         self._underlying_proc.terminate()
-        await self._underlying_proc.wait()
+        await self.wait()
+        if self._stdout_task:
+            self._stdout_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._stdout_task
+            self._stdout_task = None
@@ -0,0 +1,51 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from axserve.server.servicer import AxServeControl
+from axserve.server.servicer import event
+
+
+# ruff:noqa: N802
+
+
+class AxServeBenchmarkControl(AxServeControl):
+    __CLSID__ = "AxServe.BenchmarkControl"
+
+    def __init__(self) -> None:
+        self._value = 0
+
+    @property
+    def Value(self) -> int:
+        return self._value
+
+    @Value.setter
+    def Value(self, value: int) -> None:
+        self._value = value
+
+    def Echo(self, value: int) -> int:
+        return value
+
+    def Fire(self, count: int) -> int:
+        for i in range(count):
+            self.OnEvent(i)
+        return count
+
+    @event
+    def OnEvent(self, value: int) -> None: ...
@@ -0,0 +1,448 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import platform
+import statistics
+import threading
+import time
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+
+import grpc
+
+from axserve.__about__ import __version__
+from axserve.benchmark.control import AxServeBenchmarkControl
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.common.socket import make_unix_socket_address
+from axserve.proto import active_pb2
+from axserve.proto.active_pb2_conversion import ValueFromVariant
+from axserve.proto.active_pb2_conversion import ValueToVariant
+from axserve.server.servicer import AxServeLocalServer
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    count: int
+    seconds: float
+    latencies: list[float] = field(default_factory=list, repr=False)
+
+    def _percentile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        index = min(len(latencies) - 1, round(q * (len(latencies) - 1)))
+        return latencies[index]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "seconds": self.seconds,
+            "ops_per_sec": self.count / self.seconds if self.seconds > 0 else 0.0,
+            "mean_us": statistics.fmean(self.latencies) * 1e6
+            if self.latencies
+            else 0.0,
+            "p50_us": self._percentile(0.50) * 1e6,
+            "p99_us": self._percentile(0.99) * 1e6,
+        }
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    iterations: int,
+    warmup: int = 0,
+) -> BenchmarkResult:
+    for _ in range(warmup):
+        func()
+    latencies = []
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        call_time = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - call_time)
+    seconds = time.perf_counter() - start_time
+    return BenchmarkResult(name, iterations, seconds, latencies)
+
+
+async def measure_async(
+    name: str,
+    func: Callable[[], Awaitable[Any]],
+    iterations: int,
+    warmup: int = 0,
+) -> BenchmarkResult:
+    for _ in range(warmup):
+        await func()
+    latencies = []
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        call_time = time.perf_counter()
+        await func()
+        latencies.append(time.perf_counter() - call_time)
+    seconds = time.perf_counter() - start_time
+    return BenchmarkResult(name, iterations, seconds, latencies)
+
+
+def _get_event_latencies(start_time: float, timestamps: list[float]) -> list[float]:
+    return [b - a for a, b in zip([start_time, *timestamps], timestamps, strict=False)]
+
+
+def _make_event_result(
+    name: str, count: int, start_time: float, timestamps: list[float]
+) -> BenchmarkResult:
+    seconds = time.perf_counter() - start_time
+    latencies = _get_event_latencies(start_time, timestamps)
+    return BenchmarkResult(name, count, seconds, latencies)
+
+
+def make_nested_value(width: int = 10, depth: int = 3) -> Any:
+    if depth <= 0:
+        return [1, 2.5, "value", True]
+    return {
+        f"key{i}": [i, float(i), str(i), make_nested_value(width, depth - 1)]
+        for i in range(width)
+    }
+
+
+BATCH_SIZE = 50
+SLOW_HANDLER_SECONDS = 0.001
+
+
+def run_conversion_benchmarks(
+    iterations: int,
+    warmup: int = 0,
+) -> list[BenchmarkResult]:
+    results = []
+    values = {
+        "flat_list": list(range(100)),
+        "nested_list": [[i, [float(i), [str(i)]]] for i in range(100)],
+        "nested_map": make_nested_value(5, 3),
+    }
+    for name, value in values.items():
+        results.append(
+            measure(
+                f"conversion.to_variant.{name}",
+                lambda value=value: ValueToVariant(value),
+                iterations,
+                warmup,
+            )
+        )
+        variant = ValueToVariant(value)
+        results.append(
+            measure(
+                f"conversion.from_variant.{name}",
+                lambda variant=variant: ValueFromVariant(variant),
+                iterations,
+                warmup,
+            )
+        )
+        data = variant.SerializeToString()
+        results.append(
+            measure(
+                f"conversion.parse.{name}",
+                lambda data=data: active_pb2.Variant.FromString(data),
+                iterations,
+                warmup,
+            )
+        )
+    return results
+
+
+def run_sync_benchmarks(
+    address: str,
+    iterations: int,
+    warmup: int = 0,
+) -> list[BenchmarkResult]:
+    results = []
+
+    with (
+        grpc.insecure_channel(address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(AxServeBenchmarkControl.__CLSID__, client=client) as obj,
+    ):
+        results.append(
+            measure(
+                "sync.property.get",
+                lambda: obj.Value,
+                iterations,
+                warmup,
+            )
+        )
+
+        def get_batched():
+            with client.batch():
+                futures = [obj.Value for _ in range(BATCH_SIZE)]
+            return [future.result() for future in futures]
+
+        results.append(
+            measure(
+                f"sync.property.get.batch{BATCH_SIZE}",
+                get_batched,
+                iterations,
+                warmup,
+            )
+        )
+        results.append(
+            measure(
+                "sync.property.set",
+                lambda: setattr(obj, "Value", 1),
+                iterations,
+                warmup,
+            )
+        )
+        results.append(
+            measure(
+                "sync.method.call",
+                lambda: obj.Echo(1),
+                iterations,
+                warmup,
+            )
+        )
+        echo = client.prepare(obj, "Echo", validate=False)
+        results.append(
+            measure(
+                "sync.method.call.prepared",
+                lambda: echo(1),
+                iterations,
+                warmup,
+            )
+        )
+
+        timestamps: list[float] = []
+
+        def handler(value):  # noqa: ARG001
+            timestamps.append(time.perf_counter())
+
+        obj.OnEvent.connect(handler)
+        obj.Fire(warmup)
+        timestamps.clear()
+        start_time = time.perf_counter()
+        obj.Fire(iterations)
+        results.append(
+            _make_event_result("sync.event", iterations, start_time, timestamps)
+        )
+        obj.OnEvent.disconnect(handler)
+
+        for early_ack in (False, True):
+            handled = threading.Semaphore(0)
+            timestamps = []
+
+            def slow_handler(value, handled=handled, timestamps=timestamps):  # noqa: ARG001
+                time.sleep(SLOW_HANDLER_SECONDS)
+                timestamps.append(time.perf_counter())
+                handled.release()
+
+            obj.OnEvent.connect(slow_handler, early_ack=early_ack)
+            start_time = time.perf_counter()
+            obj.Fire(iterations)
+            seconds = time.perf_counter() - start_time
+            for _ in range(iterations):
+                handled.acquire()
+            obj.OnEvent.disconnect(slow_handler)
+            name = "sync.event.slow.early_ack" if early_ack else "sync.event.slow"
+            latencies = _get_event_latencies(start_time, timestamps)
+            results.append(BenchmarkResult(name, iterations, seconds, latencies))
+
+    with (
+        grpc.insecure_channel(address) as channel,
+        AxServeClient(channel, call_stream=True) as client,
+        AxServeObject(AxServeBenchmarkControl.__CLSID__, client=client) as obj,
+    ):
+        results.append(
+            measure(
+                "sync.stream.property.get",
+                lambda: obj.Value,
+                iterations,
+                warmup,
+            )
+        )
+        results.append(
+            measure(
+                "sync.stream.method.call",
+                lambda: obj.Echo(1),
+                iterations,
+                warmup,
+            )
+        )
+
+    return results
+
+
+async def run_async_benchmarks(
+    address: str,
+    iterations: int,
+    warmup: int = 0,
+) -> list[BenchmarkResult]:
+    # aio client keeps loop local states, import it inside a running loop
+    from axserve.aio.client.stub import AxServeClient as AsyncAxServeClient  # noqa: PLC0415
+    from axserve.aio.client.stub import AxServeObject as AsyncAxServeObject  # noqa: PLC0415
+
+    results = []
+
+    async with (
+        grpc.aio.insecure_channel(address) as channel,
+        AsyncAxServeClient(channel) as client,
+        AsyncAxServeObject(AxServeBenchmarkControl.__CLSID__, client=client) as obj,
+    ):
+        results.append(
+            await measure_async(
+                "aio.property.get",
+                lambda: obj.Value,
+                iterations,
+                warmup,
+            )
+        )
+        results.append(
+            await measure_async(
+                "aio.property.set",
+                lambda: obj.__setattr__("Value", 1),
+                iterations,
+                warmup,
+            )
+        )
+        results.append(
+            await measure_async(
+                "aio.method.call",
+                lambda: obj.Echo(1),
+                iterations,
+                warmup,
+            )
+        )
+        echo = client.prepare(obj, "Echo", validate=False)
+        results.append(
+            await measure_async(
+                "aio.method.call.prepared",
+                lambda: echo(1),
+                iterations,
+                warmup,
+            )
+        )
+
+        timestamps: list[float] = []
+
+        async def handler(value):  # noqa: ARG001
+            timestamps.append(time.perf_counter())
+
+        await obj.OnEvent.connect(handler)
+        await obj.Fire(warmup)
+        timestamps.clear()
+        start_time = time.perf_counter()
+        await obj.Fire(iterations)
+        results.append(
+            _make_event_result("aio.event", iterations, start_time, timestamps)
+        )
+        await obj.OnEvent.disconnect(handler)
+
+    return results
+
+
+def _run_transport_benchmark(
+    transport: str,
+    address: str,
+    iterations: int,
+    warmup: int = 0,
+) -> list[BenchmarkResult]:
+    with (
+        AxServeLocalServer([AxServeBenchmarkControl], address) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(AxServeBenchmarkControl.__CLSID__, client=client) as obj,
+    ):
+        return [
+            measure(
+                f"transport.{transport}.property.get",
+                lambda: obj.Value,
+                iterations,
+                warmup,
+            ),
+            measure(
+                f"transport.{transport}.method.call",
+                lambda: obj.Echo(1),
+                iterations,
+                warmup,
+            ),
+        ]
+
+
+def run_transport_benchmarks(
+    iterations: int,
+    warmup: int = 0,
+) -> list[BenchmarkResult]:
+    results = []
+    results += _run_transport_benchmark("tcp", "localhost:0", iterations, warmup)
+    results += _run_transport_benchmark(
+        "uds", make_unix_socket_address(), iterations, warmup
+    )
+    return results
+
+
+BENCHMARK_GROUPS = ["conversion", "sync", "aio", "transport"]
+
+
+def run_benchmarks(
+    iterations: int = 1000,
+    warmup: int = 100,
+    groups: Iterable[str] | None = None,
+) -> dict[str, Any]:
+    groups = list(groups) if groups else BENCHMARK_GROUPS
+    for group in groups:
+        if group not in BENCHMARK_GROUPS:
+            msg = f"Unknown benchmark group: {group}"
+            raise ValueError(msg)
+
+    results: list[BenchmarkResult] = []
+
+    if "conversion" in groups:
+        results += run_conversion_benchmarks(iterations, warmup)
+
+    if "sync" in groups or "aio" in groups:
+        with AxServeLocalServer([AxServeBenchmarkControl]) as server:
+            if "sync" in groups:
+                results += run_sync_benchmarks(server.address, iterations, warmup)
+            if "aio" in groups:
+                results += asyncio.run(
+                    run_async_benchmarks(server.address, iterations, warmup)
+                )
+
+    if "transport" in groups:
+        results += run_transport_benchmarks(iterations, warmup)
+
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "grpc": grpc.__version__,
+        "iterations": iterations,
+        "warmup": warmup,
+        "results": [result.to_dict() for result in results],
+    }
@@ -89,6 +89,56 @@ def generate(
         f.write(code)
 
 
+@cli.command(short_help="Run client benchmarks against a local stand-in server.")
+@click.option(
+    "--iterations",
+    metavar="<N>",
+    type=int,
+    default=1000,
+    show_default=True,
+    help="Number of measured iterations for each benchmark.",
+)
+@click.option(
+    "--warmup",
+    metavar="<N>",
+    type=int,
+    default=100,
+    show_default=True,
+    help="Number of warmup iterations for each benchmark.",
+)
+@click.option(
+    "--group",
+    "groups",
+    metavar="<GROUP>",
+    multiple=True,
+    type=click.Choice(["conversion", "sync", "aio", "transport"]),
+    help="Benchmark group to run, can be given multiple times. Runs all by default.",
+)
+@click.option(
+    "--output",
+    metavar="<PATH>",
+    help="Path to output json file. Prints to stdout if not given.",
+)
+def bench(
+    iterations: int,
+    warmup: int,
+    groups: tuple[str, ...],
+    output: str | None,
+):
+    import json
+
+    from axserve.benchmark.suite import run_benchmarks
+
+    report = run_benchmarks(iterations, warmup, groups)
+    data = json.dumps(report, indent=2)
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(data)
+    else:
+        click.echo(data)
+
+
 def main():
     cli()
 
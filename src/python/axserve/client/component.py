@@ -19,10 +19,18 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import itertools
+import logging
 import threading
+import time
 import typing
 
 from collections import defaultdict
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import InvalidStateError
+from concurrent.futures import ThreadPoolExecutor
 from threading import Condition
 from threading import Thread
 from typing import TYPE_CHECKING
@@ -35,6 +43,11 @@ from axserve.client.descriptor import AxServeEvent
 from axserve.client.descriptor import AxServeMember
 from axserve.client.descriptor import AxServeMethod
 from axserve.client.descriptor import AxServeProperty
+from axserve.common.call import add_batch_request_item
+from axserve.common.call import set_request_item
+from axserve.common.call import set_response_item_result
+from axserve.common.closeable_queue import Closed
+from axserve.common.event_handler import AxServeEarlyAckHandler
 from axserve.common.iterable_queue import IterableQueue
 from axserve.proto import active_pb2
 from axserve.proto.active_pb2_conversion import ValueFromVariant
@@ -42,14 +55,21 @@ from axserve.proto.active_pb2_conversion import ValueFromVariant
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Hashable
     from collections.abc import Iterator
     from collections.abc import Mapping
+    from types import TracebackType
+    from typing import Any
 
     from axserve.client.stub import AxServeObject
     from axserve.common.acquireable import Acquireable
+    from axserve.common.describe_cache import AxServeDescribeCache
     from axserve.proto.active_pb2_grpc import ActiveStub
 
 
+logger = logging.getLogger(__name__)
+
+
 T = TypeVar("T")
 
 
@@ -81,6 +101,157 @@ class AxServeEventContextManager:
         return request
 
 
+class AxServeBatchManager:
+    def __init__(self):
+        self._thread_local = threading.local()
+        self._thread_local._batch_stack = []
+
+    def _get_batch_stack(self) -> list[AxServeBatch]:
+        if not hasattr(self._thread_local, "_batch_stack"):
+            self._thread_local._batch_stack = []
+        return self._thread_local._batch_stack
+
+    def _get_current_batch(self) -> AxServeBatch | None:
+        batch_stack = self._get_batch_stack()
+        return batch_stack[-1] if batch_stack else None
+
+
+class AxServeCallOptionsManager:
+    def __init__(self, timeout: float | None = None):
+        self._timeout = timeout
+        self._thread_local = threading.local()
+        self._thread_local._call_options_stack = []
+        self._keyed_calls: dict[Hashable, grpc.Future] = {}
+        self._keyed_calls_lock = threading.Lock()
+
+    def _get_call_options_stack(self) -> list[AxServeCallOptions]:
+        if not hasattr(self._thread_local, "_call_options_stack"):
+            self._thread_local._call_options_stack = []
+        return self._thread_local._call_options_stack
+
+    def _get_timeout(self) -> float | None:
+        for options in reversed(self._get_call_options_stack()):
+            if options._timeout is not None:
+                return options._timeout
+        return self._timeout
+
+    def _get_key(self) -> Hashable | None:
+        for options in reversed(self._get_call_options_stack()):
+            if options._key is not None:
+                return options._key
+        return None
+
+    def _supersede(self, key: Hashable, call_future: grpc.Future) -> None:
+        with self._keyed_calls_lock:
+            previous = self._keyed_calls.get(key)
+            self._keyed_calls[key] = call_future
+        if previous is not None:
+            previous.cancel()
+
+    def _release(self, key: Hashable, call_future: grpc.Future) -> None:
+        with self._keyed_calls_lock:
+            if self._keyed_calls.get(key) is call_future:
+                del self._keyed_calls[key]
+
+
+class AxServeCallOptions:
+    def __init__(
+        self,
+        call_options_manager: AxServeCallOptionsManager,
+        timeout: float | None = None,
+        key: Hashable | None = None,
+    ):
+        self._call_options_manager = call_options_manager
+        self._timeout = timeout
+        self._key = key
+
+    def __enter__(self):
+        self._call_options_manager._get_call_options_stack().append(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        call_options_stack = self._call_options_manager._get_call_options_stack()
+        if call_options_stack and call_options_stack[-1] is self:
+            call_options_stack.pop()
+
+
+class AxServeBatch:
+    def __init__(
+        self,
+        stub: ActiveStub,
+        event_context_manager: AxServeEventContextManager,
+        batch_manager: AxServeBatchManager,
+        call_options_manager: AxServeCallOptionsManager | None = None,
+    ):
+        self._stub = stub
+        self._event_context_manager = event_context_manager
+        self._batch_manager = batch_manager
+        self._call_options_manager = call_options_manager
+        self._items: list[tuple[Any, Future]] = []
+
+    def _add_request(self, request) -> Future:
+        future: Future = Future()
+        self._items.append((request, future))
+        return future
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def flush(self) -> None:
+        items, self._items = self._items, []
+        items = [
+            (request, future)
+            for request, future in items
+            if future.set_running_or_notify_cancel()
+        ]
+        if not items:
+            return
+        request = active_pb2.BatchRequest()
+        for item_request, _ in items:
+            add_batch_request_item(request, item_request)
+        self._event_context_manager._contextualize_request(request)
+        timeout = None
+        if self._call_options_manager is not None:
+            timeout = self._call_options_manager._get_timeout()
+        try:
+            response = self._stub.Batch(request, timeout=timeout)
+        except grpc.RpcError as exc:
+            for _, future in items:
+                future.set_exception(exc)
+            raise
+        response = typing.cast(active_pb2.BatchResponse, response)
+        for (_, future), response_item in zip(items, response.items, strict=True):
+            set_response_item_result(future, response_item)
+
+    def cancel(self) -> None:
+        items, self._items = self._items, []
+        for _, future in items:
+            future.cancel()
+
+    def __enter__(self):
+        self._batch_manager._get_batch_stack().append(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        batch_stack = self._batch_manager._get_batch_stack()
+        if batch_stack and batch_stack[-1] is self:
+            batch_stack.pop()
+        if exc_type is None:
+            self.flush()
+        else:
+            self.cancel()
+
+
 class AxServeEventHandlersManager:
     def __init__(self):
         self._event_handlers_mapping: Mapping[int, list[Callable]] = defaultdict(list)
@@ -96,8 +267,12 @@ class AxServeEventHandlersManager:
 
 
 class AxServeEventStreamManager:
-    def __init__(self, stub: ActiveStub):
+    def __init__(self, stub: ActiveStub, *, batch_events: bool = False):
         self._handle_event_response_queue = IterableQueue()
+        if batch_events:
+            self._handle_event_response_queue.put(
+                active_pb2.HandleEventResponse(batch_events=True)
+            )
         self._handle_event_requests = stub.HandleEvent(
             self._handle_event_response_queue
         )
@@ -118,6 +293,144 @@ class AxServeEventStreamManager:
         return handle_events.cancel()
 
 
+class AxServeDestroyQueue:
+    def __init__(
+        self,
+        destroy: Callable[[list[str]], Any],
+        max_batch_size: int = 100,
+    ):
+        self._destroy = destroy
+        self._max_batch_size = max_batch_size
+        self._pending: list[str] = []
+        self._submitted = 0
+        self._completed = 0
+        self._failures = 0
+        self._is_closed = False
+        self._condition = Condition()
+        self._worker = Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return self._submitted - self._completed
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def _put(self, instance: str) -> bool:
+        with self._condition:
+            if self._is_closed:
+                return False
+            self._pending.append(instance)
+            self._submitted += 1
+            self._condition.notify_all()
+            return True
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._is_closed)
+                if not self._pending:
+                    return
+                batch = self._pending[: self._max_batch_size]
+                del self._pending[: self._max_batch_size]
+            failures = 0
+            try:
+                results = self._destroy(batch)
+            except Exception:
+                logger.exception("Failed to destroy axserve instances")
+                failures = len(batch)
+            else:
+                failures = sum(1 for result in results if result is not True)
+            with self._condition:
+                self._completed += len(batch)
+                self._failures += failures
+                self._condition.notify_all()
+
+    def _flush(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            submitted = self._submitted
+            return self._condition.wait_for(
+                lambda: self._completed >= submitted, timeout
+            )
+
+    def _close(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+        return not self._worker.is_alive()
+
+
+class AxServeCallStreamManager:
+    def __init__(self, stub: ActiveStub):
+        self._call_request_queue = IterableQueue()
+        self._call_ids = itertools.count(1)
+        self._call_futures: dict[int, Future] = {}
+        self._call_futures_lock = threading.Lock()
+        self._call_error: grpc.RpcError | None = None
+        self._call_responses = stub.Call(self._iter_call_requests())
+        self._call_response_reader = Thread(
+            target=self._read_call_responses, daemon=True
+        )
+        self._call_response_reader.start()
+
+    def _iter_call_requests(self) -> Iterator[active_pb2.CallRequest]:
+        for call_request in self._call_request_queue:
+            with self._call_futures_lock:
+                future = self._call_futures.get(call_request.id)
+                if future is None:
+                    continue
+                if not future.set_running_or_notify_cancel():
+                    del self._call_futures[call_request.id]
+                    continue
+            yield call_request
+
+    def _read_call_responses(self) -> None:
+        error: grpc.RpcError
+        try:
+            for response in self._call_responses:
+                with self._call_futures_lock:
+                    future = self._call_futures.pop(response.id, None)
+                if future is not None:
+                    set_response_item_result(future, response)
+        except grpc.RpcError as exc:
+            error = exc
+        else:
+            error = grpc.RpcError("Call stream is closed")
+        with self._call_futures_lock:
+            self._call_error = error
+            futures = list(self._call_futures.values())
+            self._call_futures.clear()
+        for future in futures:
+            with contextlib.suppress(InvalidStateError):
+                future.set_exception(error)
+
+    def _is_call_stream_available(self) -> bool:
+        return self._call_error is None
+
+    def _call(self, request) -> Future | None:
+        call_request = active_pb2.CallRequest()
+        call_request.id = next(self._call_ids)
+        set_request_item(call_request, request)
+        future: Future = Future()
+        with self._call_futures_lock:
+            if self._call_error is not None:
+                return None
+            self._call_futures[call_request.id] = future
+        self._call_request_queue.put(call_request)
+        return future
+
+    def _close_call_stream(self) -> None:
+        return self._call_request_queue.close()
+
+    def _cancel_call_stream(self) -> bool:
+        call_responses = typing.cast(grpc.RpcContext, self._call_responses)
+        return call_responses.cancel()
+
+
 class AxServeInstancesManager:
     _instances: WeakValueDictionary[str, AxServeObject]
 
@@ -135,6 +448,9 @@ class AxServeInstancesManager:
     def _has_instance(self, i: str) -> bool:
         return i in self._instances
 
+    def _count_instances(self) -> int:
+        return len(self._instances)
+
     def _get_instance(
         self, i: str, default: T | None = None
     ) -> AxServeObject | T | None:
@@ -146,6 +462,7 @@ class AxServeMembersManager:
     _stub: ActiveStub
     _context_manager: AxServeEventContextManager
 
+    _response: active_pb2.DescribeResponse | None
     _members_dict: dict[str, AxServeMember]
     _properties_list: list[AxServeProperty]
     _properties_dict: dict[str, AxServeProperty]
@@ -159,6 +476,7 @@ class AxServeMembersManager:
         instance: str,
         stub: ActiveStub,
         context_manager: AxServeEventContextManager,
+        response: active_pb2.DescribeResponse | None = None,
     ):
         self._instance = instance
         self._stub = stub
@@ -172,34 +490,57 @@ class AxServeMembersManager:
         self._events_list = []
         self._events_dict = {}
 
-        request = active_pb2.DescribeRequest()
-        request.instance = instance
-        context_manager._contextualize_request(request)
-        response = stub.Describe(request)
-        response = typing.cast(active_pb2.DescribeResponse, response)
+        if response is None:
+            request = active_pb2.DescribeRequest()
+            request.instance = instance
+            context_manager._contextualize_request(request)
+            response = stub.Describe(request)
+            response = typing.cast(active_pb2.DescribeResponse, response)
+
+        self._load(response)
+
+    def _load(self, response: active_pb2.DescribeResponse) -> None:
+        members_dict: dict[str, AxServeMember] = {}
+        properties_list = []
+        properties_dict = {}
+        methods_list = []
+        methods_dict = {}
+        events_list = []
+        events_dict = {}
 
         for info in response.properties:
             prop = AxServeProperty(info)
-            self._properties_list.append(prop)
-            self._properties_dict[info.name] = prop
-            if info.name not in self._members_dict:
-                self._members_dict[info.name] = AxServeMember()
-            self._members_dict[info.name]._property = prop
+            properties_list.append(prop)
+            properties_dict[info.name] = prop
+            if info.name not in members_dict:
+                members_dict[info.name] = AxServeMember()
+            members_dict[info.name]._property = prop
         for info in response.methods:
             method = AxServeMethod(info)
-            self._methods_list.append(method)
-            self._methods_dict[info.name] = method
-            if info.name not in self._members_dict:
-                self._members_dict[info.name] = AxServeMember()
-            self._members_dict[info.name]._method = method
-        for info in response.events:
+            methods_list.append(method)
+            methods_dict[info.name] = method
+            if info.name not in members_dict:
+                members_dict[info.name] = AxServeMember()
+            members_dict[info.name]._method = method
+        for event_info in response.events:
+            info = active_pb2.EventInfo()
+            info.CopyFrom(event_info)
             info.name = self._make_event_method_name(info.name)
             event = AxServeEvent(info)
-            self._events_list.append(event)
-            self._events_dict[info.name] = event
-            if info.name not in self._members_dict:
-                self._members_dict[info.name] = AxServeMember()
-            self._members_dict[info.name]._event = event
+            events_list.append(event)
+            events_dict[info.name] = event
+            if info.name not in members_dict:
+                members_dict[info.name] = AxServeMember()
+            members_dict[info.name]._event = event
+
+        self._response = response
+        self._members_dict = members_dict
+        self._properties_list = properties_list
+        self._properties_dict = properties_dict
+        self._methods_list = methods_list
+        self._methods_dict = methods_dict
+        self._events_list = events_list
+        self._events_dict = events_dict
 
     @classmethod
     def _make_event_method_name(cls, name: str) -> str:
@@ -225,26 +566,217 @@ class AxServeMembersManager:
     def _get_member_names(self) -> list[str]:
         return list(self._members_dict.keys())
 
+    def _get_property_index(self, name: str) -> int:
+        prop = self._properties_dict.get(name)
+        if prop is None or prop._index is None:
+            msg = f"Object has no property '{name}'"
+            raise ValueError(msg)
+        return prop._index
+
+    def _get_readable_property_names(self) -> list[str]:
+        return [
+            info.name
+            for prop in self._properties_list
+            if (info := prop._info) is not None and info.is_readable
+        ]
+
 
 class AxServeMembersManagerCache:
     def __init__(
         self,
         stub: ActiveStub,
         context_manager: AxServeEventContextManager,
+        describe_cache: AxServeDescribeCache | None = None,
     ):
         self._stub = stub
         self._context_manager = context_manager
+        self._describe_cache = describe_cache
         self._members_managers: dict[str, AxServeMembersManager] = {}
+        self._pending: dict[str, Future[AxServeMembersManager]] = {}
+        self._lock = threading.Lock()
+        self._collapsed = 0
+
+    @property
+    def collapsed(self) -> int:
+        return self._collapsed
 
     def _get_members_manager(self, c: str, i: str) -> AxServeMembersManager:
-        if c not in self._members_managers:
+        members_manager = self._members_managers.get(c)
+        if members_manager is not None:
+            return members_manager
+        with self._lock:
+            members_manager = self._members_managers.get(c)
+            if members_manager is not None:
+                return members_manager
+            future = self._pending.get(c)
+            is_leader = future is None
+            if future is None:
+                future = self._pending[c] = Future()
+            else:
+                self._collapsed += 1
+        if not is_leader:
+            return future.result()
+        try:
+            members_manager = self._create_members_manager(c, i)
+        except BaseException as exc:
+            with self._lock:
+                del self._pending[c]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            self._members_managers[c] = members_manager
+            del self._pending[c]
+        future.set_result(members_manager)
+        return members_manager
+
+    def _create_members_manager(self, c: str, i: str) -> AxServeMembersManager:
+        describe_cache = self._describe_cache
+        if describe_cache is None:
+            return AxServeMembersManager(i, self._stub, self._context_manager)
+        response = describe_cache.load(c)
+        if response is None:
             members_manager = AxServeMembersManager(
                 i, self._stub, self._context_manager
             )
-            self._members_managers[c] = members_manager
-        members_manager = self._members_managers[c]
+            if members_manager._response is not None:
+                describe_cache.store(c, members_manager._response)
+            return members_manager
+        members_manager = AxServeMembersManager(
+            i, self._stub, self._context_manager, response
+        )
+        self._validate_members_manager(c, i, members_manager)
         return members_manager
 
+    def _validate_members_manager(
+        self, c: str, i: str, members_manager: AxServeMembersManager
+    ) -> None:
+        describe_cache = self._describe_cache
+        if describe_cache is None:
+            return
+        request = active_pb2.DescribeRequest()
+        request.instance = i
+        self._context_manager._contextualize_request(request)
+        future = self._stub.Describe.future(request)
+
+        def validate(future: grpc.Future) -> None:
+            if future.cancelled() or future.exception() is not None:
+                return
+            response = typing.cast(active_pb2.DescribeResponse, future.result())
+            cached = members_manager._response
+            if cached is not None and cached.SerializeToString(
+                deterministic=True
+            ) == response.SerializeToString(deterministic=True):
+                return
+            describe_cache._mark_stale(c, response)
+            members_manager._load(response)
+
+        future.add_done_callback(validate)
+
+
+class AxServeEventPartition:
+    def __init__(self, key: Hashable):
+        self._key = key
+        self._queue: deque[Callable[[], None]] = deque()
+        self._is_scheduled = False
+        self._max_depth = 0
+        self._handled = 0
+        self._handler_time = 0.0
+
+    @property
+    def key(self) -> Hashable:
+        return self._key
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    @property
+    def handled(self) -> int:
+        return self._handled
+
+    @property
+    def handler_time(self) -> float:
+        return self._handler_time
+
+
+class AxServeEventDispatcher:
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        key: Callable[[AxServeObject], Hashable] | None = None,
+    ):
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="axserve-event"
+        )
+        self._key = key
+        self._partitions: dict[Hashable, AxServeEventPartition] = {}
+        self._lock = threading.Lock()
+        self._is_shutdown = False
+
+    @property
+    def partitions(self) -> dict[Hashable, AxServeEventPartition]:
+        with self._lock:
+            return dict(self._partitions)
+
+    def _get_key(self, instance: AxServeObject, instance_id: str) -> Hashable:
+        if self._key is None:
+            return instance_id
+        return self._key(instance)
+
+    def _dispatch(self, key: Hashable, func: Callable[[], None]) -> None:
+        with self._lock:
+            if self._is_shutdown:
+                msg = "Cannot dispatch events after shutdown"
+                raise RuntimeError(msg)
+            partition = self._partitions.get(key)
+            if partition is None:
+                partition = self._partitions[key] = AxServeEventPartition(key)
+            partition._queue.append(func)
+            partition._max_depth = max(partition._max_depth, len(partition._queue))
+            if partition._is_scheduled:
+                return
+            partition._is_scheduled = True
+        self._executor.submit(self._run, partition)
+
+    def _run(self, partition: AxServeEventPartition) -> None:
+        while True:
+            with self._lock:
+                if not partition._queue:
+                    partition._is_scheduled = False
+                    return
+                func = partition._queue.popleft()
+            start_time = time.perf_counter()
+            try:
+                func()
+            except Exception:
+                logger.exception("Unhandled exception in axserve event handler")
+            finally:
+                elapsed_time = time.perf_counter() - start_time
+                with self._lock:
+                    partition._handled += 1
+                    partition._handler_time += elapsed_time
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        with self._lock:
+            self._is_shutdown = True
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
 
 class AxServeEventLoop:
     def __init__(
@@ -252,10 +784,13 @@ class AxServeEventLoop:
         instances_manager: AxServeInstancesManager,
         event_context_manager: AxServeEventContextManager,
         event_stream_manager: AxServeEventStreamManager,
+        event_dispatcher: AxServeEventDispatcher | None = None,
     ):
         self._instances_manager = instances_manager
         self._event_context_manager = event_context_manager
         self._event_stream_manager = event_stream_manager
+        self._event_dispatcher = event_dispatcher
+        self._early_ack_dispatcher: AxServeEventDispatcher | None = None
 
         self._state_lock = threading.RLock()
         self._is_exitting = False
@@ -274,21 +809,114 @@ class AxServeEventLoop:
                 self._is_exitting = False
                 self._is_running = False
 
-    @contextlib.contextmanager
-    def _create_handle_event_context(self, handle_event: active_pb2.HandleEventRequest):
+    def _get_event_calls(
+        self, handle_event: active_pb2.HandleEventRequest
+    ) -> list[Callable[[], Any]]:
+        instance = self._instances_manager._get_instance(handle_event.instance)
+        if instance is None:
+            return []
+        ax = instance.__axserve__
+        if ax is None:
+            return []
+        mm = ax._members_manager
+        if mm is None:
+            return []
+        event_callback = mm._get_event(handle_event.index)
+        args = [ValueFromVariant(arg) for arg in handle_event.arguments]
+        return [
+            functools.partial(handler, *args)
+            for handler in event_callback._get_handlers(instance)
+        ]
+
+    def _handle_event(
+        self, handle_event: active_pb2.HandleEventRequest
+    ) -> list[Callable[[], Any]]:
+        early_ack_calls = []
+        for call in self._get_event_calls(handle_event):
+            if isinstance(call.func, AxServeEarlyAckHandler):
+                early_ack_calls.append(call)
+            else:
+                call()
+        return early_ack_calls
+
+    def _run_event_calls(self, calls: list[Callable[[], Any]]) -> None:
+        for call in calls:
+            call()
+
+    def _dispatch_early_ack_calls(
+        self, early_ack_calls: list[Callable[[], Any]]
+    ) -> None:
+        if self._early_ack_dispatcher is None:
+            self._early_ack_dispatcher = AxServeEventDispatcher(1)
+        self._early_ack_dispatcher._dispatch(
+            None, functools.partial(self._run_event_calls, early_ack_calls)
+        )
+
+    def _close_early_ack_dispatcher(self, *, wait: bool = True) -> None:
+        if self._early_ack_dispatcher is not None:
+            self._early_ack_dispatcher.shutdown(wait=wait)
+            self._early_ack_dispatcher = None
+
+    def _ack_event(self, handle_event: active_pb2.HandleEventRequest) -> None:
+        response = active_pb2.HandleEventResponse(
+            id=handle_event.id,
+            instance=handle_event.instance,
+            index=handle_event.index,
+        )
+        with contextlib.suppress(Closed):
+            self._event_stream_manager._put_handle_event_response(response)
+
+    def _handle_event_in_context(
+        self, handle_event: active_pb2.HandleEventRequest, *, ack: bool = True
+    ) -> None:
         event_context_stack = (
             self._event_context_manager._get_handle_event_context_stack()
         )
         event_context_stack.append(handle_event)
+        early_ack_calls = []
         try:
-            yield
+            early_ack_calls = self._handle_event(handle_event)
         finally:
             event_context_stack.pop()
-            response = active_pb2.HandleEventResponse()
-            response.id = handle_event.id
-            response.instance = handle_event.instance
-            response.index = handle_event.index
-            self._event_stream_manager._put_handle_event_response(response)
+            if ack:
+                self._ack_event(handle_event)
+        if early_ack_calls:
+            self._dispatch_early_ack_calls(early_ack_calls)
+
+    def _handle_event_frame(self, frame: active_pb2.HandleEventRequest) -> None:
+        acked_sequence = 0
+        try:
+            for handle_event in frame.events:
+                if self._dispatch_event(handle_event):
+                    continue
+                if not handle_event.sequence:
+                    self._handle_event_in_context(handle_event)
+                    continue
+                acked_sequence = handle_event.sequence
+                self._handle_event_in_context(handle_event, ack=False)
+        finally:
+            if acked_sequence:
+                response = active_pb2.HandleEventResponse(acked_sequence=acked_sequence)
+                with contextlib.suppress(Closed):
+                    self._event_stream_manager._put_handle_event_response(response)
+
+    def _dispatch_event(self, handle_event: active_pb2.HandleEventRequest) -> bool:
+        event_dispatcher = self._event_dispatcher
+        if event_dispatcher is None:
+            return False
+        instance = self._instances_manager._get_instance(handle_event.instance)
+        if instance is None:
+            return False
+        key = event_dispatcher._get_key(instance, handle_event.instance)
+        try:
+            calls = self._get_event_calls(handle_event)
+        finally:
+            self._ack_event(handle_event)
+        if calls:
+            event_dispatcher._dispatch(
+                key, functools.partial(self._run_event_calls, calls)
+            )
+        return True
 
     def exec(self) -> int:
         with self._create_exec_context():
@@ -296,21 +924,12 @@ class AxServeEventLoop:
             try:
                 for handle_event in handle_events:
                     if handle_event.is_pong:
+                        self._close_early_ack_dispatcher()
                         return self._return_code
-                    with self._create_handle_event_context(handle_event):
-                        instance_id = handle_event.instance
-                        instance = self._instances_manager._get_instance(instance_id)
-                        if instance is None:
-                            continue
-                        ax = instance.__axserve__
-                        if ax is None:
-                            continue
-                        mm = ax._members_manager
-                        if mm is None:
-                            continue
-                        event_callback = mm._get_event(handle_event.index)
-                        args = [ValueFromVariant(arg) for arg in handle_event.arguments]
-                        event_callback(instance, *args)
+                    if handle_event.events:
+                        self._handle_event_frame(handle_event)
+                    elif not self._dispatch_event(handle_event):
+                        self._handle_event_in_context(handle_event)
             except grpc.RpcError as exc:
                 if not (
                     self._is_exitting
@@ -318,6 +937,8 @@ class AxServeEventLoop:
                     and exc.code() == grpc.StatusCode.CANCELLED
                 ):
                     raise exc
+            finally:
+                self._close_early_ack_dispatcher(wait=False)
         return self._return_code
 
     def is_running(self) -> bool:
@@ -351,10 +972,12 @@ class AxServeEventLoopManager:
         instances_manager: AxServeInstancesManager,
         event_context_manager: AxServeEventContextManager,
         event_stream_manager: AxServeEventStreamManager,
+        event_dispatcher: AxServeEventDispatcher | None = None,
     ):
         self._instances_manager = instances_manager
         self._event_context_manager = event_context_manager
         self._event_stream_manager = event_stream_manager
+        self._event_dispatcher = event_dispatcher
 
         self._event_loop: AxServeEventLoop | None = None
         self._event_loop_thread: Thread | None = None
@@ -387,6 +1010,7 @@ class AxServeEventLoopManager:
                 self._instances_manager,
                 self._event_context_manager,
                 self._event_stream_manager,
+                self._event_dispatcher,
             )
         if not self._event_loop_thread:
             self._event_loop_thread = Thread(
@@ -397,6 +1021,12 @@ class AxServeEventLoopManager:
     def is_running(self) -> bool:
         return self._event_loop.is_running() if self._event_loop is not None else False
 
+    def _has_failed(self) -> bool:
+        thread = self._event_loop_thread
+        return self._event_loop_exception is not None or (
+            thread is not None and not thread.is_alive()
+        )
+
     def stop(self) -> None:
         if self._event_loop:
             self._event_loop.exit()
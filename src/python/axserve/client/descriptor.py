@@ -20,8 +20,10 @@ from __future__ import annotations
 
 import functools
 import inspect
+import threading
 import typing
 
+from concurrent.futures import Future
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Concatenate
@@ -32,7 +34,11 @@ from typing import overload
 
 from wrapt import ObjectProxy
 
+from axserve.common.call import wrap_call_future
+from axserve.common.conflation import AxServeConflatedHandler
 from axserve.common.connectable import Connectable
+from axserve.common.event_handler import AxServeEarlyAckHandler
+from axserve.common.event_handler import AxServeEventHandlerWrapper
 from axserve.proto import active_pb2
 from axserve.proto.active_pb2_conversion import AnnotationFromTypeName
 from axserve.proto.active_pb2_conversion import ValueFromVariant
@@ -41,9 +47,14 @@ from axserve.proto.active_pb2_conversion import ValueToVariant
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Hashable
+    from collections.abc import Iterable
     from collections.abc import Sequence
 
+    from axserve.client.stub import AxServeClient
     from axserve.client.stub import AxServeObject
+    from axserve.common.method_cache import AxServeMethodCache
+    from axserve.common.property_cache import AxServePropertyCache
 
 
 T = TypeVar("T")
@@ -66,26 +77,72 @@ class AxServePropertyType(ObjectProxy, Generic[T]):
     def set(self, value: T) -> active_pb2.SetPropertyResponse:
         return self._self_prop.__set__(self._self_instance, value)
 
+    def future_get(self) -> Future[T]:
+        return self._self_prop._future_get(self._self_instance)
+
+    def future_set(self, value: T) -> Future[active_pb2.SetPropertyResponse]:
+        return self._self_prop._future_set(self._self_instance, value)
+
+    def invalidate(self) -> None:
+        cache = self._self_prop._get_property_cache(self._self_instance)
+        if cache is not None and self._self_prop._name:
+            cache.invalidate(self._self_prop._name)
+
 
 class AxServeProperty(Generic[T]):
     @overload
-    def __init__(self) -> None: ...
+    def __init__(
+        self,
+        *,
+        cache: bool = ...,
+        ttl: float | None = ...,
+        invalidated_by: Iterable[str] = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: int) -> None: ...
+    def __init__(
+        self,
+        arg: int,
+        *,
+        cache: bool = ...,
+        ttl: float | None = ...,
+        invalidated_by: Iterable[str] = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: active_pb2.PropertyInfo) -> None: ...
+    def __init__(
+        self,
+        arg: active_pb2.PropertyInfo,
+        *,
+        cache: bool = ...,
+        ttl: float | None = ...,
+        invalidated_by: Iterable[str] = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: Callable[[Any], T]) -> None: ...
+    def __init__(
+        self,
+        arg: Callable[[Any], T],
+        *,
+        cache: bool = ...,
+        ttl: float | None = ...,
+        invalidated_by: Iterable[str] = ...,
+    ) -> None: ...
 
     def __init__(
-        self, arg: int | active_pb2.PropertyInfo | Callable[[Any], T] | None = None
+        self,
+        arg: int | active_pb2.PropertyInfo | Callable[[Any], T] | None = None,
+        *,
+        cache: bool = False,
+        ttl: float | None = None,
+        invalidated_by: Iterable[str] = (),
     ) -> None:
         self._index: int | None = None
         self._name: str | None = None
         self._info: active_pb2.PropertyInfo | None = None
+        self._cache = cache or ttl is not None or bool(invalidated_by)
+        self._ttl = ttl
+        self._invalidated_by = list(invalidated_by)
 
         if isinstance(arg, int):
             self._index = arg
@@ -136,11 +193,9 @@ class AxServeProperty(Generic[T]):
             raise ValueError(msg)
         return index
 
-    def _get_value(
-        self,
-        instance: AxServeObject,
-        owner: type | None = None,  # noqa: ARG002
-    ) -> T:
+    def _make_get_request(
+        self, instance: AxServeObject
+    ) -> tuple[AxServeClient, active_pb2.GetPropertyRequest]:
         ax = instance.__axserve__
         if ax is None:
             msg = "Internal values are not initialized"
@@ -161,11 +216,110 @@ class AxServeProperty(Generic[T]):
         request = active_pb2.GetPropertyRequest()
         request.instance = instance_id
         request.index = index
+        return client, request
+
+    def _get_property_cache(
+        self, instance: AxServeObject
+    ) -> AxServePropertyCache | None:
+        if not self._cache:
+            return None
+        ax = instance.__axserve__
+        if ax is None:
+            return None
+        return ax._property_cache
+
+    def _connect_invalidating_events(
+        self, instance: AxServeObject, cache: AxServePropertyCache, name: str
+    ) -> None:
+        for event in self._invalidated_by:
+            if not cache._register_invalidation(event, name):
+                continue
+            try:
+                getattr(instance, event).connect(
+                    functools.partial(cache._invalidate_by_event, event)
+                )
+            except BaseException:
+                cache._unregister_invalidation(event, name)
+                raise
+
+    def _get_remote_value(
+        self, client: AxServeClient, request: active_pb2.GetPropertyRequest
+    ) -> T:
         client._event_context_manager._contextualize_request(request)
-        response = client._stub.GetProperty(request)
+        future = client._stream_call(request)
+        if future is not None:
+            return client._wait_call(future)
+        response = client._call_unary(client._stub.GetProperty, request)
         response = typing.cast(active_pb2.GetPropertyResponse, response)
         return ValueFromVariant(response.value)
 
+    def _get_value(
+        self,
+        instance: AxServeObject,
+        owner: type | None = None,  # noqa: ARG002
+    ) -> T:
+        client, request = self._make_get_request(instance)
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            return batch._add_request(request)  # type: ignore
+        cache = self._get_property_cache(instance)
+        if cache is None or not self._name:
+            return self._get_remote_value(client, request)
+        name = self._name
+        found, value = cache._lookup(name)
+        if found:
+            return value
+        self._connect_invalidating_events(instance, cache, name)
+        generation = cache._get_generation(name)
+        value = self._get_remote_value(client, request)
+        cache._store(name, value, self._ttl, generation)
+        return value
+
+    def _future_get(self, instance: AxServeObject) -> Future[T]:
+        client, request = self._make_get_request(instance)
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            return batch._add_request(request)
+        cache = self._get_property_cache(instance)
+        if cache is not None and self._name:
+            name = self._name
+            found, value = cache._lookup(name)
+            if found:
+                future: Future[T] = Future()
+                future.set_result(value)
+                return future
+            self._connect_invalidating_events(instance, cache, name)
+            generation = cache._get_generation(name)
+            future = self._future_get_remote_value(client, request)
+            future.add_done_callback(
+                functools.partial(self._store_future_result, cache, name, generation)
+            )
+            return future
+        return self._future_get_remote_value(client, request)
+
+    def _store_future_result(
+        self,
+        cache: AxServePropertyCache,
+        name: str,
+        generation: int,
+        future: Future[T],
+    ) -> None:
+        if not future.cancelled() and future.exception() is None:
+            cache._store(name, future.result(), self._ttl, generation)
+
+    def _future_get_remote_value(
+        self, client: AxServeClient, request: active_pb2.GetPropertyRequest
+    ) -> Future[T]:
+        client._event_context_manager._contextualize_request(request)
+        future = client._stream_call(request)
+        if future is not None:
+            return future
+        call_future = client._call_unary_future(client._stub.GetProperty, request)
+        return wrap_call_future(
+            call_future,
+            lambda response: ValueFromVariant(response.value),
+        )
+
     def _get(
         self,
         instance: AxServeObject | None = None,
@@ -175,11 +329,9 @@ class AxServeProperty(Generic[T]):
             return self
         return self._get_value(instance, owner)
 
-    def _set(
-        self,
-        instance: AxServeObject,
-        value: T,
-    ) -> active_pb2.SetPropertyResponse:
+    def _make_set_request(
+        self, instance: AxServeObject, value: T
+    ) -> tuple[AxServeClient, active_pb2.SetPropertyRequest]:
         ax = instance.__axserve__
         if ax is None:
             msg = "Internal values are not initialized"
@@ -201,10 +353,56 @@ class AxServeProperty(Generic[T]):
         request.instance = instance_id
         request.index = index
         ValueToVariant(value, request.value)
+        return client, request
+
+    def _set(
+        self,
+        instance: AxServeObject,
+        value: T,
+    ) -> active_pb2.SetPropertyResponse:
+        client, request = self._make_set_request(instance, value)
+        cache = self._get_property_cache(instance)
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            future = batch._add_request(request)
+            if cache is not None and self._name:
+                future.add_done_callback(functools.partial(self._invalidate, cache))
+            return future  # type: ignore
         client._event_context_manager._contextualize_request(request)
-        response = client._stub.SetProperty(request)
-        response = typing.cast(active_pb2.SetPropertyResponse, response)
-        return response
+        try:
+            future = client._stream_call(request)
+            if future is not None:
+                return client._wait_call(future)
+            response = client._call_unary(client._stub.SetProperty, request)
+            response = typing.cast(active_pb2.SetPropertyResponse, response)
+            return response
+        finally:
+            if cache is not None and self._name:
+                cache.invalidate(self._name)
+
+    def _invalidate(self, cache: AxServePropertyCache, *args) -> None:  # noqa: ARG002
+        if self._name:
+            cache.invalidate(self._name)
+
+    def _future_set(
+        self, instance: AxServeObject, value: T
+    ) -> Future[active_pb2.SetPropertyResponse]:
+        client, request = self._make_set_request(instance, value)
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            future = batch._add_request(request)
+        else:
+            client._event_context_manager._contextualize_request(request)
+            future = client._stream_call(request)
+            if future is None:
+                call_future = client._call_unary_future(
+                    client._stub.SetProperty, request
+                )
+                future = wrap_call_future(call_future, lambda response: response)
+        cache = self._get_property_cache(instance)
+        if cache is not None and self._name:
+            future.add_done_callback(functools.partial(self._invalidate, cache))
+        return future
 
     @overload
     def __get__(self, instance: Any, owner: type | None = None) -> T: ...
@@ -239,19 +437,54 @@ class AxServeMethodType(ObjectProxy, Generic[P, R]):
     def call(self, *args: P.args, **kwargs: P.kwargs) -> R:
         return self.__call__(*args, **kwargs)
 
+    def future(self, *args: P.args, **kwargs: P.kwargs) -> Future[R]:
+        return self._self_func._future(self._self_instance, *args, **kwargs)
+
+    def cache_clear(self) -> None:
+        ax = self._self_instance.__axserve__
+        if ax is not None and ax._method_cache is not None and self._self_func._name:
+            ax._method_cache.clear(self._self_func._name)
+
 
 class AxServeMethod(Generic[P, R]):
     @overload
-    def __init__(self) -> None: ...
+    def __init__(
+        self,
+        *,
+        cache: bool = ...,
+        cache_size: int | None = ...,
+        ttl: float | None = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: int) -> None: ...
+    def __init__(
+        self,
+        arg: int,
+        *,
+        cache: bool = ...,
+        cache_size: int | None = ...,
+        ttl: float | None = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: active_pb2.MethodInfo) -> None: ...
+    def __init__(
+        self,
+        arg: active_pb2.MethodInfo,
+        *,
+        cache: bool = ...,
+        cache_size: int | None = ...,
+        ttl: float | None = ...,
+    ) -> None: ...
 
     @overload
-    def __init__(self, arg: Callable[Concatenate[Any, P], R]) -> None: ...
+    def __init__(
+        self,
+        arg: Callable[Concatenate[Any, P], R],
+        *,
+        cache: bool = ...,
+        cache_size: int | None = ...,
+        ttl: float | None = ...,
+    ) -> None: ...
 
     def __init__(
         self,
@@ -259,11 +492,19 @@ class AxServeMethod(Generic[P, R]):
         | active_pb2.MethodInfo
         | Callable[Concatenate[Any, P], R]
         | None = None,
+        *,
+        cache: bool = False,
+        cache_size: int | None = 128,
+        ttl: float | None = None,
     ) -> None:
         self._index: int | None = None
         self._name: str | None = None
         self._signature: inspect.Signature | None = None
+        self._arity: int | None = None
         self._info: active_pb2.MethodInfo | None = None
+        self._cache = cache or ttl is not None
+        self._cache_size = cache_size
+        self._ttl = ttl
 
         if isinstance(arg, int):
             self._index = arg
@@ -272,7 +513,7 @@ class AxServeMethod(Generic[P, R]):
         elif callable(arg):
             functools.update_wrapper(self, arg)
             self._name = arg.__name__
-            self._signature = inspect.signature(functools.partial(arg, None))
+            self._set_signature(inspect.signature(functools.partial(arg, None)))
         elif arg is not None:
             msg = f"Invalid argument: {arg!r}"
             raise ValueError(msg)
@@ -283,7 +524,7 @@ class AxServeMethod(Generic[P, R]):
     def _set_info(self, info: active_pb2.MethodInfo) -> None:
         self._index = info.index
         self._name = info.name
-        self._signature = inspect.Signature(
+        signature = inspect.Signature(
             parameters=[
                 inspect.Parameter(
                     name=arg.name,
@@ -294,8 +535,21 @@ class AxServeMethod(Generic[P, R]):
             ],
             return_annotation=AnnotationFromTypeName(info.return_type),
         )
+        self._set_signature(signature)
         self._info = info
 
+    def _set_signature(self, signature: inspect.Signature) -> None:
+        self._signature = signature
+        self._arity = len(signature.parameters)
+        positional_kinds = {
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        }
+        for param in signature.parameters.values():
+            if param.kind not in positional_kinds:
+                self._arity = None
+                break
+
     def _get_index(self, instance: AxServeObject) -> int:
         index = self._index
         if index is not None:
@@ -329,11 +583,38 @@ class AxServeMethod(Generic[P, R]):
     def _bind_args(self, *args, **kwargs) -> Sequence[Any]:
         if not self._signature:
             return args
+        if not kwargs and len(args) == self._arity:
+            return args
         bound_args = self._signature.bind(*args, **kwargs)
         bound_args.apply_defaults()
         return bound_args.args
 
-    def __call__(self, instance: AxServeObject, *args: P.args, **kwargs: P.kwargs) -> R:
+    def _get_method_cache(self, instance: AxServeObject) -> AxServeMethodCache | None:
+        if not (self._cache and self._name):
+            return None
+        ax = instance.__axserve__
+        if ax is None:
+            return None
+        client = ax._client
+        if (
+            client is not None
+            and client._batch_manager._get_current_batch() is not None
+        ):
+            return None
+        return ax._method_cache
+
+    @classmethod
+    def _make_cache_key(cls, bound_args: Sequence[Any]) -> Any:
+        key = tuple((type(arg), arg) for arg in bound_args)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _make_request(
+        self, instance: AxServeObject, bound_args: Sequence[Any]
+    ) -> tuple[AxServeClient, active_pb2.InvokeMethodRequest]:
         ax = instance.__axserve__
         if ax is None:
             msg = "Internal values are not initialized"
@@ -347,14 +628,89 @@ class AxServeMethod(Generic[P, R]):
         request = active_pb2.InvokeMethodRequest()
         request.instance = instance_id
         request.index = index
-        bound_args = self._bind_args(*args, **kwargs)
         for arg in bound_args:
             ValueToVariant(arg, request.arguments.add())
+        return client, request
+
+    def __call__(self, instance: AxServeObject, *args: P.args, **kwargs: P.kwargs) -> R:
+        bound_args = self._bind_args(*args, **kwargs)
+        cache = self._get_method_cache(instance)
+        key = self._make_cache_key(bound_args) if cache is not None else None
+        if cache is None or key is None:
+            return self._invoke(instance, bound_args)
+        name = typing.cast(str, self._name)
+        found, value = cache._lookup(name, key)
+        if found:
+            return value
+        generation = cache._get_generation(name)
+        value = self._invoke(instance, bound_args)
+        cache._store(name, key, value, self._cache_size, self._ttl, generation)
+        return value
+
+    def _invoke(self, instance: AxServeObject, bound_args: Sequence[Any]) -> R:
+        client, request = self._make_request(instance, bound_args)
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            return batch._add_request(request)  # type: ignore
         client._event_context_manager._contextualize_request(request)
-        response = client._stub.InvokeMethod(request)
+        future = client._stream_call(request)
+        if future is not None:
+            return client._wait_call(future)
+        response = client._call_unary(client._stub.InvokeMethod, request)
         response = typing.cast(active_pb2.InvokeMethodResponse, response)
         return ValueFromVariant(response.return_value)
 
+    def _future(
+        self, instance: AxServeObject, *args: P.args, **kwargs: P.kwargs
+    ) -> Future[R]:
+        bound_args = self._bind_args(*args, **kwargs)
+        cache = self._get_method_cache(instance)
+        key = self._make_cache_key(bound_args) if cache is not None else None
+        if cache is None or key is None:
+            return self._future_invoke(instance, bound_args)
+        name = typing.cast(str, self._name)
+        found, value = cache._lookup(name, key)
+        if found:
+            future: Future[R] = Future()
+            future.set_result(value)
+            return future
+        generation = cache._get_generation(name)
+        future = self._future_invoke(instance, bound_args)
+        future.add_done_callback(
+            functools.partial(self._store_future_result, cache, name, key, generation)
+        )
+        return future
+
+    def _store_future_result(
+        self,
+        cache: AxServeMethodCache,
+        name: str,
+        key: Any,
+        generation: int,
+        future: Future[R],
+    ) -> None:
+        if not future.cancelled() and future.exception() is None:
+            cache._store(
+                name, key, future.result(), self._cache_size, self._ttl, generation
+            )
+
+    def _future_invoke(
+        self, instance: AxServeObject, bound_args: Sequence[Any]
+    ) -> Future[R]:
+        client, request = self._make_request(instance, bound_args)
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            return batch._add_request(request)
+        client._event_context_manager._contextualize_request(request)
+        future = client._stream_call(request)
+        if future is not None:
+            return future
+        call_future = client._call_unary_future(client._stub.InvokeMethod, request)
+        return wrap_call_future(
+            call_future,
+            lambda response: ValueFromVariant(response.return_value),
+        )
+
     @overload
     def __get__(
         self, instance: Any, owner: type | None = None
@@ -373,6 +729,97 @@ class AxServeMethod(Generic[P, R]):
         return AxServeMethodType(self, instance)
 
 
+class AxServePreparedMethod(Generic[P, R]):
+    def __init__(
+        self,
+        method: AxServeMethod[P, R],
+        instance: AxServeObject,
+        *,
+        validate: bool = True,
+    ) -> None:
+        ax = instance.__axserve__
+        if ax is None:
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        client = ax._client
+        instance_id = ax._instance
+        if not (client and instance_id):
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        self._method = method
+        self._client = client
+        self._internals = ax
+        self._validate = validate and method._signature is not None
+        self._template = active_pb2.InvokeMethodRequest()
+        self._template.index = method._get_index(instance)
+        self._thread_local = threading.local()
+
+    def _get_request(self) -> active_pb2.InvokeMethodRequest:
+        thread_local = self._thread_local
+        request = getattr(thread_local, "request", None)
+        instance_id = self._internals._instance
+        if request is None or thread_local.instance_id is not instance_id:
+            if instance_id is None:
+                msg = "Internal values are not initialized"
+                raise ValueError(msg)
+            request = active_pb2.InvokeMethodRequest()
+            request.CopyFrom(self._template)
+            request.instance = instance_id
+            thread_local.request = request
+            thread_local.instance_id = instance_id
+        return request
+
+    def _fill_request(self, args, kwargs) -> active_pb2.InvokeMethodRequest:
+        if self._validate:
+            args = self._method._bind_args(*args, **kwargs)
+        elif kwargs:
+            msg = "Keyword arguments require signature validation"
+            raise TypeError(msg)
+        request = self._get_request()
+        arguments = request.arguments
+        del arguments[:]
+        for arg in args:
+            ValueToVariant(arg, arguments.add())
+        context_manager = self._client._event_context_manager
+        if context_manager._get_current_handle_event() is None:
+            request.ClearField("context")
+        else:
+            context_manager._contextualize_request(request)
+        return request
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        client = self._client
+        request = self._fill_request(args, kwargs)
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            batch_request = active_pb2.InvokeMethodRequest()
+            batch_request.CopyFrom(request)
+            return batch._add_request(batch_request)  # type: ignore
+        future = client._stream_call(request)
+        if future is not None:
+            return client._wait_call(future)
+        response = client._call_unary(client._stub.InvokeMethod, request)
+        response = typing.cast(active_pb2.InvokeMethodResponse, response)
+        return ValueFromVariant(response.return_value)
+
+    def future(self, *args: P.args, **kwargs: P.kwargs) -> Future[R]:
+        client = self._client
+        request = self._fill_request(args, kwargs)
+        batch = client._batch_manager._get_current_batch()
+        if batch is not None:
+            batch_request = active_pb2.InvokeMethodRequest()
+            batch_request.CopyFrom(request)
+            return batch._add_request(batch_request)
+        future = client._stream_call(request)
+        if future is not None:
+            return future
+        call_future = client._call_unary_future(client._stub.InvokeMethod, request)
+        return wrap_call_future(
+            call_future,
+            lambda response: ValueFromVariant(response.return_value),
+        )
+
+
 class AxServeEventType(
     ObjectProxy,
     Connectable[
@@ -394,8 +841,17 @@ class AxServeEventType(
         return self.__call__(*args, **kwargs)
 
     def connect(
-        self, handler: Callable[P, Any]
+        self,
+        handler: Callable[P, Any],
+        *,
+        conflate: Callable[P, Hashable] | None = None,
+        max_rate: float | None = None,
+        early_ack: bool = False,
     ) -> active_pb2.ConnectEventResponse | None:
+        if conflate is not None or max_rate is not None:
+            handler = AxServeConflatedHandler(handler, conflate, max_rate)
+        elif early_ack:
+            handler = AxServeEarlyAckHandler(handler)
         response = None
         instance = self._self_instance
         ax = instance.__axserve__
@@ -417,7 +873,8 @@ class AxServeEventType(
                 request.instance = instance_id
                 request.index = index
                 client._event_context_manager._contextualize_request(request)
-                response = client._stub.ConnectEvent(request)
+                timeout = client._call_options_manager._get_timeout()
+                response = client._stub.ConnectEvent(request, timeout=timeout)
                 response = typing.cast(active_pb2.ConnectEventResponse, response)
                 if not response.successful:
                     msg = "Failed to connect event"
@@ -444,19 +901,37 @@ class AxServeEventType(
         handlers = handlers_manager._get_event_handlers(index)
         handlers_lock = handlers_manager._get_event_handlers_lock(index)
         with handlers_lock:
-            handlers.remove(handler)
+            removed = handlers.pop(handlers.index(handler))
+            if isinstance(removed, AxServeEventHandlerWrapper):
+                removed.close()
             if not handlers:
                 request = active_pb2.DisconnectEventRequest()
                 request.instance = instance_id
                 request.index = index
                 client._event_context_manager._contextualize_request(request)
-                response = client._stub.DisconnectEvent(request)
+                timeout = client._call_options_manager._get_timeout()
+                response = client._stub.DisconnectEvent(request, timeout=timeout)
                 response = typing.cast(active_pb2.DisconnectEventResponse, response)
                 if not response.successful:
                     msg = "Failed to disconnect event"
                     raise RuntimeError(msg)
         return response
 
+    def get_conflated_handler(
+        self, handler: Callable[P, Any]
+    ) -> AxServeConflatedHandler[P] | None:
+        instance = self._self_instance
+        ax = instance.__axserve__
+        handlers_manager = ax._event_handlers_manager if ax else None
+        if not handlers_manager:
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        index = self._self_func._get_index(instance)
+        for item in list(handlers_manager._get_event_handlers(index)):
+            if isinstance(item, AxServeConflatedHandler) and item == handler:
+                return item
+        return None
+
 
 class AxServeEvent(Generic[P]):
     @overload
@@ -543,9 +1018,7 @@ class AxServeEvent(Generic[P]):
             raise ValueError(msg)
         return index
 
-    def __call__(
-        self, instance: AxServeObject, *args: P.args, **kwargs: P.kwargs
-    ) -> None:
+    def _get_handlers(self, instance: AxServeObject) -> list[Callable]:
         ax = instance.__axserve__
         if ax is None:
             msg = "Internal values are not initialized"
@@ -558,8 +1031,12 @@ class AxServeEvent(Generic[P]):
         handlers = handlers_manager._get_event_handlers(index)
         handlers_lock = handlers_manager._get_event_handlers_lock(index)
         with handlers_lock:
-            handlers = list(handlers)
-        for handler in handlers:
+            return list(handlers)
+
+    def __call__(
+        self, instance: AxServeObject, *args: P.args, **kwargs: P.kwargs
+    ) -> None:
+        for handler in self._get_handlers(instance):
             handler(*args, **kwargs)
 
     @overload
@@ -620,16 +1097,32 @@ class AxServeMemberType(
     def set(self, value: T) -> active_pb2.SetPropertyResponse:
         return self.prop.set(value)
 
+    def future_get(self) -> Future[T]:
+        return self.prop.future_get()
+
+    def future_set(self, value: T) -> Future[active_pb2.SetPropertyResponse]:
+        return self.prop.future_set(value)
+
     def __call__(self, *args, **kwargs) -> R | None:
         return self._self_mem(self._self_instance, *args, **kwargs)
 
     def call(self, *args, **kwargs) -> R | None:
         return self.__call__(*args, **kwargs)
 
+    def future(self, *args, **kwargs) -> Future[R]:
+        return self.method.future(*args, **kwargs)
+
     def connect(
-        self, handler: Callable[Q, Any]
+        self,
+        handler: Callable[Q, Any],
+        *,
+        conflate: Callable[Q, Hashable] | None = None,
+        max_rate: float | None = None,
+        early_ack: bool = False,
     ) -> active_pb2.ConnectEventResponse | None:
-        return self.event.connect(handler)
+        return self.event.connect(
+            handler, conflate=conflate, max_rate=max_rate, early_ack=early_ack
+        )
 
     def disconnect(
         self, handler: Callable[Q, Any]
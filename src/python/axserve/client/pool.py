@@ -0,0 +1,368 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import time
+
+from collections import deque
+from threading import Condition
+from threading import Lock
+from typing import TYPE_CHECKING
+from typing import Any
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from types import TracebackType
+
+
+logger = logging.getLogger(__name__)
+
+
+POOL_POLICIES = ["least_loaded", "ewma"]
+
+
+class AxServeServerPool:
+    _clients: list[AxServeClient]
+    _managed_clients: list[AxServeClient]
+    _policy: str
+    _alpha: float
+    _pending: list[int]
+    _latencies: list[float]
+    _lock: Lock
+
+    def __init__(
+        self,
+        size: int | None = None,
+        *,
+        machine: str | None = None,
+        transport: str = "tcp",
+        policy: str = "least_loaded",
+        alpha: float = 0.2,
+        clients: Iterable[AxServeClient] | None = None,
+    ) -> None:
+        if policy not in POOL_POLICIES:
+            msg = f"Unknown pool policy: {policy}"
+            raise ValueError(msg)
+        self._managed_clients = []
+        if clients is None:
+            if not size:
+                size = os.cpu_count() or 1
+            try:
+                for _ in range(size):
+                    client = AxServeClient._spawn(machine, transport)
+                    self._managed_clients.append(client)
+            except BaseException:
+                self.close()
+                raise
+            clients = self._managed_clients
+        self._clients = list(clients)
+        if not self._clients:
+            msg = "Server pool needs at least one client"
+            raise ValueError(msg)
+        self._policy = policy
+        self._alpha = alpha
+        self._pending = [0] * len(self._clients)
+        self._latencies = [0.0] * len(self._clients)
+        self._lock = Lock()
+
+    @property
+    def clients(self) -> list[AxServeClient]:
+        return list(self._clients)
+
+    @property
+    def latencies(self) -> list[float]:
+        with self._lock:
+            return list(self._latencies)
+
+    def _get_load(self, index: int) -> int:
+        client = self._clients[index]
+        return client._instances_manager._count_instances() + self._pending[index]
+
+    def _get_score(self, index: int) -> tuple[float, int]:
+        load = self._get_load(index)
+        if self._policy == "ewma":
+            return ((load + 1) * self._latencies[index], load)
+        return (load, load)
+
+    def _acquire_index(self) -> int:
+        with self._lock:
+            index = min(range(len(self._clients)), key=self._get_score)
+            self._pending[index] += 1
+            return index
+
+    def _observe_index(self, index: int, latency: float) -> None:
+        if self._latencies[index]:
+            latency = self._alpha * latency + (1 - self._alpha) * self._latencies[index]
+        self._latencies[index] = latency
+
+    def _release_index(self, index: int, latency: float) -> None:
+        with self._lock:
+            self._pending[index] -= 1
+            self._observe_index(index, latency)
+
+    def observe(self, client: AxServeClient, latency: float) -> None:
+        index = self._clients.index(client)
+        with self._lock:
+            self._observe_index(index, latency)
+
+    def select(self) -> AxServeClient:
+        with self._lock:
+            index = min(range(len(self._clients)), key=self._get_score)
+            return self._clients[index]
+
+    def create(self, c: str | type[AxServeObject]) -> AxServeObject:
+        index = self._acquire_index()
+        client = self._clients[index]
+        start_time = time.perf_counter()
+        try:
+            if isinstance(c, type):
+                return c(client=client)
+            return AxServeObject(c, client=client)
+        finally:
+            self._release_index(index, time.perf_counter() - start_time)
+
+    def close(self, timeout: float | None = None) -> None:
+        for client in self._managed_clients:
+            client.close(timeout)
+        self._managed_clients.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class AxServeObjectPool:
+    _c: str | type[AxServeObject]
+    _client: AxServeClient | AxServeServerPool | None
+    _min_size: int
+    _max_size: int | None
+    _init: Callable[[AxServeObject], Any] | None
+    _reset: Callable[[AxServeObject], Any] | None
+    _check: Callable[[AxServeObject], bool] | None
+    _idle_timeout: float | None
+
+    _idle: deque[tuple[AxServeObject, float]]
+    _size: int
+    _closed: bool
+    _condition: Condition
+
+    def __init__(
+        self,
+        c: str | type[AxServeObject],
+        min_size: int = 0,
+        max_size: int | None = None,
+        *,
+        client: AxServeClient | AxServeServerPool | None = None,
+        init: Callable[[AxServeObject], Any] | None = None,
+        reset: Callable[[AxServeObject], Any] | None = None,
+        check: Callable[[AxServeObject], bool] | None = None,
+        idle_timeout: float | None = None,
+    ) -> None:
+        if max_size is not None and max_size < max(min_size, 1):
+            msg = f"Invalid pool sizes: min_size={min_size}, max_size={max_size}"
+            raise ValueError(msg)
+        self._c = c
+        self._client = client
+        self._min_size = min_size
+        self._max_size = max_size
+        self._init = init
+        self._reset = reset
+        self._check = check
+        self._idle_timeout = idle_timeout
+        self._idle = deque()
+        self._size = 0
+        self._closed = False
+        self._condition = Condition()
+        try:
+            for _ in range(min_size):
+                with self._condition:
+                    self._size += 1
+                o = self._create()
+                with self._condition:
+                    self._idle.append((o, time.monotonic()))
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle_size(self) -> int:
+        return len(self._idle)
+
+    def _create(self) -> AxServeObject:
+        try:
+            if isinstance(self._client, AxServeServerPool):
+                o = self._client.create(self._c)
+            elif isinstance(self._c, type):
+                o = self._c(client=self._client)
+            else:
+                o = AxServeObject(self._c, client=self._client)
+            if self._init:
+                try:
+                    self._init(o)
+                except BaseException:
+                    o.__finalize__()
+                    raise
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        return o
+
+    def _destroy(self, o: AxServeObject) -> None:
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+        try:
+            o.__finalize__()
+        except Exception:
+            logger.exception("Failed to destroy a pooled axserve object")
+
+    def _is_healthy(self, o: AxServeObject) -> bool:
+        ax = o.__axserve__
+        if not (
+            ax
+            and (client := ax._client)
+            and (instance := ax._instance)
+            and client._instances_manager._has_instance(instance)
+        ):
+            return False
+        if self._check is None:
+            return True
+        try:
+            return bool(self._check(o))
+        except Exception:
+            logger.exception("Health check of a pooled axserve object failed")
+            return False
+
+    def _pop_expired(self) -> list[AxServeObject]:
+        expired = []
+        if self._idle_timeout is None:
+            return expired
+        deadline = time.monotonic() - self._idle_timeout
+        while (
+            self._idle
+            and self._idle[0][1] <= deadline
+            and self._size - len(expired) > self._min_size
+        ):
+            expired.append(self._idle.popleft()[0])
+        return expired
+
+    def evict_idle(self) -> int:
+        with self._condition:
+            expired = self._pop_expired()
+        for o in expired:
+            self._destroy(o)
+        return len(expired)
+
+    def acquire(self, timeout: float | None = None) -> AxServeObject:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._condition:
+                if self._closed:
+                    msg = "Object pool is closed"
+                    raise RuntimeError(msg)
+                expired = self._pop_expired()
+                o = None
+                if self._idle:
+                    o = self._idle.pop()[0]
+                elif self._max_size is None or self._size < self._max_size:
+                    self._size += 1
+                else:
+                    remaining = (
+                        deadline - time.monotonic() if deadline is not None else None
+                    )
+                    if remaining is not None and remaining <= 0:
+                        msg = "Timed out waiting for a pooled axserve object"
+                        raise TimeoutError(msg)
+                    self._condition.wait(remaining)
+                    continue
+            for e in expired:
+                self._destroy(e)
+            if o is None:
+                return self._create()
+            if self._is_healthy(o):
+                return o
+            self._destroy(o)
+
+    def release(self, o: AxServeObject) -> None:
+        if self._reset:
+            try:
+                self._reset(o)
+            except Exception:
+                logger.exception("Failed to reset a pooled axserve object")
+                self._destroy(o)
+                return
+        with self._condition:
+            if not self._closed:
+                self._idle.append((o, time.monotonic()))
+                self._condition.notify()
+                return
+        self._destroy(o)
+
+    def discard(self, o: AxServeObject) -> None:
+        self._destroy(o)
+
+    @contextlib.contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[AxServeObject]:
+        o = self.acquire(timeout)
+        try:
+            yield o
+        finally:
+            self.release(o)
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle = [o for o, _ in self._idle]
+            self._idle.clear()
+            self._condition.notify_all()
+        for o in idle:
+            self._destroy(o)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
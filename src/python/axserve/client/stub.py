@@ -18,45 +18,81 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import functools
 import platform
 import time
 import typing
 
 from threading import RLock
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import ClassVar
+from typing import TypeVar
 
 import grpc
 
 from grpc import Channel
 
+from axserve.client.component import AxServeBatch
+from axserve.client.component import AxServeBatchManager
+from axserve.client.component import AxServeCallOptions
+from axserve.client.component import AxServeCallOptionsManager
+from axserve.client.component import AxServeCallStreamManager
+from axserve.client.component import AxServeDestroyQueue
 from axserve.client.component import AxServeEventContextManager
+from axserve.client.component import AxServeEventDispatcher
 from axserve.client.component import AxServeEventHandlersManager
 from axserve.client.component import AxServeEventLoopManager
 from axserve.client.component import AxServeEventStreamManager
 from axserve.client.component import AxServeInstancesManager
 from axserve.client.component import AxServeMembersManager
 from axserve.client.component import AxServeMembersManagerCache
+from axserve.client.descriptor import AxServeEventType
 from axserve.client.descriptor import AxServeMemberType
+from axserve.client.descriptor import AxServeMethod
+from axserve.client.descriptor import AxServePreparedMethod
+from axserve.client.descriptor import AxServeProperty
+from axserve.client.supervisor import AxServeSupervisor
+from axserve.common.call import AxServeCallError
+from axserve.common.call import add_batch_request_item
+from axserve.common.call import get_response_item_result_or_error
+from axserve.common.describe_cache import AxServeDescribeCache
+from axserve.common.describe_cache import get_describe_cache
+from axserve.common.method_cache import AxServeMethodCache
+from axserve.common.property_cache import AxServePropertyCache
 from axserve.common.registry import check_machine_for_clsid
-from axserve.common.socket import find_free_port
+from axserve.common.socket import make_local_address
 from axserve.proto import active_pb2
+from axserve.proto.active_pb2_conversion import ValueFromVariant
 from axserve.proto.active_pb2_grpc import ActiveStub
 from axserve.server.process import AxServeServerProcess
+from axserve.server.process import get_warm_pool
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
     from collections.abc import Iterable
+    from collections.abc import Mapping
     from collections.abc import MutableMapping
+    from concurrent.futures import Future
     from types import TracebackType
 
 
+T = TypeVar("T")
+
+
 class AxServeObjectInternals:
     _clsid: str | None = None
     _client: AxServeClient | None = None
     _instance: str | None = None
     _members_manager: AxServeMembersManager | None = None
     _event_handlers_manager: AxServeEventHandlersManager | None = None
+    _property_cache: AxServePropertyCache | None = None
+    _method_cache: AxServeMethodCache | None = None
+    _initial_properties: dict[str, Any]
 
     def __init__(
         self,
@@ -66,6 +102,7 @@ class AxServeObjectInternals:
     ) -> None:
         self._clsid = c
         self._client = client
+        self._initial_properties = {}
 
     @property
     def clsid(self) -> str:
@@ -102,30 +139,38 @@ class AxServeObjectInternals:
             raise ValueError(msg)
         return self._event_handlers_manager
 
+    @property
+    def property_cache(self) -> AxServePropertyCache:
+        if self._property_cache is None:
+            msg = "Property cache is not set"
+            raise ValueError(msg)
+        return self._property_cache
+
+    @property
+    def method_cache(self) -> AxServeMethodCache:
+        if self._method_cache is None:
+            msg = "Method cache is not set"
+            raise ValueError(msg)
+        return self._method_cache
+
 
 class AxServeClientStore:
-    _clients: MutableMapping[str, AxServeClient]
+    _clients: MutableMapping[tuple[str, str], AxServeClient]
     _clients_lock: RLock
 
     def __init__(self):
         self._clients = {}
         self._clients_lock = RLock()
 
-    def instance(self, machine: str | None = None):
+    def instance(self, machine: str | None = None, transport: str = "tcp"):
         if not machine:
             machine = platform.machine()
-        if machine not in self._clients:
+        key = (machine, transport)
+        if key not in self._clients:
             with self._clients_lock:
-                if machine not in self._clients:
-                    port = find_free_port()
-                    address = f"localhost:{port}"
-                    process = AxServeServerProcess(address, machine=machine)
-                    channel = grpc.insecure_channel(address)
-                    client = AxServeClient(channel)
-                    client._managed_channel = channel
-                    client._managed_process = process
-                    self._clients[machine] = client
-        client = self._clients[machine]
+                if key not in self._clients:
+                    self._clients[key] = AxServeClient._spawn(machine, transport)
+        client = self._clients[key]
         return client
 
 
@@ -139,35 +184,84 @@ class AxServeClient:
 
     _instances_manager: AxServeInstancesManager
     _event_context_manager: AxServeEventContextManager
+    _batch_manager: AxServeBatchManager
+    _call_options_manager: AxServeCallOptionsManager
     _members_managers: AxServeMembersManagerCache
     _event_stream_manager: AxServeEventStreamManager | None = None
     _event_loop_manager: AxServeEventLoopManager | None = None
+    _call_stream_manager: AxServeCallStreamManager | None = None
+    _destroy_queue: AxServeDestroyQueue | None = None
 
     _managed_channel: Channel | None = None
     _managed_process: AxServeServerProcess | None = None
+    _managed_spawn_args: tuple[str | None, str] | None = None
+    _supervisor: AxServeSupervisor | None = None
 
     @classmethod
-    def instance(cls, machine: str | None = None):
-        return cls._instances_store.instance(machine)
+    def instance(cls, machine: str | None = None, transport: str = "tcp"):
+        return cls._instances_store.instance(machine, transport)
+
+    @classmethod
+    def _spawn(cls, machine: str | None = None, transport: str = "tcp"):
+        process, channel = cls._spawn_process(machine, transport)
+        try:
+            client = cls(channel)
+        except BaseException:
+            channel.close()
+            process.terminate()
+            process.wait()
+            raise
+        client._managed_channel = channel
+        client._managed_process = process
+        client._managed_spawn_args = (machine, transport)
+        return client
+
+    @staticmethod
+    def _spawn_process(
+        machine: str | None = None, transport: str = "tcp"
+    ) -> tuple[AxServeServerProcess, Channel]:
+        if pool := get_warm_pool(machine, transport):
+            return pool.acquire()
+        address = make_local_address(transport)
+        process = AxServeServerProcess(address, machine=machine)
+        channel = grpc.insecure_channel(process.address)
+        return process, channel
 
     def __init__(
         self,
         channel: Channel,
         timeout: float | None = None,
+        *,
+        call_stream: bool = False,
+        call_timeout: float | None = None,
+        describe_cache: AxServeDescribeCache | None = None,
+        deferred_destroy: bool = False,
+        event_dispatcher: AxServeEventDispatcher | None = None,
+        batch_events: bool = False,
     ) -> None:
         if not timeout:
             timeout = 15
+        if describe_cache is None:
+            describe_cache = get_describe_cache()
 
         self._channel = channel
         self._timeout = timeout
+        self._call_stream = call_stream
+        self._event_dispatcher = event_dispatcher
+        self._batch_events = batch_events
 
         self._stub = ActiveStub(channel)
         self._instances_manager = AxServeInstancesManager()
         self._event_context_manager = AxServeEventContextManager()
+        self._batch_manager = AxServeBatchManager()
+        self._call_options_manager = AxServeCallOptionsManager(call_timeout)
         self._members_managers = AxServeMembersManagerCache(
             self._stub,
             self._event_context_manager,
+            describe_cache,
         )
+        if deferred_destroy:
+            self._destroy_queue = AxServeDestroyQueue(self._destroy_instances)
 
         self.__enter__()
 
@@ -186,12 +280,98 @@ class AxServeClient:
         response = typing.cast(active_pb2.DestroyResponse, response)
         return response.successful
 
+    def _destroy_instances(self, instances: list[str]) -> list[Any]:
+        requests = []
+        for i in instances:
+            request = active_pb2.DestroyRequest()
+            request.instance = i
+            requests.append(request)
+        return [
+            result if isinstance(result, AxServeCallError) else result.successful
+            for result in self._execute_batch_items(requests)
+        ]
+
+    def _schedule_destroy_instance(self, i: str) -> None:
+        if self._destroy_queue is not None and self._destroy_queue._put(i):
+            return
+        self._destroy_instance(i)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        if self._destroy_queue is None:
+            return True
+        return self._destroy_queue._flush(timeout)
+
+    def _get_properties(self, i: str, indexes: Iterable[int]) -> list[Any]:
+        request = active_pb2.GetPropertiesRequest()
+        request.instance = i
+        request.indexes.extend(indexes)
+        self._event_context_manager._contextualize_request(request)
+        response = self._call_unary(self._stub.GetProperties, request)
+        response = typing.cast(active_pb2.GetPropertiesResponse, response)
+        return [ValueFromVariant(value) for value in response.values]
+
+    def _get_call_stream_manager(self) -> AxServeCallStreamManager | None:
+        call_stream_manager = self._call_stream_manager
+        if (
+            call_stream_manager is None
+            or not call_stream_manager._is_call_stream_available()
+            or self._call_options_manager._get_key() is not None
+            or self._call_options_manager._get_timeout() is not None
+        ):
+            return None
+        return call_stream_manager
+
+    def _stream_call(self, request: Any) -> Future | None:
+        call_stream_manager = self._get_call_stream_manager()
+        if call_stream_manager is None:
+            return None
+        return call_stream_manager._call(request)
+
+    def _wait_call(self, future: Future[T]) -> T:
+        timeout = self._call_options_manager._get_timeout()
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            msg = "Deadline Exceeded"
+            raise AxServeCallError(grpc.StatusCode.DEADLINE_EXCEEDED, msg) from None
+
+    def _call_unary(self, method: grpc.UnaryUnaryMultiCallable, request: Any) -> Any:
+        timeout = self._call_options_manager._get_timeout()
+        key = self._call_options_manager._get_key()
+        if key is None:
+            return method(request, timeout=timeout)
+        call_future = method.future(request, timeout=timeout)
+        self._call_options_manager._supersede(key, call_future)
+        try:
+            return call_future.result()
+        finally:
+            self._call_options_manager._release(key, call_future)
+
+    def _call_unary_future(
+        self, method: grpc.UnaryUnaryMultiCallable, request: Any
+    ) -> grpc.Future:
+        timeout = self._call_options_manager._get_timeout()
+        key = self._call_options_manager._get_key()
+        call_future = method.future(request, timeout=timeout)
+        if key is not None:
+            self._call_options_manager._supersede(key, call_future)
+            call_future.add_done_callback(
+                functools.partial(self._call_options_manager._release, key)
+            )
+        return call_future
+
     def _create_internals(
-        self, c: str, internals: AxServeObjectInternals | None = None
+        self,
+        c: str,
+        internals: AxServeObjectInternals | None = None,
+        i: str | None = None,
     ) -> AxServeObjectInternals:
-        i = self._create_instance(c)
+        if i is None:
+            i = self._create_instance(c)
         members_manager = self._members_managers._get_members_manager(c, i)
         event_handlers_manager = AxServeEventHandlersManager()
+        property_cache = AxServePropertyCache()
+        method_cache = AxServeMethodCache()
         if not internals:
             internals = AxServeObjectInternals()
         internals._instance = i
@@ -199,11 +379,15 @@ class AxServeClient:
         internals._client = self
         internals._members_manager = members_manager
         internals._event_handlers_manager = event_handlers_manager
+        internals._property_cache = property_cache
+        internals._method_cache = method_cache
         return internals
 
-    def _initialize_internals(self, o: AxServeObject, c: str) -> None:
+    def _initialize_internals(
+        self, o: AxServeObject, c: str, instance: str | None = None
+    ) -> None:
         i = o.__axserve__
-        i = self._create_internals(c, i)
+        i = self._create_internals(c, i, instance)
         o.__dict__["__axserve__"] = i  # skip __setattr__
         instance = typing.cast(str, i._instance)
         self._instances_manager._register_instance(instance, o)
@@ -222,14 +406,254 @@ class AxServeClient:
             msg = "Failed to destroy the axserve object"
             raise RuntimeError(msg)
 
-    def close(self, timeout: float | None = None) -> None:
-        start_time = time.time()
+    def _execute_batch_items(self, requests: list[Any]) -> list[Any]:
+        if not requests:
+            return []
+        batch_request = active_pb2.BatchRequest()
+        for request in requests:
+            add_batch_request_item(batch_request, request)
+        self._event_context_manager._contextualize_request(batch_request)
+        response = self._call_unary(self._stub.Batch, batch_request)
+        response = typing.cast(active_pb2.BatchResponse, response)
+        return [get_response_item_result_or_error(item) for item in response.items]
+
+    def create_many(
+        self, c: str, n: int, *, return_exceptions: bool = False
+    ) -> list[AxServeObject | AxServeCallError]:
+        requests = []
+        for _ in range(n):
+            request = active_pb2.CreateRequest()
+            request.clsid = c
+            requests.append(request)
+        results = self._execute_batch_items(requests)
+        objects: list[AxServeObject | AxServeCallError] = []
+        for result in results:
+            if isinstance(result, AxServeCallError):
+                objects.append(result)
+                continue
+            o = AxServeObject.__new__(AxServeObject)
+            self._initialize_internals(o, c, result.instance)
+            objects.append(o)
+        errors = [o for o in objects if isinstance(o, AxServeCallError)]
+        if errors and not return_exceptions:
+            created = [o for o in objects if isinstance(o, AxServeObject)]
+            self.destroy_many(created, return_exceptions=True)
+            raise errors[0]
+        return objects
+
+    def destroy_many(
+        self, objects: Iterable[AxServeObject], *, return_exceptions: bool = False
+    ) -> list[bool | AxServeCallError]:
+        objects = list(objects)
+        results: list[bool | AxServeCallError] = [False] * len(objects)
+        targets = []
+        requests = []
+        for position, o in enumerate(objects):
+            ax = o.__axserve__
+            if not (ax and ax._client is self and (instance := ax._instance)):
+                continue
+            request = active_pb2.DestroyRequest()
+            request.instance = instance
+            targets.append((position, ax))
+            requests.append(request)
+        for (position, ax), result in zip(
+            targets, self._execute_batch_items(requests), strict=True
+        ):
+            if isinstance(result, AxServeCallError):
+                results[position] = result
+                continue
+            results[position] = result.successful
+            if result.successful and (instance := ax._instance):
+                self._instances_manager._unregister_instance(instance)
+                ax._instance = None
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, AxServeCallError):
+                    raise result
+        return results
+
+    def _connect_events(
+        self,
+        o: AxServeObject,
+        handlers: list[tuple[int, Callable]],
+        *,
+        return_exceptions: bool = False,
+    ) -> list[active_pb2.ConnectEventResponse | AxServeCallError | None]:
+        ax = o.__axserve__
+        if not (
+            ax
+            and ax._client is self
+            and (instance := ax._instance)
+            and (handlers_manager := ax._event_handlers_manager)
+        ):
+            msg = "Object is not initialized with this client"
+            raise ValueError(msg)
+        with contextlib.ExitStack() as stack:
+            for index in sorted({index for index, _ in handlers}):
+                lock = handlers_manager._get_event_handlers_lock(index)
+                stack.enter_context(lock)
+            positions: dict[int, int] = {}
+            requests = []
+            for index, _ in handlers:
+                if index in positions or handlers_manager._get_event_handlers(index):
+                    continue
+                request = active_pb2.ConnectEventRequest()
+                request.instance = instance
+                request.index = index
+                positions[index] = len(requests)
+                requests.append(request)
+            responses = self._execute_batch_items(requests)
+            results: list[active_pb2.ConnectEventResponse | AxServeCallError | None]
+            results = []
+            failed: dict[int, AxServeCallError] = {}
+            for index, handler in handlers:
+                result = None
+                if index in failed:
+                    result = failed[index]
+                elif (position := positions.pop(index, None)) is not None:
+                    result = responses[position]
+                    if not isinstance(result, AxServeCallError) and not (
+                        result.successful
+                    ):
+                        result = AxServeCallError(
+                            grpc.StatusCode.UNKNOWN, "Failed to connect event"
+                        )
+                    if isinstance(result, AxServeCallError):
+                        failed[index] = result
+                if not isinstance(result, AxServeCallError):
+                    handlers_manager._get_event_handlers(index).append(handler)
+                results.append(result)
+        if failed and not return_exceptions:
+            raise next(iter(failed.values()))
+        return results
+
+    def prepare(
+        self, o: AxServeObject, name: str, *, validate: bool = True
+    ) -> AxServePreparedMethod:
+        ax = o.__axserve__
+        if not (ax and ax._client is self and (mm := ax._members_manager)):
+            msg = "Object is not initialized with this client"
+            raise ValueError(msg)
+        method = getattr(type(o), name, None)
+        if not isinstance(method, AxServeMethod):
+            method = None
+            if mm._has_member_name(name):
+                method = mm._get_member_by_name(name)._method
+        if method is None:
+            msg = f"Object has no method '{name}'"
+            raise ValueError(msg)
+        return AxServePreparedMethod(method, o, validate=validate)
+
+    def batch(self) -> AxServeBatch:
+        return AxServeBatch(
+            self._stub,
+            self._event_context_manager,
+            self._batch_manager,
+            self._call_options_manager,
+        )
+
+    def call_options(
+        self, *, timeout: float | None = None, key: Hashable | None = None
+    ) -> AxServeCallOptions:
+        return AxServeCallOptions(self._call_options_manager, timeout, key)
+
+    def supervise(
+        self, *, interval: float = 0.5, max_restarts: int | None = None
+    ) -> AxServeSupervisor:
+        if self._supervisor is None:
+            self._supervisor = AxServeSupervisor(
+                self,
+                interval=interval,
+                max_restarts=max_restarts,
+            )
+            self._supervisor.start()
+        return self._supervisor
+
+    @property
+    def supervisor(self) -> AxServeSupervisor | None:
+        return self._supervisor
+
+    @property
+    def members_managers(self) -> AxServeMembersManagerCache:
+        return self._members_managers
+
+    def _stop_streams(self) -> None:
+        if self._call_stream_manager:
+            self._call_stream_manager._close_call_stream()
+            self._call_stream_manager = None
         if self._event_loop_manager:
             self._event_loop_manager.stop()
             self._event_loop_manager = None
         if self._event_stream_manager:
             self._event_stream_manager._close_event_stream()
             self._event_stream_manager = None
+
+    def _cancel_streams(self) -> None:
+        if self._call_stream_manager:
+            self._call_stream_manager._cancel_call_stream()
+        if self._event_stream_manager:
+            self._event_stream_manager._cancel_event_stream()
+
+    def _restart(self) -> None:
+        self._cancel_streams()
+        self._stop_streams()
+        if self._managed_spawn_args:
+            if self._managed_channel:
+                self._managed_channel.close()
+                self._managed_channel = None
+            if self._managed_process:
+                self._managed_process.terminate()
+                self._managed_process.wait(timeout=self._timeout)
+                self._managed_process = None
+            machine, transport = self._managed_spawn_args
+            process, channel = self._spawn_process(machine, transport)
+            self._managed_process = process
+            self._managed_channel = channel
+            self._channel = channel
+        self._stub = ActiveStub(self._channel)
+        self._members_managers._stub = self._stub
+        self.__enter__()
+        self._recreate_instances()
+
+    def _recreate_instances(self) -> None:
+        instances = list(self._instances_manager._instances.items())
+        for i, o in instances:
+            ax = o.__axserve__
+            if not (ax and ax._clsid):
+                continue
+            instance = self._create_instance(ax._clsid)
+            self._instances_manager._unregister_instance(i)
+            ax._instance = instance
+            self._instances_manager._register_instance(instance, o)
+            if ax._property_cache:
+                ax._property_cache.invalidate()
+            if ax._method_cache:
+                ax._method_cache.clear()
+            if handlers_manager := ax._event_handlers_manager:
+                for index in list(handlers_manager._event_handlers_mapping):
+                    handlers = handlers_manager._get_event_handlers(index)
+                    if not handlers:
+                        continue
+                    request = active_pb2.ConnectEventRequest()
+                    request.instance = instance
+                    request.index = index
+                    response = self._stub.ConnectEvent(request)
+                    response = typing.cast(active_pb2.ConnectEventResponse, response)
+                    if not response.successful:
+                        msg = "Failed to connect event"
+                        raise RuntimeError(msg)
+            for name, value in ax._initial_properties.items():
+                setattr(o, name, value)
+
+    def close(self, timeout: float | None = None) -> None:
+        start_time = time.time()
+        if self._supervisor:
+            self._supervisor.stop()
+            self._supervisor = None
+        if self._destroy_queue:
+            self._destroy_queue._close(timeout)
+            self._destroy_queue = None
+        self._stop_streams()
         if self._managed_channel:
             self._managed_channel.close()
             self._managed_channel = None
@@ -247,17 +671,23 @@ class AxServeClient:
         grpc.channel_ready_future(self._channel).result(timeout=self._timeout)
 
         if not self._event_stream_manager:
-            self._event_stream_manager = AxServeEventStreamManager(self._stub)
+            self._event_stream_manager = AxServeEventStreamManager(
+                self._stub, batch_events=self._batch_events
+            )
         if not self._event_loop_manager:
             self._event_loop_manager = AxServeEventLoopManager(
                 self._instances_manager,
                 self._event_context_manager,
                 self._event_stream_manager,
+                self._event_dispatcher,
             )
 
         if not self._event_loop_manager.is_running():
             self._event_loop_manager.start()
 
+        if self._call_stream and not self._call_stream_manager:
+            self._call_stream_manager = AxServeCallStreamManager(self._stub)
+
         return self
 
     def __exit__(
@@ -316,6 +746,8 @@ class AxServeObject:
         return super().__getattribute__(name)
 
     def __setattr__(self, name, value):  # type: ignore
+        if isinstance(prop := getattr(type(self), name, None), AxServeProperty):
+            return prop.__set__(self, value)
         if (
             (ax := self.__axserve__)
             and (mm := ax._members_manager)
@@ -333,6 +765,59 @@ class AxServeObject:
             return attrs
         return super().__dir__()
 
+    def get_many(self, names: Iterable[str]) -> dict[str, Any]:
+        ax = self.__axserve__
+        if not (
+            ax
+            and (client := ax._client)
+            and (instance := ax._instance)
+            and (mm := ax._members_manager)
+        ):
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        names = list(names)
+        if not names:
+            return {}
+        indexes = [mm._get_property_index(name) for name in names]
+        values = client._get_properties(instance, indexes)
+        return dict(zip(names, values, strict=True))
+
+    def connect_many(
+        self,
+        handlers: Mapping[str | AxServeEventType, Callable],
+        *,
+        return_exceptions: bool = False,
+    ) -> list[active_pb2.ConnectEventResponse | AxServeCallError | None]:
+        ax = self.__axserve__
+        if not (ax and (client := ax._client)):
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        events = []
+        for event, handler in handlers.items():
+            event_type = getattr(self, event) if isinstance(event, str) else event
+            if not isinstance(event_type, AxServeEventType):
+                msg = f"Not an event: {event!r}"
+                raise TypeError(msg)
+            index = event_type._self_func._get_index(self)
+            events.append((index, handler))
+        return client._connect_events(self, events, return_exceptions=return_exceptions)
+
+    def snapshot(self) -> dict[str, Any]:
+        ax = self.__axserve__
+        if not (ax and (mm := ax._members_manager)):
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        return self.get_many(mm._get_readable_property_names())
+
+    def initialize(self, values: Mapping[str, Any]) -> None:
+        ax = self.__axserve__
+        if not ax:
+            msg = "Internal values are not initialized"
+            raise ValueError(msg)
+        for name, value in values.items():
+            setattr(self, name, value)
+            ax._initial_properties[name] = value
+
     def __finalize__(self):
         if (
             (ax := self.__axserve__)
@@ -340,7 +825,7 @@ class AxServeObject:
             and (instance := ax._instance)
         ):
             client._instances_manager._unregister_instance(instance)
-            client._destroy_instance(instance)
+            client._schedule_destroy_instance(instance)
             self.__axserve__._instance = None
 
     def __enter__(self):
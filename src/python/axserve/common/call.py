@@ -0,0 +1,169 @@
+# Copyright 2025 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+import grpc
+
+from axserve.proto import active_pb2
+from axserve.proto.active_pb2_conversion import ValueFromVariant
+
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from collections.abc import Callable
+
+
+_STATUS_CODES = {code.value[0]: code for code in grpc.StatusCode}
+
+
+class AxServeCallError(grpc.RpcError):
+    def __init__(self, code: grpc.StatusCode, details: str) -> None:
+        super().__init__(details)
+        self._code = code
+        self._details = details
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def details(self) -> str:
+        return self._details
+
+
+def set_request_item(
+    item: active_pb2.BatchRequestItem | active_pb2.CallRequest,
+    request: active_pb2.GetPropertyRequest
+    | active_pb2.SetPropertyRequest
+    | active_pb2.InvokeMethodRequest
+    | active_pb2.CreateRequest
+    | active_pb2.DestroyRequest
+    | active_pb2.ConnectEventRequest
+    | active_pb2.DisconnectEventRequest,
+) -> None:
+    if isinstance(request, active_pb2.GetPropertyRequest):
+        item.get_property.CopyFrom(request)
+    elif isinstance(request, active_pb2.SetPropertyRequest):
+        item.set_property.CopyFrom(request)
+    elif isinstance(request, active_pb2.InvokeMethodRequest):
+        item.invoke_method.CopyFrom(request)
+    elif not isinstance(item, active_pb2.BatchRequestItem):
+        msg = f"Unexpected request type: {type(request)}"
+        raise TypeError(msg)
+    elif isinstance(request, active_pb2.CreateRequest):
+        item.create.CopyFrom(request)
+    elif isinstance(request, active_pb2.DestroyRequest):
+        item.destroy.CopyFrom(request)
+    elif isinstance(request, active_pb2.ConnectEventRequest):
+        item.connect_event.CopyFrom(request)
+    elif isinstance(request, active_pb2.DisconnectEventRequest):
+        item.disconnect_event.CopyFrom(request)
+    else:
+        msg = f"Unexpected request type: {type(request)}"
+        raise TypeError(msg)
+
+
+def add_batch_request_item(
+    batch_request: active_pb2.BatchRequest,
+    request: active_pb2.GetPropertyRequest
+    | active_pb2.SetPropertyRequest
+    | active_pb2.InvokeMethodRequest
+    | active_pb2.CreateRequest
+    | active_pb2.DestroyRequest
+    | active_pb2.ConnectEventRequest
+    | active_pb2.DisconnectEventRequest,
+) -> active_pb2.BatchRequestItem:
+    item = batch_request.items.add()
+    set_request_item(item, request)
+    return item
+
+
+def get_response_item_result(
+    item: active_pb2.BatchResponseItem | active_pb2.CallResponse,
+) -> Any:
+    code = _STATUS_CODES.get(item.code, grpc.StatusCode.UNKNOWN)
+    if code != grpc.StatusCode.OK:
+        raise AxServeCallError(code, item.message)
+    response = item.WhichOneof("response")
+    if response == "get_property":
+        return ValueFromVariant(item.get_property.value)
+    if response == "set_property":
+        return item.set_property
+    if response == "invoke_method":
+        return ValueFromVariant(item.invoke_method.return_value)
+    if response is not None:
+        return getattr(item, response)
+    return None
+
+
+def get_response_item_result_or_error(
+    item: active_pb2.BatchResponseItem | active_pb2.CallResponse,
+) -> Any:
+    try:
+        return get_response_item_result(item)
+    except AxServeCallError as exc:
+        return exc
+
+
+def set_response_item_result(
+    future: concurrent.futures.Future | asyncio.Future,
+    item: active_pb2.BatchResponseItem | active_pb2.CallResponse,
+) -> None:
+    try:
+        result = get_response_item_result(item)
+    except AxServeCallError as exc:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+def wrap_call_future(
+    call_future: grpc.Future,
+    convert: Callable[[Any], Any],
+) -> concurrent.futures.Future:
+    future: concurrent.futures.Future = concurrent.futures.Future()
+
+    def on_future_done(f: concurrent.futures.Future) -> None:
+        if f.cancelled():
+            call_future.cancel()
+
+    def on_call_done(c: grpc.Future) -> None:
+        with contextlib.suppress(concurrent.futures.InvalidStateError):
+            if c.cancelled():
+                future.cancel()
+                return
+            exc = c.exception()
+            if exc is not None:
+                future.set_exception(exc)
+                return
+            try:
+                result = convert(c.result())
+            except Exception as exc:  # noqa: BLE001
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    future.add_done_callback(on_future_done)
+    call_future.add_done_callback(on_call_done)
+    return future
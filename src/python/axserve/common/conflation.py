@@ -0,0 +1,157 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ParamSpec
+
+from axserve.common.event_handler import AxServeEarlyAckHandler
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
+
+
+logger = logging.getLogger(__name__)
+
+
+P = ParamSpec("P")
+
+
+class AxServeConflatedHandlerBase(AxServeEarlyAckHandler[P]):
+    def __init__(
+        self,
+        handler: Callable[P, Any],
+        conflate: Callable[P, Hashable] | None = None,
+        max_rate: float | None = None,
+    ) -> None:
+        if max_rate is not None and max_rate <= 0:
+            msg = f"Invalid max_rate: {max_rate}"
+            raise ValueError(msg)
+        super().__init__(handler)
+        self._conflate = conflate
+        self._interval = 1 / max_rate if max_rate else 0.0
+        self._pending: OrderedDict[Hashable, tuple[tuple, dict]] = OrderedDict()
+        self._last_delivered_at: float | None = None
+        self._is_closed = False
+        self._received = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._merged = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def received(self) -> int:
+        return self._received
+
+    @property
+    def delivered(self) -> int:
+        return self._delivered
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def merged(self) -> int:
+        return self._merged
+
+    def _put(self, args: tuple, kwargs: dict) -> None:
+        self._received += 1
+        if self._is_closed:
+            self._dropped += 1
+            return
+        key = self._conflate(*args, **kwargs) if self._conflate else None
+        if key in self._pending:
+            if self._conflate:
+                self._merged += 1
+            else:
+                self._dropped += 1
+        self._pending[key] = (args, kwargs)
+
+    def _pop(self) -> tuple[tuple, dict]:
+        _, item = self._pending.popitem(last=False)
+        return item
+
+    def _get_delay(self) -> float:
+        if self._last_delivered_at is None:
+            return 0.0
+        return self._last_delivered_at + self._interval - time.monotonic()
+
+    def _discard(self) -> None:
+        self._is_closed = True
+        self._dropped += len(self._pending)
+        self._pending.clear()
+
+    def _delivering(self) -> None:
+        self._last_delivered_at = time.monotonic()
+        self._delivered += 1
+
+
+class AxServeConflatedHandler(AxServeConflatedHandlerBase[P]):
+    def __init__(
+        self,
+        handler: Callable[P, Any],
+        conflate: Callable[P, Hashable] | None = None,
+        max_rate: float | None = None,
+    ) -> None:
+        super().__init__(handler, conflate, max_rate)
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> None:
+        with self._condition:
+            self._put(args, kwargs)
+            if self._pending and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="axserve-conflate", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                delay = self._get_delay()
+                while self._pending and delay > 0:
+                    self._condition.wait(delay)
+                    delay = self._get_delay()
+                if not self._pending:
+                    self._thread = None
+                    return
+                args, kwargs = self._pop()
+                self._delivering()
+            try:
+                self._handler(*args, **kwargs)
+            except Exception:
+                logger.exception("Unhandled exception in axserve event handler")
+
+    def close(self) -> None:
+        with self._condition:
+            self._discard()
+            self._condition.notify_all()
@@ -0,0 +1,170 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+
+from pathlib import Path
+
+from google.protobuf.message import DecodeError
+
+from axserve.__about__ import __version__
+from axserve.common.registry import check_typelib_version_for_clsid
+from axserve.proto import active_pb2
+
+
+def get_default_cache_dir() -> Path:
+    if cache_dir := os.environ.get("AXSERVE_CACHE_DIR"):
+        return Path(cache_dir)
+    if sys.platform == "win32":
+        base_dir = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+        return Path(base_dir) / "axserve" / "Cache"
+    base_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base_dir) / "axserve"
+
+
+class AxServeDescribeCache:
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        server_version: str | None = None,
+    ) -> None:
+        if path is None:
+            path = get_default_cache_dir() / "describe"
+        if server_version is None:
+            server_version = __version__
+        self._path = Path(path)
+        self._server_version = server_version
+        self._lock = threading.Lock()
+        self._typelib_versions: dict[str, str | None] = {}
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def stale(self) -> int:
+        return self._stale
+
+    def _get_typelib_version(self, clsid: str) -> str | None:
+        with self._lock:
+            if clsid in self._typelib_versions:
+                return self._typelib_versions[clsid]
+        try:
+            version = check_typelib_version_for_clsid(clsid)
+        except (OSError, ValueError):
+            version = None
+        with self._lock:
+            self._typelib_versions[clsid] = version
+        return version
+
+    def _get_entry_path(self, clsid: str) -> Path:
+        typelib_version = self._get_typelib_version(clsid) or ""
+        key = f"{clsid.upper()}\0{self._server_version}\0{typelib_version}"
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self._path / f"{digest}.pb"
+
+    def load(self, clsid: str) -> active_pb2.DescribeResponse | None:
+        path = self._get_entry_path(clsid)
+        try:
+            data = path.read_bytes()
+            response = active_pb2.DescribeResponse.FromString(data)
+        except FileNotFoundError:
+            response = None
+        except (OSError, DecodeError):
+            with contextlib.suppress(OSError):
+                path.unlink()
+            response = None
+        with self._lock:
+            if response is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return response
+
+    def store(self, clsid: str, response: active_pb2.DescribeResponse) -> None:
+        path = self._get_entry_path(clsid)
+        data = response.SerializeToString(deterministic=True)
+        temp = None
+        try:
+            self._path.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self._path, suffix=".tmp", delete=False
+            ) as f:
+                temp = Path(f.name)
+                f.write(data)
+            temp.replace(path)
+        except OSError:
+            if temp is not None:
+                with contextlib.suppress(OSError):
+                    temp.unlink()
+
+    def discard(self, clsid: str) -> None:
+        path = self._get_entry_path(clsid)
+        with contextlib.suppress(OSError):
+            path.unlink()
+
+    def _mark_stale(self, clsid: str, response: active_pb2.DescribeResponse) -> None:
+        with self._lock:
+            self._stale += 1
+        self.store(clsid, response)
+
+    def clear(self) -> None:
+        for path in self._path.glob("*.pb"):
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+_describe_cache: AxServeDescribeCache | None = None
+
+
+def enable_describe_cache(
+    path: str | Path | None = None,
+    *,
+    server_version: str | None = None,
+) -> AxServeDescribeCache:
+    global _describe_cache  # noqa: PLW0603
+    _describe_cache = AxServeDescribeCache(path, server_version=server_version)
+    return _describe_cache
+
+
+def disable_describe_cache() -> None:
+    global _describe_cache  # noqa: PLW0603
+    _describe_cache = None
+
+
+def get_describe_cache() -> AxServeDescribeCache | None:
+    return _describe_cache
@@ -0,0 +1,56 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import ParamSpec
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+P = ParamSpec("P")
+
+
+class AxServeEventHandlerWrapper(Generic[P]):
+    def __init__(self, handler: Callable[P, Any]) -> None:
+        self._handler = handler
+
+    @property
+    def handler(self) -> Callable[P, Any]:
+        return self._handler
+
+    def close(self) -> None:
+        pass
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, AxServeEventHandlerWrapper):
+            return self is other
+        return self._handler == other
+
+    def __hash__(self) -> int:
+        return hash(self._handler)
+
+
+class AxServeEarlyAckHandler(AxServeEventHandlerWrapper[P]):
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Any:
+        return self._handler(*args, **kwargs)
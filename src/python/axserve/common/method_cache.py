@@ -0,0 +1,99 @@
+# Copyright 2025 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import threading
+import time
+
+from collections import OrderedDict
+from collections import defaultdict
+from typing import Any
+
+
+class AxServeMethodCache:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: dict[str, OrderedDict[Any, tuple[Any, float | None]]] = (
+            defaultdict(OrderedDict)
+        )
+        self._generations: dict[str, int] = defaultdict(int)
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(values) for values in self._values.values())
+
+    def _lookup(self, name: str, key: Any) -> tuple[bool, Any]:
+        with self._lock:
+            values = self._values[name]
+            entry = values.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    values.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+                del values[key]
+            self._misses += 1
+            return False, None
+
+    def _get_generation(self, name: str) -> int:
+        with self._lock:
+            return self._generations[name]
+
+    def _store(
+        self,
+        name: str,
+        key: Any,
+        value: Any,
+        maxsize: int | None,
+        ttl: float | None,
+        generation: int,
+    ) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if self._generations[name] != generation:
+                return
+            values = self._values[name]
+            values[key] = (value, expires_at)
+            values.move_to_end(key)
+            if maxsize is not None:
+                while len(values) > maxsize:
+                    values.popitem(last=False)
+
+    def clear(self, name: str | None = None) -> None:
+        with self._lock:
+            names = {name} if name is not None else {*self._generations, *self._values}
+            for name_ in names:
+                self._generations[name_] += 1
+                self._values.pop(name_, None)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
@@ -71,6 +71,32 @@ def kill_process_group(
         return
 
 
+def kill_process(
+    pid: int,
+    sig: int = signal.SIGTERM,
+):
+    try:
+        os.kill(pid, sig)
+    except ProcessLookupError:
+        return
+    except PermissionError:
+        return
+
+
+def create_job_object_for_cleanup(name: str | None = None) -> int:  # noqa: ARG001
+    return 0
+
+
+def assign_process_to_job_object(
+    job_handle: int,  # noqa: ARG001
+    process_id: int,
+) -> None:
+    if process_id == 0:
+        msg = "Process id is zero"
+        raise ValueError(msg)
+    atexit.register(kill_process, process_id)
+
+
 class ManagedProcess(RunnableProcess):
     def __init__(
         self,
@@ -0,0 +1,94 @@
+# Copyright 2025 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import threading
+import time
+
+from collections import defaultdict
+from typing import Any
+
+
+class AxServePropertyCache:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: dict[str, tuple[Any, float | None]] = {}
+        self._generations: dict[str, int] = defaultdict(int)
+        self._invalidations: dict[str, set[str]] = defaultdict(set)
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def _lookup(self, name: str) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._values.get(name)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._hits += 1
+                    return True, value
+                del self._values[name]
+            self._misses += 1
+            return False, None
+
+    def _get_generation(self, name: str) -> int:
+        with self._lock:
+            return self._generations[name]
+
+    def _store(self, name: str, value: Any, ttl: float | None, generation: int) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if self._generations[name] == generation:
+                self._values[name] = (value, expires_at)
+
+    def _register_invalidation(self, event: str, name: str) -> bool:
+        with self._lock:
+            names = self._invalidations[event]
+            connect = not names
+            names.add(name)
+            return connect
+
+    def _unregister_invalidation(self, event: str, name: str) -> None:
+        with self._lock:
+            self._invalidations[event].discard(name)
+
+    def _invalidate_by_event(self, event: str, *args, **kwargs) -> None:  # noqa: ARG002
+        with self._lock:
+            names = list(self._invalidations.get(event, ()))
+        for name in names:
+            self.invalidate(name)
+
+    def invalidate(self, name: str | None = None) -> None:
+        with self._lock:
+            names = {name} if name is not None else {*self._generations, *self._values}
+            for name_ in names:
+                self._generations[name_] += 1
+                self._values.pop(name_, None)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
@@ -89,6 +89,22 @@ def reg_query_value(
     return value
 
 
+def reg_query_subkeys(
+    key_path: str,
+    view_flag: str | None = None,
+) -> list[str]:
+    cmd = ["wine", "reg.exe", "query", key_path]
+    if view_flag:
+        cmd.append(view_flag)
+    try:
+        output = subprocess.check_output(cmd, text=True, shell=False)  # noqa: S603
+    except subprocess.CalledProcessError:
+        return []
+    lines = output.split("\n")
+    paths = [line.strip() for line in lines if line and not line[0].isspace()]
+    return [path.rsplit("\\", 1)[-1] for path in paths[1:]]
+
+
 def clsid_from_progid(progid: str, view_flag: str | None = None) -> str | None:
     key_path = rf"HKCR\{progid}\CLSID"
     return reg_query_value(key_path, view_flag=view_flag)
@@ -111,6 +127,26 @@ def get_server_path(
     return reg_query_value(key_path, view_flag=view_flag)
 
 
+def parse_typelib_version(version: str) -> tuple[int, ...]:
+    try:
+        return tuple(int(part, 16) for part in version.split("."))
+    except ValueError:
+        return ()
+
+
+def get_typelib_version(clsid: str, view_flag: str | None = None) -> str | None:
+    key_path = rf"HKCR\CLSID\{clsid}\TypeLib"
+    typelib = reg_query_value(key_path, view_flag=view_flag)
+    if not typelib:
+        return None
+    key_path = rf"HKCR\TypeLib\{typelib}"
+    versions = reg_query_subkeys(key_path, view_flag=view_flag)
+    if not versions:
+        return None
+    version = max(versions, key=parse_typelib_version)
+    return f"{typelib}:{version}"
+
+
 def convert_path(path: str) -> str | None:
     cmd = ["winepath", "--unix", path]
     try:
@@ -155,6 +191,20 @@ def check_machine_for_clsid(identifier: str) -> str | None:
     return None
 
 
+def check_typelib_version_for_clsid(identifier: str) -> str | None:
+    bits, _ = platform.architecture()
+
+    views = VIEW_FLAGS_MAPPING.get(bits, [None])
+
+    for view_flag in views:
+        clsid = normalize_identifier(identifier, view_flag)
+        version = get_typelib_version(clsid, view_flag)
+        if version:
+            return version
+
+    return None
+
+
 @click.command()
 @click.argument("clsid")
 def main(clsid: str):
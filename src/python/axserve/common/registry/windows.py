@@ -78,6 +78,39 @@ def get_server_path(clsid: str, subkey: str, view_flag: int = 0) -> str | None:
         return None
 
 
+def parse_typelib_version(version: str) -> tuple[int, ...]:
+    try:
+        return tuple(int(part, 16) for part in version.split("."))
+    except ValueError:
+        return ()
+
+
+def get_typelib_version(clsid: str, view_flag: int = 0) -> str | None:
+    key_path = rf"CLSID\{clsid}\TypeLib"
+    try:
+        with winreg.OpenKey(
+            winreg.HKEY_CLASSES_ROOT,
+            key_path,
+            0,
+            winreg.KEY_READ | view_flag,
+        ) as key:
+            typelib, _ = winreg.QueryValueEx(key, None)  # type: ignore
+        with winreg.OpenKey(
+            winreg.HKEY_CLASSES_ROOT,
+            rf"TypeLib\{typelib}",
+            0,
+            winreg.KEY_READ | view_flag,
+        ) as key:
+            count, _, _ = winreg.QueryInfoKey(key)
+            versions = [winreg.EnumKey(key, index) for index in range(count)]
+    except FileNotFoundError:
+        return None
+    if not versions:
+        return None
+    version = max(versions, key=parse_typelib_version)
+    return f"{typelib}:{version}"
+
+
 def get_machine_from_pe(path: str) -> str | None:
     try:
         with open(path, "rb") as f:
@@ -110,6 +143,20 @@ def check_machine_for_clsid(identifier: str) -> str | None:
     return None
 
 
+def check_typelib_version_for_clsid(identifier: str) -> str | None:
+    bits, _ = platform.architecture()
+
+    views = VIEW_FLAGS_MAPPING.get(bits, [0])
+
+    for view_flag in views:
+        clsid = normalize_identifier(identifier, view_flag)
+        version = get_typelib_version(clsid, view_flag)
+        if version:
+            return version
+
+    return None
+
+
 @click.command()
 @click.argument("clsid")
 def main(clsid: str):
@@ -18,10 +18,17 @@
 
 from __future__ import annotations
 
+import contextlib
 import ipaddress
 import socket
+import tempfile
+import uuid
 
 from contextlib import closing
+from pathlib import Path
+
+
+UNIX_ADDRESS_PREFIX = "unix:"
 
 
 def find_free_port() -> int:
@@ -41,6 +48,38 @@ def find_free_port() -> int:
         return port
 
 
+def make_unix_socket_address(directory: str | Path | None = None) -> str:
+    if directory is None:
+        directory = tempfile.gettempdir()
+    path = Path(directory) / f"axserve-{uuid.uuid4().hex[:16]}.sock"
+    return f"{UNIX_ADDRESS_PREFIX}{path.as_posix()}"
+
+
+def get_unix_socket_path(address: str) -> Path | None:
+    if not address.startswith(UNIX_ADDRESS_PREFIX):
+        return None
+    path = address.removeprefix(UNIX_ADDRESS_PREFIX)
+    if path.startswith("//"):
+        path = path.removeprefix("//")
+    return Path(path)
+
+
+def remove_unix_socket(address: str) -> None:
+    path = get_unix_socket_path(address)
+    if path is not None:
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+
+
+def make_local_address(transport: str = "tcp") -> str:
+    if transport == "tcp":
+        return "localhost:0"
+    if transport == "uds":
+        return make_unix_socket_address()
+    msg = f"Unknown transport: {transport}"
+    raise ValueError(msg)
+
+
 def is_private_address(host) -> bool:
     host = socket.gethostbyname(host)
     ip_address = ipaddress.ip_address(host)
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0c\x61\x63tive.proto\x12\x07\x61xserve\":\n\x0b\x43ontextInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\"a\n\x07\x43ontext\x12*\n\x0c\x63ontext_type\x18\x01 \x01(\x0e\x32\x14.axserve.ContextType\x12*\n\x0c\x63ontext_info\x18\x02 \x01(\x0b\x32\x14.axserve.ContextInfo\"A\n\rCreateRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\r\n\x05\x63lsid\x18\x02 \x01(\t\"\"\n\x0e\x43reateResponse\x12\x10\n\x08instance\x18\x01 \x01(\t\"C\n\x0cReferRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\"#\n\rReferResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"E\n\x0eReleaseRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\"%\n\x0fReleaseResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"E\n\x0e\x44\x65stroyRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\"%\n\x0f\x44\x65stroyResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"0\n\x0bListRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\"?\n\x08ListItem\x12\x10\n\x08instance\x18\x01 \x01(\t\x12\r\n\x05\x63lsid\x18\x02 \x01(\t\x12\x12\n\nreferences\x18\x03 \x01(\x05\"0\n\x0cListResponse\x12 \n\x05items\x18\x01 \x03(\x0b\x32\x11.axserve.ListItem\"F\n\x0f\x44\x65scribeRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\"l\n\x0cPropertyInfo\x12\r\n\x05index\x18\x01 \x01(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rproperty_type\x18\x03 \x01(\t\x12\x13\n\x0bis_readable\x18\x04 \x01(\x08\x12\x13\n\x0bis_writable\x18\x05 \x01(\x08\"3\n\x0c\x41rgumentInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x15\n\rargument_type\x18\x02 \x01(\t\"h\n\nMethodInfo\x12\r\n\x05index\x18\x01 \x01(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\x12(\n\targuments\x18\x03 \x03(\x0b\x32\x15.axserve.ArgumentInfo\x12\x13\n\x0breturn_type\x18\x04 \x01(\t\"R\n\tEventInfo\x12\r\n\x05index\x18\x01 \x01(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\x12(\n\targuments\x18\x03 \x03(\x0b\x32\x15.axserve.ArgumentInfo\"\x87\x01\n\x10\x44\x65scribeResponse\x12)\n\nproperties\x18\x01 \x03(\x0b\x32\x15.axserve.PropertyInfo\x12$\n\x07methods\x18\x02 \x03(\x0b\x32\x13.axserve.MethodInfo\x12\"\n\x06\x65vents\x18\x03 \x03(\x0b\x32\x12.axserve.EventInfo\"/\n\x0bVariantList\x12 \n\x06values\x18\x01 \x03(\x0b\x32\x10.axserve.Variant\"\x86\x01\n\x0eVaraintHashMap\x12\x33\n\x06values\x18\x01 \x03(\x0b\x32#.axserve.VaraintHashMap.ValuesEntry\x1a?\n\x0bValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1f\n\x05value\x18\x02 \x01(\x0b\x32\x10.axserve.Variant:\x02\x38\x01\"\xdd\x01\n\x07Variant\x12\x14\n\nbool_value\x18\x01 \x01(\x08H\x00\x12\x16\n\x0cstring_value\x18\x02 \x01(\tH\x00\x12\x13\n\tint_value\x18\x03 \x01(\x05H\x00\x12\x14\n\nuint_value\x18\x04 \x01(\rH\x00\x12\x16\n\x0c\x64ouble_value\x18\x05 \x01(\x01H\x00\x12*\n\nlist_value\x18\x06 \x01(\x0b\x32\x14.axserve.VariantListH\x00\x12,\n\tmap_value\x18\x07 \x01(\x0b\x32\x17.axserve.VaraintHashMapH\x00\x42\x07\n\x05value\"X\n\x12GetPropertyRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\"6\n\x13GetPropertyResponse\x12\x1f\n\x05value\x18\x01 \x01(\x0b\x32\x10.axserve.Variant\"y\n\x12SetPropertyRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\x12\x1f\n\x05value\x18\x04 \x01(\x0b\x32\x10.axserve.Variant\")\n\x13SetPropertyResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"~\n\x13InvokeMethodRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\x12#\n\targuments\x18\x04 \x03(\x0b\x32\x10.axserve.Variant\">\n\x14InvokeMethodResponse\x12&\n\x0creturn_value\x18\x01 \x01(\x0b\x32\x10.axserve.Variant\"Y\n\x13\x43onnectEventRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\"*\n\x14\x43onnectEventResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"\\\n\x16\x44isconnectEventRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\"-\n\x17\x44isconnectEventResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"\x9b\x01\n\x12HandleEventRequest\x12\x11\n\ttimestamp\x18\x01 \x01(\x04\x12\n\n\x02id\x18\x02 \x01(\t\x12\x10\n\x08instance\x18\x03 \x01(\t\x12\r\n\x05index\x18\x04 \x01(\r\x12#\n\targuments\x18\x05 \x03(\x0b\x32\x10.axserve.Variant\x12\x0f\n\x07is_ping\x18\x06 \x01(\x08\x12\x0f\n\x07is_pong\x18\x07 \x01(\x08\"d\n\x13HandleEventResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\x12\x0f\n\x07is_ping\x18\x04 \x01(\x08\x12\x0f\n\x07is_pong\x18\x05 \x01(\x08*%\n\x0b\x43ontextType\x12\x0b\n\x07\x44\x45\x46\x41ULT\x10\x00\x12\t\n\x05\x45VENT\x10\x01\x32\xd7\x06\n\x06\x41\x63tive\x12;\n\x06\x43reate\x12\x16.axserve.CreateRequest\x1a\x17.axserve.CreateResponse\"\x00\x12\x38\n\x05Refer\x12\x15.axserve.ReferRequest\x1a\x16.axserve.ReferResponse\"\x00\x12>\n\x07Release\x12\x17.axserve.ReleaseRequest\x1a\x18.axserve.ReleaseResponse\"\x00\x12>\n\x07\x44\x65stroy\x12\x17.axserve.DestroyRequest\x1a\x18.axserve.DestroyResponse\"\x00\x12\x35\n\x04List\x12\x14.axserve.ListRequest\x1a\x15.axserve.ListResponse\"\x00\x12\x41\n\x08\x44\x65scribe\x12\x18.axserve.DescribeRequest\x1a\x19.axserve.DescribeResponse\"\x00\x12J\n\x0bGetProperty\x12\x1b.axserve.GetPropertyRequest\x1a\x1c.axserve.GetPropertyResponse\"\x00\x12J\n\x0bSetProperty\x12\x1b.axserve.SetPropertyRequest\x1a\x1c.axserve.SetPropertyResponse\"\x00\x12M\n\x0cInvokeMethod\x12\x1c.axserve.InvokeMethodRequest\x1a\x1d.axserve.InvokeMethodResponse\"\x00\x12M\n\x0c\x43onnectEvent\x12\x1c.axserve.ConnectEventRequest\x1a\x1d.axserve.ConnectEventResponse\"\x00\x12V\n\x0f\x44isconnectEvent\x12\x1f.axserve.DisconnectEventRequest\x1a .axserve.DisconnectEventResponse\"\x00\x12N\n\x0bHandleEvent\x12\x1c.axserve.HandleEventResponse\x1a\x1b.axserve.HandleEventRequest\"\x00(\x01\x30\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0c\x61\x63tive.proto\x12\x07\x61xserve\":\n\x0b\x43ontextInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\"a\n\x07\x43ontext\x12*\n\x0c\x63ontext_type\x18\x01 \x01(\x0e\x32\x14.axserve.ContextType\x12*\n\x0c\x63ontext_info\x18\x02 \x01(\x0b\x32\x14.axserve.ContextInfo\"A\n\rCreateRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\r\n\x05\x63lsid\x18\x02 \x01(\t\"\"\n\x0e\x43reateResponse\x12\x10\n\x08instance\x18\x01 \x01(\t\"C\n\x0cReferRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\"#\n\rReferResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"E\n\x0eReleaseRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\"%\n\x0fReleaseResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"E\n\x0e\x44\x65stroyRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\"%\n\x0f\x44\x65stroyResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"0\n\x0bListRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\"?\n\x08ListItem\x12\x10\n\x08instance\x18\x01 \x01(\t\x12\r\n\x05\x63lsid\x18\x02 \x01(\t\x12\x12\n\nreferences\x18\x03 \x01(\x05\"0\n\x0cListResponse\x12 \n\x05items\x18\x01 \x03(\x0b\x32\x11.axserve.ListItem\"F\n\x0f\x44\x65scribeRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\"l\n\x0cPropertyInfo\x12\r\n\x05index\x18\x01 \x01(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rproperty_type\x18\x03 \x01(\t\x12\x13\n\x0bis_readable\x18\x04 \x01(\x08\x12\x13\n\x0bis_writable\x18\x05 \x01(\x08\"3\n\x0c\x41rgumentInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x15\n\rargument_type\x18\x02 \x01(\t\"h\n\nMethodInfo\x12\r\n\x05index\x18\x01 \x01(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\x12(\n\targuments\x18\x03 \x03(\x0b\x32\x15.axserve.ArgumentInfo\x12\x13\n\x0breturn_type\x18\x04 \x01(\t\"R\n\tEventInfo\x12\r\n\x05index\x18\x01 \x01(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\x12(\n\targuments\x18\x03 \x03(\x0b\x32\x15.axserve.ArgumentInfo\"\x87\x01\n\x10\x44\x65scribeResponse\x12)\n\nproperties\x18\x01 \x03(\x0b\x32\x15.axserve.PropertyInfo\x12$\n\x07methods\x18\x02 \x03(\x0b\x32\x13.axserve.MethodInfo\x12\"\n\x06\x65vents\x18\x03 \x03(\x0b\x32\x12.axserve.EventInfo\"/\n\x0bVariantList\x12 \n\x06values\x18\x01 \x03(\x0b\x32\x10.axserve.Variant\"\x86\x01\n\x0eVaraintHashMap\x12\x33\n\x06values\x18\x01 \x03(\x0b\x32#.axserve.VaraintHashMap.ValuesEntry\x1a?\n\x0bValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1f\n\x05value\x18\x02 \x01(\x0b\x32\x10.axserve.Variant:\x02\x38\x01\"\xdd\x01\n\x07Variant\x12\x14\n\nbool_value\x18\x01 \x01(\x08H\x00\x12\x16\n\x0cstring_value\x18\x02 \x01(\tH\x00\x12\x13\n\tint_value\x18\x03 \x01(\x05H\x00\x12\x14\n\nuint_value\x18\x04 \x01(\rH\x00\x12\x16\n\x0c\x64ouble_value\x18\x05 \x01(\x01H\x00\x12*\n\nlist_value\x18\x06 \x01(\x0b\x32\x14.axserve.VariantListH\x00\x12,\n\tmap_value\x18\x07 \x01(\x0b\x32\x17.axserve.VaraintHashMapH\x00\x42\x07\n\x05value\"X\n\x12GetPropertyRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\"6\n\x13GetPropertyResponse\x12\x1f\n\x05value\x18\x01 \x01(\x0b\x32\x10.axserve.Variant\"\\\n\x14GetPropertiesRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\x0f\n\x07indexes\x18\x03 \x03(\r\"9\n\x15GetPropertiesResponse\x12 \n\x06values\x18\x01 \x03(\x0b\x32\x10.axserve.Variant\"y\n\x12SetPropertyRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\x12\x1f\n\x05value\x18\x04 \x01(\x0b\x32\x10.axserve.Variant\")\n\x13SetPropertyResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"~\n\x13InvokeMethodRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\x12#\n\targuments\x18\x04 \x03(\x0b\x32\x10.axserve.Variant\">\n\x14InvokeMethodResponse\x12&\n\x0creturn_value\x18\x01 \x01(\x0b\x32\x10.axserve.Variant\"\x88\x03\n\x10\x42\x61tchRequestItem\x12\x33\n\x0cget_property\x18\x01 \x01(\x0b\x32\x1b.axserve.GetPropertyRequestH\x00\x12\x33\n\x0cset_property\x18\x02 \x01(\x0b\x32\x1b.axserve.SetPropertyRequestH\x00\x12\x35\n\rinvoke_method\x18\x03 \x01(\x0b\x32\x1c.axserve.InvokeMethodRequestH\x00\x12(\n\x06\x63reate\x18\x04 \x01(\x0b\x32\x16.axserve.CreateRequestH\x00\x12*\n\x07\x64\x65stroy\x18\x05 \x01(\x0b\x32\x17.axserve.DestroyRequestH\x00\x12\x35\n\rconnect_event\x18\x06 \x01(\x0b\x32\x1c.axserve.ConnectEventRequestH\x00\x12;\n\x10\x64isconnect_event\x18\x07 \x01(\x0b\x32\x1f.axserve.DisconnectEventRequestH\x00\x42\t\n\x07request\"[\n\x0c\x42\x61tchRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12(\n\x05items\x18\x02 \x03(\x0b\x32\x19.axserve.BatchRequestItem\"\xb0\x03\n\x11\x42\x61tchResponseItem\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x34\n\x0cget_property\x18\x03 \x01(\x0b\x32\x1c.axserve.GetPropertyResponseH\x00\x12\x34\n\x0cset_property\x18\x04 \x01(\x0b\x32\x1c.axserve.SetPropertyResponseH\x00\x12\x36\n\rinvoke_method\x18\x05 \x01(\x0b\x32\x1d.axserve.InvokeMethodResponseH\x00\x12)\n\x06\x63reate\x18\x06 \x01(\x0b\x32\x17.axserve.CreateResponseH\x00\x12+\n\x07\x64\x65stroy\x18\x07 \x01(\x0b\x32\x18.axserve.DestroyResponseH\x00\x12\x36\n\rconnect_event\x18\x08 \x01(\x0b\x32\x1d.axserve.ConnectEventResponseH\x00\x12<\n\x10\x64isconnect_event\x18\t \x01(\x0b\x32 .axserve.DisconnectEventResponseH\x00\x42\n\n\x08response\":\n\rBatchResponse\x12)\n\x05items\x18\x01 \x03(\x0b\x32\x1a.axserve.BatchResponseItem\"\xc5\x01\n\x0b\x43\x61llRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x33\n\x0cget_property\x18\x02 \x01(\x0b\x32\x1b.axserve.GetPropertyRequestH\x00\x12\x33\n\x0cset_property\x18\x03 \x01(\x0b\x32\x1b.axserve.SetPropertyRequestH\x00\x12\x35\n\rinvoke_method\x18\x04 \x01(\x0b\x32\x1c.axserve.InvokeMethodRequestH\x00\x42\t\n\x07request\"\xe9\x01\n\x0c\x43\x61llResponse\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x02 \x01(\x05\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x34\n\x0cget_property\x18\x04 \x01(\x0b\x32\x1c.axserve.GetPropertyResponseH\x00\x12\x34\n\x0cset_property\x18\x05 \x01(\x0b\x32\x1c.axserve.SetPropertyResponseH\x00\x12\x36\n\rinvoke_method\x18\x06 \x01(\x0b\x32\x1d.axserve.InvokeMethodResponseH\x00\x42\n\n\x08response\"Y\n\x13\x43onnectEventRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\"*\n\x14\x43onnectEventResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"\\\n\x16\x44isconnectEventRequest\x12!\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x10.axserve.Context\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\"-\n\x17\x44isconnectEventResponse\x12\x12\n\nsuccessful\x18\x01 \x01(\x08\"\xda\x01\n\x12HandleEventRequest\x12\x11\n\ttimestamp\x18\x01 \x01(\x04\x12\n\n\x02id\x18\x02 \x01(\t\x12\x10\n\x08instance\x18\x03 \x01(\t\x12\r\n\x05index\x18\x04 \x01(\r\x12#\n\targuments\x18\x05 \x03(\x0b\x32\x10.axserve.Variant\x12\x0f\n\x07is_ping\x18\x06 \x01(\x08\x12\x0f\n\x07is_pong\x18\x07 \x01(\x08\x12\x10\n\x08sequence\x18\x08 \x01(\x04\x12+\n\x06\x65vents\x18\t \x03(\x0b\x32\x1b.axserve.HandleEventRequest\"\x92\x01\n\x13HandleEventResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08instance\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\r\x12\x0f\n\x07is_ping\x18\x04 \x01(\x08\x12\x0f\n\x07is_pong\x18\x05 \x01(\x08\x12\x14\n\x0c\x62\x61tch_events\x18\x06 \x01(\x08\x12\x16\n\x0e\x61\x63ked_sequence\x18\x07 \x01(\x04*%\n\x0b\x43ontextType\x12\x0b\n\x07\x44\x45\x46\x41ULT\x10\x00\x12\t\n\x05\x45VENT\x10\x01\x32\x9e\x08\n\x06\x41\x63tive\x12;\n\x06\x43reate\x12\x16.axserve.CreateRequest\x1a\x17.axserve.CreateResponse\"\x00\x12\x38\n\x05Refer\x12\x15.axserve.ReferRequest\x1a\x16.axserve.ReferResponse\"\x00\x12>\n\x07Release\x12\x17.axserve.ReleaseRequest\x1a\x18.axserve.ReleaseResponse\"\x00\x12>\n\x07\x44\x65stroy\x12\x17.axserve.DestroyRequest\x1a\x18.axserve.DestroyResponse\"\x00\x12\x35\n\x04List\x12\x14.axserve.ListRequest\x1a\x15.axserve.ListResponse\"\x00\x12\x41\n\x08\x44\x65scribe\x12\x18.axserve.DescribeRequest\x1a\x19.axserve.DescribeResponse\"\x00\x12J\n\x0bGetProperty\x12\x1b.axserve.GetPropertyRequest\x1a\x1c.axserve.GetPropertyResponse\"\x00\x12P\n\rGetProperties\x12\x1d.axserve.GetPropertiesRequest\x1a\x1e.axserve.GetPropertiesResponse\"\x00\x12J\n\x0bSetProperty\x12\x1b.axserve.SetPropertyRequest\x1a\x1c.axserve.SetPropertyResponse\"\x00\x12M\n\x0cInvokeMethod\x12\x1c.axserve.InvokeMethodRequest\x1a\x1d.axserve.InvokeMethodResponse\"\x00\x12M\n\x0c\x43onnectEvent\x12\x1c.axserve.ConnectEventRequest\x1a\x1d.axserve.ConnectEventResponse\"\x00\x12V\n\x0f\x44isconnectEvent\x12\x1f.axserve.DisconnectEventRequest\x1a .axserve.DisconnectEventResponse\"\x00\x12N\n\x0bHandleEvent\x12\x1c.axserve.HandleEventResponse\x1a\x1b.axserve.HandleEventRequest\"\x00(\x01\x30\x01\x12\x38\n\x05\x42\x61tch\x12\x15.axserve.BatchRequest\x1a\x16.axserve.BatchResponse\"\x00\x12\x39\n\x04\x43\x61ll\x12\x14.axserve.CallRequest\x1a\x15.axserve.CallResponse\"\x00(\x01\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -33,8 +33,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_VARAINTHASHMAP_VALUESENTRY']._loaded_options = None
   _globals['_VARAINTHASHMAP_VALUESENTRY']._serialized_options = b'8\001'
-  _globals['_CONTEXTTYPE']._serialized_start=2791
-  _globals['_CONTEXTTYPE']._serialized_end=2828
+  _globals['_CONTEXTTYPE']._serialized_start=4473
+  _globals['_CONTEXTTYPE']._serialized_end=4510
   _globals['_CONTEXTINFO']._serialized_start=25
   _globals['_CONTEXTINFO']._serialized_end=83
   _globals['_CONTEXT']._serialized_start=85
@@ -85,26 +85,42 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETPROPERTYREQUEST']._serialized_end=1839
   _globals['_GETPROPERTYRESPONSE']._serialized_start=1841
   _globals['_GETPROPERTYRESPONSE']._serialized_end=1895
-  _globals['_SETPROPERTYREQUEST']._serialized_start=1897
-  _globals['_SETPROPERTYREQUEST']._serialized_end=2018
-  _globals['_SETPROPERTYRESPONSE']._serialized_start=2020
-  _globals['_SETPROPERTYRESPONSE']._serialized_end=2061
-  _globals['_INVOKEMETHODREQUEST']._serialized_start=2063
-  _globals['_INVOKEMETHODREQUEST']._serialized_end=2189
-  _globals['_INVOKEMETHODRESPONSE']._serialized_start=2191
-  _globals['_INVOKEMETHODRESPONSE']._serialized_end=2253
-  _globals['_CONNECTEVENTREQUEST']._serialized_start=2255
-  _globals['_CONNECTEVENTREQUEST']._serialized_end=2344
-  _globals['_CONNECTEVENTRESPONSE']._serialized_start=2346
-  _globals['_CONNECTEVENTRESPONSE']._serialized_end=2388
-  _globals['_DISCONNECTEVENTREQUEST']._serialized_start=2390
-  _globals['_DISCONNECTEVENTREQUEST']._serialized_end=2482
-  _globals['_DISCONNECTEVENTRESPONSE']._serialized_start=2484
-  _globals['_DISCONNECTEVENTRESPONSE']._serialized_end=2529
-  _globals['_HANDLEEVENTREQUEST']._serialized_start=2532
-  _globals['_HANDLEEVENTREQUEST']._serialized_end=2687
-  _globals['_HANDLEEVENTRESPONSE']._serialized_start=2689
-  _globals['_HANDLEEVENTRESPONSE']._serialized_end=2789
-  _globals['_ACTIVE']._serialized_start=2831
-  _globals['_ACTIVE']._serialized_end=3686
+  _globals['_GETPROPERTIESREQUEST']._serialized_start=1897
+  _globals['_GETPROPERTIESREQUEST']._serialized_end=1989
+  _globals['_GETPROPERTIESRESPONSE']._serialized_start=1991
+  _globals['_GETPROPERTIESRESPONSE']._serialized_end=2048
+  _globals['_SETPROPERTYREQUEST']._serialized_start=2050
+  _globals['_SETPROPERTYREQUEST']._serialized_end=2171
+  _globals['_SETPROPERTYRESPONSE']._serialized_start=2173
+  _globals['_SETPROPERTYRESPONSE']._serialized_end=2214
+  _globals['_INVOKEMETHODREQUEST']._serialized_start=2216
+  _globals['_INVOKEMETHODREQUEST']._serialized_end=2342
+  _globals['_INVOKEMETHODRESPONSE']._serialized_start=2344
+  _globals['_INVOKEMETHODRESPONSE']._serialized_end=2406
+  _globals['_BATCHREQUESTITEM']._serialized_start=2409
+  _globals['_BATCHREQUESTITEM']._serialized_end=2801
+  _globals['_BATCHREQUEST']._serialized_start=2803
+  _globals['_BATCHREQUEST']._serialized_end=2894
+  _globals['_BATCHRESPONSEITEM']._serialized_start=2897
+  _globals['_BATCHRESPONSEITEM']._serialized_end=3329
+  _globals['_BATCHRESPONSE']._serialized_start=3331
+  _globals['_BATCHRESPONSE']._serialized_end=3389
+  _globals['_CALLREQUEST']._serialized_start=3392
+  _globals['_CALLREQUEST']._serialized_end=3589
+  _globals['_CALLRESPONSE']._serialized_start=3592
+  _globals['_CALLRESPONSE']._serialized_end=3825
+  _globals['_CONNECTEVENTREQUEST']._serialized_start=3827
+  _globals['_CONNECTEVENTREQUEST']._serialized_end=3916
+  _globals['_CONNECTEVENTRESPONSE']._serialized_start=3918
+  _globals['_CONNECTEVENTRESPONSE']._serialized_end=3960
+  _globals['_DISCONNECTEVENTREQUEST']._serialized_start=3962
+  _globals['_DISCONNECTEVENTREQUEST']._serialized_end=4054
+  _globals['_DISCONNECTEVENTRESPONSE']._serialized_start=4056
+  _globals['_DISCONNECTEVENTRESPONSE']._serialized_end=4101
+  _globals['_HANDLEEVENTREQUEST']._serialized_start=4104
+  _globals['_HANDLEEVENTREQUEST']._serialized_end=4322
+  _globals['_HANDLEEVENTRESPONSE']._serialized_start=4325
+  _globals['_HANDLEEVENTRESPONSE']._serialized_end=4471
+  _globals['_ACTIVE']._serialized_start=4513
+  _globals['_ACTIVE']._serialized_end=5567
 # @@protoc_insertion_point(module_scope)
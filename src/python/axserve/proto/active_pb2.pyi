@@ -547,6 +547,46 @@ class GetPropertyResponse(google.protobuf.message.Message):
 
 global___GetPropertyResponse = GetPropertyResponse
 
+@typing.final
+class GetPropertiesRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CONTEXT_FIELD_NUMBER: builtins.int
+    INSTANCE_FIELD_NUMBER: builtins.int
+    INDEXES_FIELD_NUMBER: builtins.int
+    instance: builtins.str
+    @property
+    def context(self) -> global___Context: ...
+    @property
+    def indexes(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]: ...
+    def __init__(
+        self,
+        *,
+        context: global___Context | None = ...,
+        instance: builtins.str = ...,
+        indexes: collections.abc.Iterable[builtins.int] | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["context", b"context"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["context", b"context", "indexes", b"indexes", "instance", b"instance"]) -> None: ...
+
+global___GetPropertiesRequest = GetPropertiesRequest
+
+@typing.final
+class GetPropertiesResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VALUES_FIELD_NUMBER: builtins.int
+    @property
+    def values(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___Variant]: ...
+    def __init__(
+        self,
+        *,
+        values: collections.abc.Iterable[global___Variant] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["values", b"values"]) -> None: ...
+
+global___GetPropertiesResponse = GetPropertiesResponse
+
 @typing.final
 class SetPropertyRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -633,6 +673,197 @@ class InvokeMethodResponse(google.protobuf.message.Message):
 
 global___InvokeMethodResponse = InvokeMethodResponse
 
+@typing.final
+class BatchRequestItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    GET_PROPERTY_FIELD_NUMBER: builtins.int
+    SET_PROPERTY_FIELD_NUMBER: builtins.int
+    INVOKE_METHOD_FIELD_NUMBER: builtins.int
+    CREATE_FIELD_NUMBER: builtins.int
+    DESTROY_FIELD_NUMBER: builtins.int
+    CONNECT_EVENT_FIELD_NUMBER: builtins.int
+    DISCONNECT_EVENT_FIELD_NUMBER: builtins.int
+    @property
+    def get_property(self) -> global___GetPropertyRequest: ...
+    @property
+    def set_property(self) -> global___SetPropertyRequest: ...
+    @property
+    def invoke_method(self) -> global___InvokeMethodRequest: ...
+    @property
+    def create(self) -> global___CreateRequest: ...
+    @property
+    def destroy(self) -> global___DestroyRequest: ...
+    @property
+    def connect_event(self) -> global___ConnectEventRequest: ...
+    @property
+    def disconnect_event(self) -> global___DisconnectEventRequest: ...
+    def __init__(
+        self,
+        *,
+        get_property: global___GetPropertyRequest | None = ...,
+        set_property: global___SetPropertyRequest | None = ...,
+        invoke_method: global___InvokeMethodRequest | None = ...,
+        create: global___CreateRequest | None = ...,
+        destroy: global___DestroyRequest | None = ...,
+        connect_event: global___ConnectEventRequest | None = ...,
+        disconnect_event: global___DisconnectEventRequest | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["connect_event", b"connect_event", "create", b"create", "destroy", b"destroy", "disconnect_event", b"disconnect_event", "get_property", b"get_property", "invoke_method", b"invoke_method", "request", b"request", "set_property", b"set_property"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["connect_event", b"connect_event", "create", b"create", "destroy", b"destroy", "disconnect_event", b"disconnect_event", "get_property", b"get_property", "invoke_method", b"invoke_method", "request", b"request", "set_property", b"set_property"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing.Literal["request", b"request"]) -> typing.Literal["get_property", "set_property", "invoke_method", "create", "destroy", "connect_event", "disconnect_event"] | None: ...
+
+global___BatchRequestItem = BatchRequestItem
+
+@typing.final
+class BatchRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CONTEXT_FIELD_NUMBER: builtins.int
+    ITEMS_FIELD_NUMBER: builtins.int
+    @property
+    def context(self) -> global___Context: ...
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___BatchRequestItem]: ...
+    def __init__(
+        self,
+        *,
+        context: global___Context | None = ...,
+        items: collections.abc.Iterable[global___BatchRequestItem] | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["context", b"context"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["context", b"context", "items", b"items"]) -> None: ...
+
+global___BatchRequest = BatchRequest
+
+@typing.final
+class BatchResponseItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CODE_FIELD_NUMBER: builtins.int
+    MESSAGE_FIELD_NUMBER: builtins.int
+    GET_PROPERTY_FIELD_NUMBER: builtins.int
+    SET_PROPERTY_FIELD_NUMBER: builtins.int
+    INVOKE_METHOD_FIELD_NUMBER: builtins.int
+    CREATE_FIELD_NUMBER: builtins.int
+    DESTROY_FIELD_NUMBER: builtins.int
+    CONNECT_EVENT_FIELD_NUMBER: builtins.int
+    DISCONNECT_EVENT_FIELD_NUMBER: builtins.int
+    code: builtins.int
+    message: builtins.str
+    @property
+    def get_property(self) -> global___GetPropertyResponse: ...
+    @property
+    def set_property(self) -> global___SetPropertyResponse: ...
+    @property
+    def invoke_method(self) -> global___InvokeMethodResponse: ...
+    @property
+    def create(self) -> global___CreateResponse: ...
+    @property
+    def destroy(self) -> global___DestroyResponse: ...
+    @property
+    def connect_event(self) -> global___ConnectEventResponse: ...
+    @property
+    def disconnect_event(self) -> global___DisconnectEventResponse: ...
+    def __init__(
+        self,
+        *,
+        code: builtins.int = ...,
+        message: builtins.str = ...,
+        get_property: global___GetPropertyResponse | None = ...,
+        set_property: global___SetPropertyResponse | None = ...,
+        invoke_method: global___InvokeMethodResponse | None = ...,
+        create: global___CreateResponse | None = ...,
+        destroy: global___DestroyResponse | None = ...,
+        connect_event: global___ConnectEventResponse | None = ...,
+        disconnect_event: global___DisconnectEventResponse | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["connect_event", b"connect_event", "create", b"create", "destroy", b"destroy", "disconnect_event", b"disconnect_event", "get_property", b"get_property", "invoke_method", b"invoke_method", "response", b"response", "set_property", b"set_property"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["code", b"code", "connect_event", b"connect_event", "create", b"create", "destroy", b"destroy", "disconnect_event", b"disconnect_event", "get_property", b"get_property", "invoke_method", b"invoke_method", "message", b"message", "response", b"response", "set_property", b"set_property"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing.Literal["response", b"response"]) -> typing.Literal["get_property", "set_property", "invoke_method", "create", "destroy", "connect_event", "disconnect_event"] | None: ...
+
+global___BatchResponseItem = BatchResponseItem
+
+@typing.final
+class BatchResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ITEMS_FIELD_NUMBER: builtins.int
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___BatchResponseItem]: ...
+    def __init__(
+        self,
+        *,
+        items: collections.abc.Iterable[global___BatchResponseItem] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["items", b"items"]) -> None: ...
+
+global___BatchResponse = BatchResponse
+
+@typing.final
+class CallRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ID_FIELD_NUMBER: builtins.int
+    GET_PROPERTY_FIELD_NUMBER: builtins.int
+    SET_PROPERTY_FIELD_NUMBER: builtins.int
+    INVOKE_METHOD_FIELD_NUMBER: builtins.int
+    id: builtins.int
+    @property
+    def get_property(self) -> global___GetPropertyRequest: ...
+    @property
+    def set_property(self) -> global___SetPropertyRequest: ...
+    @property
+    def invoke_method(self) -> global___InvokeMethodRequest: ...
+    def __init__(
+        self,
+        *,
+        id: builtins.int = ...,
+        get_property: global___GetPropertyRequest | None = ...,
+        set_property: global___SetPropertyRequest | None = ...,
+        invoke_method: global___InvokeMethodRequest | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["get_property", b"get_property", "invoke_method", b"invoke_method", "request", b"request", "set_property", b"set_property"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["get_property", b"get_property", "id", b"id", "invoke_method", b"invoke_method", "request", b"request", "set_property", b"set_property"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing.Literal["request", b"request"]) -> typing.Literal["get_property", "set_property", "invoke_method"] | None: ...
+
+global___CallRequest = CallRequest
+
+@typing.final
+class CallResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ID_FIELD_NUMBER: builtins.int
+    CODE_FIELD_NUMBER: builtins.int
+    MESSAGE_FIELD_NUMBER: builtins.int
+    GET_PROPERTY_FIELD_NUMBER: builtins.int
+    SET_PROPERTY_FIELD_NUMBER: builtins.int
+    INVOKE_METHOD_FIELD_NUMBER: builtins.int
+    id: builtins.int
+    code: builtins.int
+    message: builtins.str
+    @property
+    def get_property(self) -> global___GetPropertyResponse: ...
+    @property
+    def set_property(self) -> global___SetPropertyResponse: ...
+    @property
+    def invoke_method(self) -> global___InvokeMethodResponse: ...
+    def __init__(
+        self,
+        *,
+        id: builtins.int = ...,
+        code: builtins.int = ...,
+        message: builtins.str = ...,
+        get_property: global___GetPropertyResponse | None = ...,
+        set_property: global___SetPropertyResponse | None = ...,
+        invoke_method: global___InvokeMethodResponse | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["get_property", b"get_property", "invoke_method", b"invoke_method", "response", b"response", "set_property", b"set_property"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["code", b"code", "get_property", b"get_property", "id", b"id", "invoke_method", b"invoke_method", "message", b"message", "response", b"response", "set_property", b"set_property"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing.Literal["response", b"response"]) -> typing.Literal["get_property", "set_property", "invoke_method"] | None: ...
+
+global___CallResponse = CallResponse
+
 @typing.final
 class ConnectEventRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -720,14 +951,19 @@ class HandleEventRequest(google.protobuf.message.Message):
     ARGUMENTS_FIELD_NUMBER: builtins.int
     IS_PING_FIELD_NUMBER: builtins.int
     IS_PONG_FIELD_NUMBER: builtins.int
+    SEQUENCE_FIELD_NUMBER: builtins.int
+    EVENTS_FIELD_NUMBER: builtins.int
     timestamp: builtins.int
     id: builtins.str
     instance: builtins.str
     index: builtins.int
     is_ping: builtins.bool
     is_pong: builtins.bool
+    sequence: builtins.int
     @property
     def arguments(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___Variant]: ...
+    @property
+    def events(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___HandleEventRequest]: ...
     def __init__(
         self,
         *,
@@ -738,8 +974,10 @@ class HandleEventRequest(google.protobuf.message.Message):
         arguments: collections.abc.Iterable[global___Variant] | None = ...,
         is_ping: builtins.bool = ...,
         is_pong: builtins.bool = ...,
+        sequence: builtins.int = ...,
+        events: collections.abc.Iterable[global___HandleEventRequest] | None = ...,
     ) -> None: ...
-    def ClearField(self, field_name: typing.Literal["arguments", b"arguments", "id", b"id", "index", b"index", "instance", b"instance", "is_ping", b"is_ping", "is_pong", b"is_pong", "timestamp", b"timestamp"]) -> None: ...
+    def ClearField(self, field_name: typing.Literal["arguments", b"arguments", "events", b"events", "id", b"id", "index", b"index", "instance", b"instance", "is_ping", b"is_ping", "is_pong", b"is_pong", "sequence", b"sequence", "timestamp", b"timestamp"]) -> None: ...
 
 global___HandleEventRequest = HandleEventRequest
 
@@ -752,11 +990,15 @@ class HandleEventResponse(google.protobuf.message.Message):
     INDEX_FIELD_NUMBER: builtins.int
     IS_PING_FIELD_NUMBER: builtins.int
     IS_PONG_FIELD_NUMBER: builtins.int
+    BATCH_EVENTS_FIELD_NUMBER: builtins.int
+    ACKED_SEQUENCE_FIELD_NUMBER: builtins.int
     id: builtins.str
     instance: builtins.str
     index: builtins.int
     is_ping: builtins.bool
     is_pong: builtins.bool
+    batch_events: builtins.bool
+    acked_sequence: builtins.int
     def __init__(
         self,
         *,
@@ -765,7 +1007,9 @@ class HandleEventResponse(google.protobuf.message.Message):
         index: builtins.int = ...,
         is_ping: builtins.bool = ...,
         is_pong: builtins.bool = ...,
+        batch_events: builtins.bool = ...,
+        acked_sequence: builtins.int = ...,
     ) -> None: ...
-    def ClearField(self, field_name: typing.Literal["id", b"id", "index", b"index", "instance", b"instance", "is_ping", b"is_ping", "is_pong", b"is_pong"]) -> None: ...
+    def ClearField(self, field_name: typing.Literal["acked_sequence", b"acked_sequence", "batch_events", b"batch_events", "id", b"id", "index", b"index", "instance", b"instance", "is_ping", b"is_ping", "is_pong", b"is_pong"]) -> None: ...
 
 global___HandleEventResponse = HandleEventResponse
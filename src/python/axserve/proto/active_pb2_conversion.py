@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 import inspect
+import typing
 
 from typing import Any
 
@@ -124,3 +125,34 @@ AnnotationFromTypeName_Annotations = {
 
 def AnnotationFromTypeName(type_name: str) -> Any:
     return AnnotationFromTypeName_Annotations.get(type_name, inspect.Parameter.empty)
+
+
+TypeNameFromAnnotation_TypeNames = {
+    None: "void",
+    type(None): "void",
+    bool: "bool",
+    str: "QString",
+    int: "int",
+    float: "double",
+    list: "QVariantList",
+    dict: "QVariantMap",
+}
+
+TypeNameFromAnnotation_Annotations = {
+    "None": None,
+    "bool": bool,
+    "str": str,
+    "int": int,
+    "float": float,
+    "list": list,
+    "dict": dict,
+}
+
+
+def TypeNameFromAnnotation(annotation: Any) -> str:
+    if isinstance(annotation, str):
+        annotation = TypeNameFromAnnotation_Annotations.get(
+            annotation, inspect.Parameter.empty
+        )
+    annotation = typing.get_origin(annotation) or annotation
+    return TypeNameFromAnnotation_TypeNames.get(annotation, "QVariant")
@@ -49,6 +49,11 @@ class ActiveStub(object):
                 request_serializer=active__pb2.GetPropertyRequest.SerializeToString,
                 response_deserializer=active__pb2.GetPropertyResponse.FromString,
                 _registered_method=True)
+        self.GetProperties = channel.unary_unary(
+                '/axserve.Active/GetProperties',
+                request_serializer=active__pb2.GetPropertiesRequest.SerializeToString,
+                response_deserializer=active__pb2.GetPropertiesResponse.FromString,
+                _registered_method=True)
         self.SetProperty = channel.unary_unary(
                 '/axserve.Active/SetProperty',
                 request_serializer=active__pb2.SetPropertyRequest.SerializeToString,
@@ -74,6 +79,16 @@ class ActiveStub(object):
                 request_serializer=active__pb2.HandleEventResponse.SerializeToString,
                 response_deserializer=active__pb2.HandleEventRequest.FromString,
                 _registered_method=True)
+        self.Batch = channel.unary_unary(
+                '/axserve.Active/Batch',
+                request_serializer=active__pb2.BatchRequest.SerializeToString,
+                response_deserializer=active__pb2.BatchResponse.FromString,
+                _registered_method=True)
+        self.Call = channel.stream_stream(
+                '/axserve.Active/Call',
+                request_serializer=active__pb2.CallRequest.SerializeToString,
+                response_deserializer=active__pb2.CallResponse.FromString,
+                _registered_method=True)
 
 
 class ActiveServicer(object):
@@ -121,6 +136,12 @@ class ActiveServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetProperties(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SetProperty(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -151,6 +172,18 @@ class ActiveServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def Batch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Call(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ActiveServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -189,6 +222,11 @@ def add_ActiveServicer_to_server(servicer, server):
                     request_deserializer=active__pb2.GetPropertyRequest.FromString,
                     response_serializer=active__pb2.GetPropertyResponse.SerializeToString,
             ),
+            'GetProperties': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetProperties,
+                    request_deserializer=active__pb2.GetPropertiesRequest.FromString,
+                    response_serializer=active__pb2.GetPropertiesResponse.SerializeToString,
+            ),
             'SetProperty': grpc.unary_unary_rpc_method_handler(
                     servicer.SetProperty,
                     request_deserializer=active__pb2.SetPropertyRequest.FromString,
@@ -214,6 +252,16 @@ def add_ActiveServicer_to_server(servicer, server):
                     request_deserializer=active__pb2.HandleEventResponse.FromString,
                     response_serializer=active__pb2.HandleEventRequest.SerializeToString,
             ),
+            'Batch': grpc.unary_unary_rpc_method_handler(
+                    servicer.Batch,
+                    request_deserializer=active__pb2.BatchRequest.FromString,
+                    response_serializer=active__pb2.BatchResponse.SerializeToString,
+            ),
+            'Call': grpc.stream_stream_rpc_method_handler(
+                    servicer.Call,
+                    request_deserializer=active__pb2.CallRequest.FromString,
+                    response_serializer=active__pb2.CallResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'axserve.Active', rpc_method_handlers)
@@ -414,6 +462,33 @@ class Active(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetProperties(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/axserve.Active/GetProperties',
+            active__pb2.GetPropertiesRequest.SerializeToString,
+            active__pb2.GetPropertiesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def SetProperty(request,
             target,
@@ -548,3 +623,57 @@ class Active(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def Batch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/axserve.Active/Batch',
+            active__pb2.BatchRequest.SerializeToString,
+            active__pb2.BatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Call(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/axserve.Active/Call',
+            active__pb2.CallRequest.SerializeToString,
+            active__pb2.CallResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
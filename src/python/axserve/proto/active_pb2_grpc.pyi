@@ -69,6 +69,11 @@ class ActiveStub:
         active_pb2.GetPropertyResponse,
     ]
 
+    GetProperties: grpc.UnaryUnaryMultiCallable[
+        active_pb2.GetPropertiesRequest,
+        active_pb2.GetPropertiesResponse,
+    ]
+
     SetProperty: grpc.UnaryUnaryMultiCallable[
         active_pb2.SetPropertyRequest,
         active_pb2.SetPropertyResponse,
@@ -94,6 +99,16 @@ class ActiveStub:
         active_pb2.HandleEventRequest,
     ]
 
+    Batch: grpc.UnaryUnaryMultiCallable[
+        active_pb2.BatchRequest,
+        active_pb2.BatchResponse,
+    ]
+
+    Call: grpc.StreamStreamMultiCallable[
+        active_pb2.CallRequest,
+        active_pb2.CallResponse,
+    ]
+
 class ActiveAsyncStub:
     Create: grpc.aio.UnaryUnaryMultiCallable[
         active_pb2.CreateRequest,
@@ -130,6 +145,11 @@ class ActiveAsyncStub:
         active_pb2.GetPropertyResponse,
     ]
 
+    GetProperties: grpc.aio.UnaryUnaryMultiCallable[
+        active_pb2.GetPropertiesRequest,
+        active_pb2.GetPropertiesResponse,
+    ]
+
     SetProperty: grpc.aio.UnaryUnaryMultiCallable[
         active_pb2.SetPropertyRequest,
         active_pb2.SetPropertyResponse,
@@ -155,6 +175,16 @@ class ActiveAsyncStub:
         active_pb2.HandleEventRequest,
     ]
 
+    Batch: grpc.aio.UnaryUnaryMultiCallable[
+        active_pb2.BatchRequest,
+        active_pb2.BatchResponse,
+    ]
+
+    Call: grpc.aio.StreamStreamMultiCallable[
+        active_pb2.CallRequest,
+        active_pb2.CallResponse,
+    ]
+
 class ActiveServicer(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def Create(
@@ -205,6 +235,13 @@ class ActiveServicer(metaclass=abc.ABCMeta):
         context: _ServicerContext,
     ) -> typing.Union[active_pb2.GetPropertyResponse, collections.abc.Awaitable[active_pb2.GetPropertyResponse]]: ...
 
+    @abc.abstractmethod
+    def GetProperties(
+        self,
+        request: active_pb2.GetPropertiesRequest,
+        context: _ServicerContext,
+    ) -> typing.Union[active_pb2.GetPropertiesResponse, collections.abc.Awaitable[active_pb2.GetPropertiesResponse]]: ...
+
     @abc.abstractmethod
     def SetProperty(
         self,
@@ -240,4 +277,18 @@ class ActiveServicer(metaclass=abc.ABCMeta):
         context: _ServicerContext,
     ) -> typing.Union[collections.abc.Iterator[active_pb2.HandleEventRequest], collections.abc.AsyncIterator[active_pb2.HandleEventRequest]]: ...
 
+    @abc.abstractmethod
+    def Batch(
+        self,
+        request: active_pb2.BatchRequest,
+        context: _ServicerContext,
+    ) -> typing.Union[active_pb2.BatchResponse, collections.abc.Awaitable[active_pb2.BatchResponse]]: ...
+
+    @abc.abstractmethod
+    def Call(
+        self,
+        request_iterator: _MaybeAsyncIterator[active_pb2.CallRequest],
+        context: _ServicerContext,
+    ) -> typing.Union[collections.abc.Iterator[active_pb2.CallResponse], collections.abc.AsyncIterator[active_pb2.CallResponse]]: ...
+
 def add_ActiveServicer_to_server(servicer: ActiveServicer, server: typing.Union[grpc.Server, grpc.aio.Server]) -> None: ...
@@ -18,16 +18,39 @@
 
 from __future__ import annotations
 
+import contextlib
+import logging
 import platform
+import subprocess
+import sys
+import threading
+import time
 
+from collections import deque
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import grpc
 
 from axserve.common.process import ScopedProcess
 from axserve.common.registry import check_machine_for_clsid
+from axserve.common.socket import make_local_address
+from axserve.common.socket import remove_unix_socket
+
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import IO
+
+
+logger = logging.getLogger(__name__)
 
 
 EXECUTABLE_DIR = Path(__file__).parent / "exe"
 
+READY_LINE_PREFIX = "AXSERVE_READY "
+ERROR_LINE = "AXSERVE_ERROR"
+
 
 def find_server_executable_for_machine(machine: str) -> Path:
     name = f"axserve-console-{machine.lower()}.exe"
@@ -46,16 +69,340 @@ def find_server_executable_for_clsid(clsid: str) -> Path:
     return find_server_executable_for_machine(machine)
 
 
+def parse_ready_line(line: str | bytes) -> str | None:
+    if isinstance(line, bytes):
+        line = line.decode(errors="replace")
+    line = line.strip()
+    if line.startswith(READY_LINE_PREFIX):
+        return line.removeprefix(READY_LINE_PREFIX).strip()
+    if line == ERROR_LINE:
+        msg = "Server failed to start"
+        raise RuntimeError(msg)
+    return None
+
+
+def forward_output(line: bytes, output: IO[bytes] | None = None) -> None:
+    if output is None:
+        output = getattr(sys.stdout, "buffer", None)
+    if output is None:
+        return
+    try:
+        output.write(line)
+        output.flush()
+    except (OSError, ValueError):
+        logger.debug("Failed to forward server output", exc_info=True)
+
+
 class AxServeServerProcess(ScopedProcess):
+    _address: str
+    _ready: threading.Event
+    _ready_error: BaseException | None
+    _stdout_thread: threading.Thread
+
     def __init__(
         self,
-        address: str,
+        address: str = "localhost:0",
         *,
         machine: str | None = None,
+        ready_timeout: float | None = None,
         **kwargs,
     ):
         if not machine:
             machine = platform.machine()
+        if not ready_timeout:
+            ready_timeout = 15
         executable = find_server_executable_for_machine(machine)
-        cmd = [executable, "--preset", "service", "--address-uri", address]
+        cmd = [
+            executable,
+            "--preset",
+            "service",
+            "--address-uri",
+            address,
+            "--report-ready",
+        ]
+        self._address = address
+        self._ready = threading.Event()
+        self._ready_error = None
+        remove_unix_socket(address)
+        kwargs["stdout"] = subprocess.PIPE
         super().__init__(cmd, **kwargs)
+        self._stdout_thread = threading.Thread(
+            target=self._read_stdout,
+            daemon=True,
+        )
+        self._stdout_thread.start()
+        self._wait_ready(ready_timeout)
+
+    def _read_stdout(self) -> None:
+        stdout = self.stdout
+        if stdout is None:
+            return
+        try:
+            for line in stdout:
+                if not self._ready.is_set():
+                    try:
+                        address = parse_ready_line(line)
+                    except RuntimeError as exc:
+                        self._ready_error = exc
+                        self._ready.set()
+                        continue
+                    if address is not None:
+                        self._address = address
+                        self._ready.set()
+                        continue
+                forward_output(line)
+        except BaseException as exc:  # noqa: BLE001
+            if not self._ready.is_set():
+                self._ready_error = exc
+        finally:
+            if not self._ready.is_set():
+                if self._ready_error is None:
+                    msg = "Server exited before reporting readiness"
+                    self._ready_error = RuntimeError(msg)
+                self._ready.set()
+
+    def _wait_ready(self, timeout: float) -> None:
+        if not self._ready.wait(timeout):
+            self.terminate()
+            self.wait()
+            msg = f"Server did not report readiness within {timeout} seconds"
+            raise TimeoutError(msg)
+        if self._ready_error is not None:
+            self.terminate()
+            self.wait()
+            raise self._ready_error
+
+    @property
+    def address(self) -> str:
+        return self._address
+
+    def wait(self, timeout: float | None = None) -> int:
+        returncode = super().wait(timeout)
+        remove_unix_socket(self._address)
+        return returncode
+
+
+class AxServeServerProcessPool:
+    _size: int
+    _machine: str
+    _transport: str
+    _idle_timeout: float | None
+    _ready_timeout: float | None
+    _retry_interval: float
+
+    _ready: deque[tuple[AxServeServerProcess, grpc.Channel]]
+    _spawning: int
+    _idle: bool
+    _closed: bool
+    _last_acquired: float
+    _condition: threading.Condition
+    _thread: threading.Thread
+
+    def __init__(
+        self,
+        size: int = 1,
+        *,
+        machine: str | None = None,
+        transport: str = "tcp",
+        idle_timeout: float | None = None,
+        ready_timeout: float | None = None,
+        retry_interval: float = 1.0,
+    ):
+        if not machine:
+            machine = platform.machine()
+        if size < 0:
+            msg = f"Invalid pool size: {size}"
+            raise ValueError(msg)
+        self._size = size
+        self._machine = machine
+        self._transport = transport
+        self._idle_timeout = idle_timeout
+        self._ready_timeout = ready_timeout
+        self._retry_interval = retry_interval
+        self._ready = deque()
+        self._spawning = 0
+        self._idle = False
+        self._closed = False
+        self._last_acquired = time.monotonic()
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def machine(self) -> str:
+        return self._machine
+
+    @property
+    def transport(self) -> str:
+        return self._transport
+
+    def _spawn(self) -> tuple[AxServeServerProcess, grpc.Channel]:
+        address = make_local_address(self._transport)
+        process = AxServeServerProcess(
+            address,
+            machine=self._machine,
+            ready_timeout=self._ready_timeout,
+        )
+        channel = grpc.insecure_channel(process.address)
+        try:
+            grpc.channel_ready_future(channel).result(timeout=self._ready_timeout)
+        except BaseException:
+            self._discard([(process, channel)])
+            raise
+        return process, channel
+
+    def _discard(self, entries: list[tuple[AxServeServerProcess, grpc.Channel]]):
+        for process, channel in entries:
+            channel.close()
+            with contextlib.suppress(ProcessLookupError):
+                process.terminate()
+            process.wait()
+
+    def _is_idle_expired(self) -> bool:
+        return (
+            self._idle_timeout is not None
+            and not self._idle
+            and time.monotonic() - self._last_acquired >= self._idle_timeout
+        )
+
+    def _should_spawn(self) -> bool:
+        return (
+            not self._closed
+            and not self._idle
+            and len(self._ready) + self._spawning < self._size
+        )
+
+    def _has_work(self) -> bool:
+        return self._closed or self._should_spawn() or self._is_idle_expired()
+
+    def _get_idle_wait(self) -> float | None:
+        if self._idle_timeout is None or self._idle:
+            return None
+        elapsed_time = time.monotonic() - self._last_acquired
+        return max(0.0, self._idle_timeout - elapsed_time)
+
+    def _run(self) -> None:
+        while True:
+            reaped = []
+            with self._condition:
+                self._condition.wait_for(self._has_work, self._get_idle_wait())
+                if self._closed:
+                    return
+                if self._is_idle_expired():
+                    self._idle = True
+                    reaped = list(self._ready)
+                    self._ready.clear()
+                spawn = self._should_spawn()
+                if spawn:
+                    self._spawning += 1
+            self._discard(reaped)
+            if spawn:
+                self._replenish()
+
+    def _replenish(self) -> None:
+        entry = None
+        try:
+            entry = self._spawn()
+        except Exception:
+            logger.exception("Failed to spawn a warm server process")
+        with self._condition:
+            self._spawning -= 1
+            if entry is not None and not self._closed and not self._idle:
+                self._ready.append(entry)
+                self._condition.notify_all()
+                return
+            if entry is None and not self._closed:
+                self._condition.wait(self._retry_interval)
+        if entry is not None:
+            self._discard([entry])
+
+    def acquire(self) -> tuple[AxServeServerProcess, grpc.Channel]:
+        stale = []
+        entry = None
+        with self._condition:
+            if self._closed:
+                msg = "Server process pool is closed"
+                raise RuntimeError(msg)
+            self._last_acquired = time.monotonic()
+            self._idle = False
+            while self._ready:
+                process, channel = self._ready.popleft()
+                if process.poll() is None:
+                    entry = (process, channel)
+                    break
+                stale.append((process, channel))
+            self._condition.notify_all()
+        self._discard(stale)
+        if entry is None:
+            entry = self._spawn()
+        return entry
+
+    def close(self, timeout: float | None = None) -> None:
+        with self._condition:
+            self._closed = True
+            reaped = list(self._ready)
+            self._ready.clear()
+            self._condition.notify_all()
+        self._discard(reaped)
+        self._thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+_warm_pools: dict[tuple[str, str], AxServeServerProcessPool] = {}
+_warm_pools_lock = threading.Lock()
+
+
+def enable_warm_pool(
+    size: int = 1,
+    *,
+    machine: str | None = None,
+    transport: str = "tcp",
+    idle_timeout: float | None = None,
+    ready_timeout: float | None = None,
+) -> AxServeServerProcessPool:
+    if not machine:
+        machine = platform.machine()
+    pool = AxServeServerProcessPool(
+        size,
+        machine=machine,
+        transport=transport,
+        idle_timeout=idle_timeout,
+        ready_timeout=ready_timeout,
+    )
+    with _warm_pools_lock:
+        previous = _warm_pools.get((machine, transport))
+        _warm_pools[(machine, transport)] = pool
+    if previous is not None:
+        previous.close()
+    return pool
+
+
+def disable_warm_pool(machine: str | None = None, transport: str = "tcp") -> None:
+    if not machine:
+        machine = platform.machine()
+    with _warm_pools_lock:
+        pool = _warm_pools.pop((machine, transport), None)
+    if pool is not None:
+        pool.close()
+
+
+def get_warm_pool(
+    machine: str | None = None, transport: str = "tcp"
+) -> AxServeServerProcessPool | None:
+    if not machine:
+        machine = platform.machine()
+    return _warm_pools.get((machine, transport))
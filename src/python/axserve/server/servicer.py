@@ -0,0 +1,901 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-FileCopyrightText: 2025 Yunseong Hwang
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+import time
+import typing
+import uuid
+
+from collections import deque
+from concurrent.futures import CancelledError
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue
+from threading import RLock
+from threading import Thread
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+
+import grpc
+
+from axserve.common.socket import get_unix_socket_path
+from axserve.common.socket import remove_unix_socket
+from axserve.proto import active_pb2
+from axserve.proto import active_pb2_grpc
+from axserve.proto.active_pb2_conversion import TypeNameFromAnnotation
+from axserve.proto.active_pb2_conversion import ValueFromVariant
+from axserve.proto.active_pb2_conversion import ValueToVariant
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from types import TracebackType
+
+
+# ruff:noqa: N802, ARG002
+
+
+class AxServeControlEvent:
+    def __init__(self, func: Callable[..., Any]) -> None:
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._name = func.__name__
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: AxServeControl | None, owner: type | None = None):
+        if instance is None:
+            return self
+        return functools.partial(instance._fire_event, self._name)
+
+
+def event(f: Callable[..., Any]) -> AxServeControlEvent:
+    return AxServeControlEvent(f)
+
+
+def _get_type_hints(func: Callable[..., Any]) -> dict[str, Any]:
+    try:
+        return typing.get_type_hints(func)
+    except (NameError, TypeError):
+        return dict(getattr(func, "__annotations__", {}))
+
+
+def _make_argument_infos(
+    func: Callable[..., Any],
+) -> list[active_pb2.ArgumentInfo]:
+    hints = _get_type_hints(func)
+    signature = inspect.signature(func)
+    infos = []
+    for name in list(signature.parameters)[1:]:
+        info = active_pb2.ArgumentInfo()
+        info.name = name
+        info.argument_type = TypeNameFromAnnotation(
+            hints.get(name, inspect.Parameter.empty)
+        )
+        infos.append(info)
+    return infos
+
+
+class AxServeControlDescription:
+    def __init__(self, cls: type[AxServeControl]) -> None:
+        self.properties: list[tuple[str, property]] = []
+        self.methods: list[tuple[str, Callable[..., Any]]] = []
+        self.events: list[tuple[str, AxServeControlEvent]] = []
+        self.event_indices: dict[str, int] = {}
+        self.response = active_pb2.DescribeResponse()
+
+        members: dict[str, Any] = {}
+        for klass in reversed(cls.__mro__):
+            if klass in (object, AxServeControl):
+                continue
+            for name, value in vars(klass).items():
+                if name.startswith("_"):
+                    continue
+                members[name] = value
+
+        for name, value in members.items():
+            if isinstance(value, property):
+                info = self.response.properties.add()
+                info.index = len(self.properties)
+                info.name = name
+                info.property_type = (
+                    TypeNameFromAnnotation(
+                        _get_type_hints(value.fget).get(
+                            "return", inspect.Parameter.empty
+                        )
+                    )
+                    if value.fget
+                    else "QVariant"
+                )
+                info.is_readable = value.fget is not None
+                info.is_writable = value.fset is not None
+                self.properties.append((name, value))
+            elif isinstance(value, AxServeControlEvent):
+                info = self.response.events.add()
+                info.index = len(self.events)
+                info.name = name
+                info.arguments.extend(_make_argument_infos(value._func))
+                self.event_indices[name] = info.index
+                self.events.append((name, value))
+            elif inspect.isfunction(value):
+                info = self.response.methods.add()
+                info.index = len(self.methods)
+                info.name = name
+                info.arguments.extend(_make_argument_infos(value))
+                info.return_type = TypeNameFromAnnotation(
+                    _get_type_hints(value).get("return", inspect.Parameter.empty)
+                )
+                self.methods.append((name, value))
+
+
+class AxServeControl:
+    __CLSID__: ClassVar[str | None] = None
+
+    _servicer: AxServeServicer | None = None
+    _instance: str | None = None
+
+    @classmethod
+    def _get_description(cls) -> AxServeControlDescription:
+        description = cls.__dict__.get("__axserve_description__")
+        if description is None:
+            description = AxServeControlDescription(cls)
+            cls.__axserve_description__ = description  # type: ignore
+        return description
+
+    @property
+    def instance(self) -> str | None:
+        return self._instance
+
+    def _fire_event(self, name: str, *args: Any) -> Future[None] | None:
+        servicer = self._servicer
+        instance = self._instance
+        if not (servicer and instance):
+            return None
+        index = self._get_description().event_indices[name]
+        return servicer._fire_event(instance, index, args)
+
+
+class AxServeServicerError(Exception):
+    def __init__(
+        self,
+        details: str,
+        code: grpc.StatusCode = grpc.StatusCode.UNKNOWN,
+    ) -> None:
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+class AxServeInboundItem:
+    def __init__(self, func: Callable[[], Any]) -> None:
+        self._func = func
+        self._future: Future[Any] = Future()
+
+    def execute(self) -> bool:
+        if not self._future.set_running_or_notify_cancel():
+            return False
+        try:
+            result = self._func()
+        except BaseException as exc:  # noqa: BLE001
+            self._future.set_exception(exc)
+            return False
+        self._future.set_result(result)
+        return True
+
+    def cancel(self) -> bool:
+        return self._future.cancel()
+
+    def add_done_callback(self, fn: Callable[[Future[Any]], Any]) -> None:
+        self._future.add_done_callback(fn)
+
+    def result(self, timeout: float | None = None) -> Any:
+        return self._future.result(timeout)
+
+
+class AxServeOutboundItem:
+    def __init__(self, instance: str, index: int, args: Iterable[Any]) -> None:
+        self.id = str(uuid.uuid4())
+        self.request = active_pb2.HandleEventRequest()
+        self.request.timestamp = int(time.time() * 1000)
+        self.request.id = self.id
+        self.request.instance = instance
+        self.request.index = index
+        for arg in args:
+            ValueToVariant(arg, self.request.arguments.add())
+        self._inbounds: SimpleQueue[AxServeInboundItem | None] = SimpleQueue()
+        self._streams: set[str] = set()
+        self._lock = RLock()
+        self._done = False
+
+    def send_to(self, streams: Iterable[AxServeEventStream]) -> None:
+        streams = list(streams)
+        with self._lock:
+            if not streams:
+                self._done = True
+                return
+            self._streams.update(stream.id for stream in streams)
+        for stream in streams:
+            stream.send(self)
+
+    def notify_handled_by(self, stream: AxServeEventStream) -> None:
+        with self._lock:
+            self._streams.discard(stream.id)
+            if self._streams or self._done:
+                return
+            self._done = True
+        self._inbounds.put(None)
+
+    def send(self, item: AxServeInboundItem) -> None:
+        self._inbounds.put(item)
+
+    def done(self) -> bool:
+        with self._lock:
+            return self._done
+
+    def exec(self) -> None:
+        while not self.done():
+            item = self._inbounds.get()
+            if item is not None:
+                item.execute()
+
+
+class AxServeEventStream:
+    max_batch_size = 256
+
+    def __init__(self, peer: str) -> None:
+        self.id = str(uuid.uuid4())
+        self.peer = peer
+        self._outgoing: SimpleQueue[
+            AxServeOutboundItem | active_pb2.HandleEventRequest | None
+        ] = SimpleQueue()
+        self._running: dict[str, AxServeOutboundItem] = {}
+        self._sequences: dict[int, str] = {}
+        self._sequence = 0
+        self._batch_events = False
+        self._lock = RLock()
+        self._closed = False
+
+    def send(self, item: AxServeOutboundItem) -> None:
+        with self._lock:
+            if self._closed:
+                item.notify_handled_by(self)
+                return
+            self._running[item.id] = item
+        self._outgoing.put(item)
+
+    def handle(self, response: active_pb2.HandleEventResponse) -> None:
+        if response.is_ping:
+            pong = active_pb2.HandleEventRequest()
+            pong.is_pong = True
+            self._outgoing.put(pong)
+            return
+        if response.batch_events:
+            with self._lock:
+                self._batch_events = True
+            return
+        items = []
+        with self._lock:
+            if response.acked_sequence:
+                while self._sequences:
+                    sequence = next(iter(self._sequences))
+                    if sequence > response.acked_sequence:
+                        break
+                    item_id = self._sequences.pop(sequence)
+                    if item := self._running.pop(item_id, None):
+                        items.append(item)
+            elif item := self._running.pop(response.id, None):
+                items.append(item)
+                while self._sequences:
+                    sequence = next(iter(self._sequences))
+                    if self._sequences[sequence] in self._running:
+                        break
+                    del self._sequences[sequence]
+        for item in items:
+            item.notify_handled_by(self)
+
+    def _make_frame(
+        self, items: list[AxServeOutboundItem]
+    ) -> active_pb2.HandleEventRequest:
+        frame = active_pb2.HandleEventRequest()
+        with self._lock:
+            for item in items:
+                self._sequence += 1
+                self._sequences[self._sequence] = item.id
+                event = frame.events.add()
+                event.CopyFrom(item.request)
+                event.sequence = self._sequence
+        return frame
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            items = list(self._running.values())
+            self._running.clear()
+            self._sequences.clear()
+        for item in items:
+            item.notify_handled_by(self)
+        self._outgoing.put(None)
+
+    def __iter__(self) -> Iterator[active_pb2.HandleEventRequest]:
+        requests: deque[AxServeOutboundItem | active_pb2.HandleEventRequest | None]
+        requests = deque()
+        while True:
+            if not requests:
+                requests.append(self._outgoing.get())
+            request = requests.popleft()
+            if request is None:
+                return
+            if not isinstance(request, AxServeOutboundItem):
+                yield request
+            elif not self._batch_events:
+                yield request.request
+            else:
+                items = [request]
+                while not self._outgoing.empty() and len(items) < self.max_batch_size:
+                    request = self._outgoing.get_nowait()
+                    if not isinstance(request, AxServeOutboundItem):
+                        requests.append(request)
+                        break
+                    items.append(request)
+                yield self._make_frame(items)
+
+
+class AxServeExecutor:
+    def __init__(self) -> None:
+        self._inbounds: SimpleQueue[AxServeInboundItem | None] = SimpleQueue()
+        self._thread: Thread | None = None
+
+    def _exec_target(self) -> None:
+        while (item := self._inbounds.get()) is not None:
+            item.execute()
+
+    def start(self) -> None:
+        if not self._thread:
+            self._thread = Thread(target=self._exec_target, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread:
+            self._inbounds.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def is_current(self) -> bool:
+        return self._thread is threading.current_thread()
+
+    def send(self, item: AxServeInboundItem) -> None:
+        self._inbounds.put(item)
+
+
+class AxServeServicer(active_pb2_grpc.ActiveServicer):
+    def __init__(self, controls: Iterable[type[AxServeControl]] = ()) -> None:
+        self._control_classes: dict[str, type[AxServeControl]] = {}
+        self._controls: dict[str, AxServeControl] = {}
+        self._references: dict[str, int] = {}
+        self._connections: dict[tuple[str, int], dict[str, int]] = {}
+        self._streams: dict[str, dict[str, AxServeEventStream]] = {}
+        self._outbounds: dict[str, AxServeOutboundItem] = {}
+        self._lock = RLock()
+        self._executor = AxServeExecutor()
+        self._executor.start()
+        for control in controls:
+            self.register(control)
+
+    def register(self, control: type[AxServeControl], clsid: str | None = None) -> None:
+        if not clsid:
+            clsid = control.__CLSID__ or control.__name__
+        self._control_classes[clsid] = control
+
+    def get_control(self, instance: str) -> AxServeControl:
+        return self._get_control(instance)
+
+    def close(self) -> None:
+        with self._lock:
+            streams = [
+                stream
+                for streams in self._streams.values()
+                for stream in streams.values()
+            ]
+        for stream in streams:
+            stream.close()
+        self._executor.stop()
+
+    def _get_control(self, instance: str) -> AxServeControl:
+        with self._lock:
+            control = self._controls.get(instance)
+        if control is None:
+            msg = "Target instance does not exist"
+            raise AxServeServicerError(msg)
+        return control
+
+    def _get_streams_for(self, instance: str, index: int) -> list[AxServeEventStream]:
+        with self._lock:
+            peers = list(self._connections.get((instance, index), {}))
+            return [
+                stream
+                for peer in peers
+                for stream in self._streams.get(peer, {}).values()
+            ]
+
+    def _fire_event(
+        self, instance: str, index: int, args: Iterable[Any]
+    ) -> Future[None] | None:
+        if not self._executor.is_current():
+            item = AxServeInboundItem(
+                functools.partial(self._fire_event, instance, index, tuple(args))
+            )
+            self._executor.send(item)
+            return item._future
+        outbound = AxServeOutboundItem(instance, index, args)
+        with self._lock:
+            self._outbounds[outbound.id] = outbound
+        try:
+            outbound.send_to(self._get_streams_for(instance, index))
+            outbound.exec()
+        finally:
+            with self._lock:
+                self._outbounds.pop(outbound.id, None)
+        return None
+
+    def _send_inbound(self, context: active_pb2.Context, item: AxServeInboundItem):
+        if context.context_type == active_pb2.ContextType.EVENT:
+            with self._lock:
+                outbound = self._outbounds.get(context.context_info.id)
+            if outbound is None:
+                msg = "Target event context does not exist"
+                raise AxServeServicerError(msg)
+            outbound.send(item)
+        else:
+            self._executor.send(item)
+
+    def _schedule(self, request: Any, context: grpc.ServicerContext, func):
+        item = AxServeInboundItem(functools.partial(func, request, context))
+        context.add_callback(item.cancel)
+        try:
+            self._send_inbound(request.context, item)
+            return item.result()
+        except CancelledError:
+            context.abort(grpc.StatusCode.CANCELLED, "Request was cancelled")
+        except AxServeServicerError as exc:
+            context.abort(exc.code, exc.details)
+        except Exception as exc:  # noqa: BLE001
+            context.abort(grpc.StatusCode.UNKNOWN, str(exc))
+
+    def _execute_create(self, request: active_pb2.CreateRequest, context):
+        control_class = self._control_classes.get(request.clsid)
+        if control_class is None:
+            msg = "Failed to create an instance"
+            raise AxServeServicerError(msg)
+        control = control_class()
+        instance = "{" + str(uuid.uuid4()) + "}"
+        control._servicer = self
+        control._instance = instance
+        with self._lock:
+            self._controls[instance] = control
+            self._references[instance] = 0
+        response = active_pb2.CreateResponse()
+        response.instance = instance
+        return response
+
+    def _execute_refer(self, request: active_pb2.ReferRequest, context):
+        self._get_control(request.instance)
+        with self._lock:
+            self._references[request.instance] += 1
+        response = active_pb2.ReferResponse()
+        response.successful = True
+        return response
+
+    def _execute_release(self, request: active_pb2.ReleaseRequest, context):
+        self._get_control(request.instance)
+        with self._lock:
+            self._references[request.instance] -= 1
+        response = active_pb2.ReleaseResponse()
+        response.successful = True
+        return response
+
+    def _execute_destroy(self, request: active_pb2.DestroyRequest, context):
+        with self._lock:
+            control = self._controls.pop(request.instance, None)
+            self._references.pop(request.instance, None)
+            for key in list(self._connections):
+                if key[0] == request.instance:
+                    del self._connections[key]
+        if control is None:
+            msg = "Failed to destroy the instance"
+            raise AxServeServicerError(msg)
+        control._servicer = None
+        response = active_pb2.DestroyResponse()
+        response.successful = True
+        return response
+
+    def _execute_list(self, request: active_pb2.ListRequest, context):
+        response = active_pb2.ListResponse()
+        with self._lock:
+            for instance, control in self._controls.items():
+                item = response.items.add()
+                item.instance = instance
+                item.clsid = type(control).__CLSID__ or type(control).__name__
+                item.references = self._references[instance]
+        return response
+
+    def _execute_describe(self, request: active_pb2.DescribeRequest, context):
+        control = self._get_control(request.instance)
+        response = active_pb2.DescribeResponse()
+        response.CopyFrom(control._get_description().response)
+        return response
+
+    def _get_property_value(self, control: AxServeControl, index: int) -> Any:
+        properties = control._get_description().properties
+        if index >= len(properties):
+            msg = f"Given index {index} is out of range [0, {len(properties)})"
+            raise AxServeServicerError(msg)
+        name, prop = properties[index]
+        if prop.fget is None:
+            msg = "Failed to get property"
+            raise AxServeServicerError(msg)
+        return getattr(control, name)
+
+    def _execute_get_property(self, request: active_pb2.GetPropertyRequest, context):
+        control = self._get_control(request.instance)
+        value = self._get_property_value(control, request.index)
+        response = active_pb2.GetPropertyResponse()
+        ValueToVariant(value, response.value)
+        return response
+
+    def _execute_get_properties(
+        self, request: active_pb2.GetPropertiesRequest, context
+    ):
+        control = self._get_control(request.instance)
+        response = active_pb2.GetPropertiesResponse()
+        for index in request.indexes:
+            value = self._get_property_value(control, index)
+            ValueToVariant(value, response.values.add())
+        return response
+
+    def _execute_set_property(self, request: active_pb2.SetPropertyRequest, context):
+        control = self._get_control(request.instance)
+        properties = control._get_description().properties
+        if request.index >= len(properties):
+            msg = f"Given index {request.index} is out of range [0, {len(properties)})"
+            raise AxServeServicerError(msg)
+        name, prop = properties[request.index]
+        if prop.fset is None:
+            msg = "Failed to set property"
+            raise AxServeServicerError(msg)
+        setattr(control, name, ValueFromVariant(request.value))
+        response = active_pb2.SetPropertyResponse()
+        response.successful = True
+        return response
+
+    def _execute_invoke_method(self, request: active_pb2.InvokeMethodRequest, context):
+        control = self._get_control(request.instance)
+        methods = control._get_description().methods
+        if request.index >= len(methods):
+            msg = f"Given index {request.index} is out of range [0, {len(methods)})"
+            raise AxServeServicerError(msg)
+        name, _ = methods[request.index]
+        args = [ValueFromVariant(arg) for arg in request.arguments]
+        return_value = getattr(control, name)(*args)
+        response = active_pb2.InvokeMethodResponse()
+        if return_value is not None:
+            ValueToVariant(return_value, response.return_value)
+        return response
+
+    def _check_event_index(self, control: AxServeControl, index: int) -> None:
+        events = control._get_description().events
+        if index >= len(events):
+            msg = f"Given index {index} is out of range [0, {len(events)})"
+            raise AxServeServicerError(msg)
+
+    def _execute_connect_event(self, request: active_pb2.ConnectEventRequest, context):
+        control = self._get_control(request.instance)
+        self._check_event_index(control, request.index)
+        peer = context.peer()
+        with self._lock:
+            connections = self._connections.setdefault(
+                (request.instance, request.index), {}
+            )
+            connections[peer] = connections.get(peer, 0) + 1
+        response = active_pb2.ConnectEventResponse()
+        response.successful = True
+        return response
+
+    def _execute_disconnect_event(
+        self, request: active_pb2.DisconnectEventRequest, context
+    ):
+        control = self._get_control(request.instance)
+        self._check_event_index(control, request.index)
+        peer = context.peer()
+        with self._lock:
+            connections = self._connections.get((request.instance, request.index))
+            if not connections or peer not in connections:
+                msg = "Failed to disconnect event"
+                raise AxServeServicerError(msg)
+            connections[peer] -= 1
+            if connections[peer] <= 0:
+                del connections[peer]
+        response = active_pb2.DisconnectEventResponse()
+        response.successful = True
+        return response
+
+    def _execute_request_item(
+        self,
+        request_item: active_pb2.BatchRequestItem | active_pb2.CallRequest,
+        response_item: active_pb2.BatchResponseItem | active_pb2.CallResponse,
+        context,
+    ) -> None:
+        field = request_item.WhichOneof("request")
+        execute = {
+            "get_property": self._execute_get_property,
+            "set_property": self._execute_set_property,
+            "invoke_method": self._execute_invoke_method,
+            "create": self._execute_create,
+            "destroy": self._execute_destroy,
+            "connect_event": self._execute_connect_event,
+            "disconnect_event": self._execute_disconnect_event,
+        }.get(field or "")
+        if execute is None:
+            response_item.code = grpc.StatusCode.INVALID_ARGUMENT.value[0]
+            response_item.message = "Empty batch request item"
+            return
+        try:
+            response = execute(getattr(request_item, field), context)
+        except AxServeServicerError as exc:
+            response_item.code = exc.code.value[0]
+            response_item.message = exc.details
+        except Exception as exc:  # noqa: BLE001
+            response_item.code = grpc.StatusCode.UNKNOWN.value[0]
+            response_item.message = str(exc)
+        else:
+            getattr(response_item, field).CopyFrom(response)
+
+    def _execute_batch(self, request: active_pb2.BatchRequest, context):
+        response = active_pb2.BatchResponse()
+        for request_item in request.items:
+            self._execute_request_item(request_item, response.items.add(), context)
+        return response
+
+    def Create(self, request, context):
+        return self._schedule(request, context, self._execute_create)
+
+    def Refer(self, request, context):
+        return self._schedule(request, context, self._execute_refer)
+
+    def Release(self, request, context):
+        return self._schedule(request, context, self._execute_release)
+
+    def Destroy(self, request, context):
+        return self._schedule(request, context, self._execute_destroy)
+
+    def List(self, request, context):
+        return self._schedule(request, context, self._execute_list)
+
+    def Describe(self, request, context):
+        return self._schedule(request, context, self._execute_describe)
+
+    def GetProperty(self, request, context):
+        return self._schedule(request, context, self._execute_get_property)
+
+    def GetProperties(self, request, context):
+        return self._schedule(request, context, self._execute_get_properties)
+
+    def SetProperty(self, request, context):
+        return self._schedule(request, context, self._execute_set_property)
+
+    def InvokeMethod(self, request, context):
+        return self._schedule(request, context, self._execute_invoke_method)
+
+    def ConnectEvent(self, request, context):
+        return self._schedule(request, context, self._execute_connect_event)
+
+    def DisconnectEvent(self, request, context):
+        return self._schedule(request, context, self._execute_disconnect_event)
+
+    def Batch(self, request, context):
+        return self._schedule(request, context, self._execute_batch)
+
+    def _read_handle_event_responses(
+        self,
+        stream: AxServeEventStream,
+        request_iterator: Iterator[active_pb2.HandleEventResponse],
+    ) -> None:
+        try:
+            for response in request_iterator:
+                stream.handle(response)
+        except grpc.RpcError:
+            pass
+        finally:
+            stream.close()
+
+    def HandleEvent(self, request_iterator, context):
+        stream = AxServeEventStream(context.peer())
+        with self._lock:
+            self._streams.setdefault(stream.peer, {})[stream.id] = stream
+        context.add_callback(stream.close)
+        reader = Thread(
+            target=self._read_handle_event_responses,
+            args=(stream, request_iterator),
+            daemon=True,
+        )
+        reader.start()
+        try:
+            yield from stream
+        finally:
+            stream.close()
+            with self._lock:
+                streams = self._streams.get(stream.peer, {})
+                streams.pop(stream.id, None)
+                if not streams:
+                    self._streams.pop(stream.peer, None)
+
+    def _complete_call(
+        self,
+        responses: SimpleQueue[active_pb2.CallResponse | int | None],
+        items: set[AxServeInboundItem],
+        item: AxServeInboundItem,
+        response: active_pb2.CallResponse,
+        future: Future[Any],
+    ) -> None:
+        items.discard(item)
+        if future.cancelled() and not response.code:
+            response.code = grpc.StatusCode.CANCELLED.value[0]
+            response.message = "Request was cancelled"
+        responses.put(response)
+
+    def _read_call_requests(
+        self,
+        responses: SimpleQueue[active_pb2.CallResponse | int | None],
+        items: set[AxServeInboundItem],
+        request_iterator: Iterator[active_pb2.CallRequest],
+        context: grpc.ServicerContext,
+    ) -> None:
+        count = 0
+        try:
+            for request in request_iterator:
+                count += 1
+                response = active_pb2.CallResponse()
+                response.id = request.id
+                item = AxServeInboundItem(
+                    functools.partial(
+                        self._execute_request_item, request, response, context
+                    )
+                )
+                item.add_done_callback(
+                    functools.partial(
+                        self._complete_call, responses, items, item, response
+                    )
+                )
+                items.add(item)
+                field = request.WhichOneof("request")
+                request_context = (
+                    getattr(request, field).context if field else active_pb2.Context()
+                )
+                try:
+                    self._send_inbound(request_context, item)
+                except AxServeServicerError as exc:
+                    response.code = exc.code.value[0]
+                    response.message = exc.details
+                    item.cancel()
+        except grpc.RpcError:
+            pass
+        finally:
+            responses.put(count)
+
+    def _cancel_call(
+        self,
+        responses: SimpleQueue[active_pb2.CallResponse | int | None],
+        items: set[AxServeInboundItem],
+    ) -> None:
+        for item in list(items):
+            item.cancel()
+        responses.put(None)
+
+    def Call(self, request_iterator, context):
+        responses: SimpleQueue[active_pb2.CallResponse | int | None] = SimpleQueue()
+        items: set[AxServeInboundItem] = set()
+        context.add_callback(functools.partial(self._cancel_call, responses, items))
+        reader = Thread(
+            target=self._read_call_requests,
+            args=(responses, items, request_iterator, context),
+            daemon=True,
+        )
+        reader.start()
+        received = 0
+        expected = None
+        while expected is None or received < expected:
+            response = responses.get()
+            if response is None:
+                return
+            if isinstance(response, int):
+                expected = response
+                continue
+            received += 1
+            yield response
+
+
+class AxServeLocalServer:
+    _server: grpc.Server | None = None
+    _address: str | None = None
+
+    def __init__(
+        self,
+        controls: Iterable[type[AxServeControl]] = (),
+        address: str = "localhost:0",
+        *,
+        max_workers: int | None = None,
+    ) -> None:
+        if not max_workers:
+            max_workers = 32
+        self._bind_address = address
+        self._max_workers = max_workers
+        self._servicer = AxServeServicer(controls)
+
+    @property
+    def servicer(self) -> AxServeServicer:
+        return self._servicer
+
+    @property
+    def address(self) -> str:
+        if self._address is None:
+            msg = "Server is not started"
+            raise ValueError(msg)
+        return self._address
+
+    def start(self) -> str:
+        if self._server is None:
+            self._server = grpc.server(
+                ThreadPoolExecutor(max_workers=self._max_workers)
+            )
+            active_pb2_grpc.add_ActiveServicer_to_server(self._servicer, self._server)
+            port = self._server.add_insecure_port(self._bind_address)
+            if get_unix_socket_path(self._bind_address) is not None:
+                self._address = self._bind_address
+            else:
+                host, _, _ = self._bind_address.rpartition(":")
+                self._address = f"{host}:{port}"
+            self._server.start()
+        return self.address
+
+    def stop(self, grace: float | None = None) -> None:
+        if self._server is not None:
+            self._servicer.close()
+            self._server.stop(grace).wait()
+            self._server = None
+            remove_unix_socket(self._bind_address)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
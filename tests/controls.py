@@ -0,0 +1,63 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import time
+
+from axserve.server.servicer import AxServeControl
+from axserve.server.servicer import event
+
+
+class Counter(AxServeControl):
+    __CLSID__ = "AxServe.Counter"
+
+    def __init__(self) -> None:
+        self._value = 0
+        self._name = "counter"
+
+    @property
+    def Value(self) -> int:  # noqa: N802
+        return self._value
+
+    @Value.setter
+    def Value(self, value: int) -> None:  # noqa: N802
+        self._value = value
+        self.OnValueChanged(value)
+
+    @property
+    def Name(self) -> str:  # noqa: N802
+        return self._name
+
+    @Name.setter
+    def Name(self, name: str) -> None:  # noqa: N802
+        self._name = name
+
+    def Increment(self, step: int) -> int:  # noqa: N802
+        self.Value = self._value + step
+        return self._value
+
+    def Echo(self, value: list) -> list:  # noqa: N802
+        return value
+
+    def Fail(self, message: str) -> None:  # noqa: N802
+        raise RuntimeError(message)
+
+    def Sleep(self, seconds: float) -> None:  # noqa: N802
+        time.sleep(seconds)
+
+    @event
+    def OnValueChanged(self, value: int) -> None: ...  # noqa: N802
@@ -0,0 +1,77 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import grpc
+import pytest
+
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_batch():
+    from axserve.client.stub import AxServeClient
+    from axserve.client.stub import AxServeObject
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        with client.batch() as batch:
+            counter.Value = 3
+            incremented = counter.Increment(2)
+            value = counter.Value
+            failed = counter.Fail("failed")
+            assert len(batch) == 4
+            assert not value.done()
+        assert incremented.result() == 5
+        assert value.result() == 5
+        with pytest.raises(grpc.RpcError) as exc_info:
+            failed.result()
+        assert exc_info.value.code() == grpc.StatusCode.UNKNOWN
+        assert exc_info.value.details() == "failed"
+        assert counter.Value == 5
+
+        batch = client.batch()
+        with batch:
+            cancelled = counter.Increment(1)
+            batch.cancel()
+        assert cancelled.cancelled()
+        assert counter.Value == 5
+
+
+async def test_batch_async():
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+            async with client.batch():
+                incremented = await counter.Increment(2)
+                value = await counter.Value
+                failed = await counter.Fail("failed")
+            assert await incremented == 2
+            assert await value == 2
+            with pytest.raises(grpc.RpcError):
+                await failed
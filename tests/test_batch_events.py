@@ -0,0 +1,95 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import grpc
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.proto import active_pb2
+from axserve.server.servicer import AxServeEventStream
+from axserve.server.servicer import AxServeLocalServer
+from axserve.server.servicer import AxServeOutboundItem
+
+from .controls import Counter
+
+
+def test_event_stream_frames():
+    stream = AxServeEventStream("peer")
+    stream.handle(active_pb2.HandleEventResponse(batch_events=True))
+    items = [AxServeOutboundItem("instance", 0, [i]) for i in range(3)]
+    for item in items:
+        item.send_to([stream])
+
+    frame = next(iter(stream))
+    assert [event.id for event in frame.events] == [item.id for item in items]
+    assert [event.sequence for event in frame.events] == [1, 2, 3]
+
+    stream.handle(active_pb2.HandleEventResponse(acked_sequence=2))
+    assert [item.done() for item in items] == [True, True, False]
+    stream.handle(active_pb2.HandleEventResponse(id=items[2].id))
+    assert items[2].done()
+    assert not stream._sequences
+
+
+def test_batch_events():
+    values = []
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel, batch_events=True) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+
+        def handler(value):
+            values.append((value, counter.Name))
+
+        counter.OnValueChanged.connect(handler)
+        for _ in range(5):
+            counter.Increment(1)
+        streams = [
+            stream
+            for streams in server.servicer._streams.values()
+            for stream in streams.values()
+        ]
+
+    assert values == [(i, "counter") for i in range(1, 6)]
+    assert [stream._sequence for stream in streams] == [5]
+
+
+async def test_batch_events_async():
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    values = []
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel, batch_events=True) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+
+            async def handler(value):
+                values.append((value, await counter.Name))
+
+            await counter.OnValueChanged.connect(handler)
+            for _ in range(5):
+                await counter.Increment(1)
+
+    assert values == [(i, "counter") for i in range(1, 6)]
@@ -0,0 +1,46 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+
+
+def test_run_benchmarks():
+    from axserve.benchmark.suite import run_benchmarks
+
+    report = run_benchmarks(iterations=5, warmup=1)
+    report = json.loads(json.dumps(report))
+    names = {result["name"] for result in report["results"]}
+    assert {
+        "sync.property.get",
+        "sync.property.set",
+        "sync.method.call",
+        "sync.event",
+        "sync.event.slow",
+        "sync.event.slow.early_ack",
+        "aio.property.get",
+        "aio.method.call",
+        "aio.event",
+        "conversion.to_variant.nested_map",
+        "conversion.from_variant.nested_list",
+    } <= names
+    for result in report["results"]:
+        assert result["count"] == 5
+        assert result["p99_us"] >= result["p50_us"]
+        if result["name"].startswith("sync.event"):
+            assert result["mean_us"] > 0
+            assert result["p50_us"] > 0
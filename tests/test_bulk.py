@@ -0,0 +1,102 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import grpc
+import pytest
+
+from axserve.client.stub import AxServeClient
+from axserve.common.call import AxServeCallError
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_bulk_lifecycle():
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+    ):
+        counters = client.create_many(Counter.__CLSID__, 10)
+        assert len(counters) == 10
+        assert len(server.servicer._controls) == 10
+
+        values = []
+        for counter in counters:
+            results = counter.connect_many({"OnValueChanged": values.append})
+            assert [r.successful for r in results] == [True]
+        for i, counter in enumerate(counters):
+            assert counter.Increment(i) == i
+        assert sorted(values) == list(range(10))
+
+        assert client.destroy_many(counters) == [True] * 10
+        assert client.destroy_many(counters) == [False] * 10
+        assert not server.servicer._controls
+
+        results = client.create_many("AxServe.Missing", 2, return_exceptions=True)
+        assert all(isinstance(r, AxServeCallError) for r in results)
+        with pytest.raises(AxServeCallError):
+            client.create_many("AxServe.Missing", 2)
+
+
+def test_destroy_many_failure(monkeypatch):
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+    ):
+        counters = client.create_many(Counter.__CLSID__, 3)
+
+        def fail(requests):  # noqa: ARG001
+            raise AxServeCallError(grpc.StatusCode.UNAVAILABLE, "unavailable")
+
+        with monkeypatch.context() as m:
+            m.setattr(client, "_execute_batch_items", fail)
+            with pytest.raises(AxServeCallError):
+                client.destroy_many(counters)
+        assert all(counter.__axserve__.instance for counter in counters)
+        assert client._instances_manager._count_instances() == 3
+        assert len(server.servicer._controls) == 3
+
+        assert client.destroy_many(counters) == [True] * 3
+        assert not any(counter.__axserve__._instance for counter in counters)
+        assert client._instances_manager._count_instances() == 0
+        assert not server.servicer._controls
+
+
+async def test_bulk_lifecycle_async():
+    from axserve.aio.client.stub import AxServeClient
+
+    values = []
+
+    async def handler(value):
+        values.append(value)
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel) as client,
+        ):
+            counters = await client.create_many(Counter.__CLSID__, 10)
+            for counter in counters:
+                await counter.connect_many({counter.OnValueChanged: handler})
+            for i, counter in enumerate(counters):
+                assert await counter.Increment(i) == i
+            assert sorted(values) == list(range(10))
+            assert await client.destroy_many(counters) == [True] * 10
+            assert not server.servicer._controls
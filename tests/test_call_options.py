@@ -0,0 +1,116 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import time
+
+from concurrent.futures import CancelledError
+
+import grpc
+import pytest
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_call_deadlines():
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel, call_timeout=0.2) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        with pytest.raises(grpc.RpcError) as exc_info:
+            counter.Sleep(1)
+        assert exc_info.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+        with client.call_options(timeout=5):
+            counter.Sleep(0.5)
+        assert counter.Increment(1) == 1
+
+        with client.call_options(timeout=5):
+            blocker = counter.Sleep.future(0.6)
+        time.sleep(0.1)
+        with pytest.raises(grpc.RpcError) as exc_info:
+            counter.OnValueChanged.connect(print)
+        assert exc_info.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+        blocker.result(10)
+
+
+def test_call_deadlines_with_call_stream():
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel, call_stream=True) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        blocker = counter.Sleep.future(0.6)
+        time.sleep(0.1)
+        with client.call_options(timeout=0.2), pytest.raises(grpc.RpcError) as exc_info:
+            counter.Increment(5)
+        assert exc_info.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+        blocker.result(10)
+        assert counter.Value == 0
+        assert counter.Increment(1) == 1
+
+
+def test_call_key_latest_wins():
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        blocker = counter.Sleep.future(0.5)
+        with client.call_options(key="increment"):
+            superseded = counter.Increment.future(1)
+            latest = counter.Increment.future(10)
+        assert latest.result(10) == 10
+        with pytest.raises(CancelledError):
+            superseded.result(10)
+        blocker.result(10)
+        assert counter.Value == 10
+
+
+async def test_call_options_async():
+    import asyncio
+
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel, call_timeout=0.2) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+            with pytest.raises(grpc.RpcError) as exc_info:
+                await counter.Sleep(1)
+            assert exc_info.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+
+            with client.call_options(timeout=5):
+                blocker = asyncio.ensure_future(counter.Sleep(0.5))
+                with client.call_options(key="increment"):
+                    superseded = asyncio.ensure_future(counter.Increment(1))
+                    await asyncio.sleep(0.1)
+                    assert await counter.Increment(10) == 10
+                with pytest.raises(asyncio.CancelledError):
+                    await superseded
+                await blocker
+            assert await counter.Value == 10
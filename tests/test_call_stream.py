@@ -0,0 +1,142 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import grpc
+import pytest
+
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_call_stream():
+    from axserve.client.stub import AxServeClient
+    from axserve.client.stub import AxServeObject
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel, call_stream=True) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        assert client._call_stream_manager is not None
+        counter.Value = 3
+        assert counter.Value == 3
+        assert counter.Increment(2) == 5
+        with pytest.raises(grpc.RpcError) as exc_info:
+            counter.Fail("failed")
+        assert exc_info.value.details() == "failed"
+
+        values = []
+        fired = threading.Event()
+
+        def on_value_changed(value):
+            values.append((value, counter.Value))
+            fired.set()
+
+        counter.OnValueChanged.connect(on_value_changed)
+        counter.Increment(1)
+        assert fired.wait(10)
+        assert values == [(6, 6)]
+        counter.OnValueChanged.disconnect(on_value_changed)
+
+
+def test_call_stream_fallback():
+    from axserve.client.stub import AxServeClient
+    from axserve.client.stub import AxServeObject
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel, call_stream=True) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        call_stream_manager = client._call_stream_manager
+        assert call_stream_manager is not None
+        call_stream_manager._cancel_call_stream()
+        call_stream_manager._call_response_reader.join(10)
+        assert not call_stream_manager._is_call_stream_available()
+        assert counter.Increment(2) == 2
+
+
+def test_call_stream_fallback_after_check(monkeypatch):
+    from axserve.client.stub import AxServeClient
+    from axserve.client.stub import AxServeObject
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel, call_stream=True) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        call_stream_manager = client._call_stream_manager
+        assert call_stream_manager is not None
+        call_stream_manager._cancel_call_stream()
+        call_stream_manager._call_response_reader.join(10)
+        monkeypatch.setattr(
+            call_stream_manager, "_is_call_stream_available", lambda: True
+        )
+        assert client._get_call_stream_manager() is call_stream_manager
+        assert counter.Increment(2) == 2
+        assert counter.Increment.future(1).result(10) == 3
+
+
+def test_call_stream_future_cancel(monkeypatch):
+    from axserve.client.stub import AxServeClient
+    from axserve.client.stub import AxServeObject
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel, call_stream=True) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        call_stream_manager = client._call_stream_manager
+        assert call_stream_manager is not None
+        call_request_queue = call_stream_manager._call_request_queue
+        held = []
+        with monkeypatch.context() as m:
+            m.setattr(call_request_queue, "put", held.append)
+            future = counter.Increment.future(5)
+        assert future.cancel()
+        for call_request in held:
+            call_request_queue.put(call_request)
+        assert counter.Value == 0
+        assert future.cancelled()
+        assert not call_stream_manager._call_futures
+
+
+async def test_call_stream_async():
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel, call_stream=True) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+            assert client._call_stream_manager is not None
+            results = await asyncio.gather(*(counter.Echo(i) for i in range(10)))
+            assert results == list(range(10))
+            assert await counter.Increment(3) == 3
+            with pytest.raises(grpc.RpcError):
+                await counter.Fail("failed")
@@ -0,0 +1,82 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import grpc
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_conflation():
+    values = []
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        counter.OnValueChanged.connect(
+            values.append, conflate=lambda value: value % 2, max_rate=20
+        )
+        conflated = counter.OnValueChanged.get_conflated_handler(values.append)
+        assert conflated is not None
+        for _ in range(20):
+            counter.Increment(1)
+        if thread := conflated._thread:
+            thread.join(10)
+        counter.OnValueChanged.disconnect(values.append)
+        assert counter.OnValueChanged.get_conflated_handler(values.append) is None
+
+    assert conflated.received == 20
+    assert conflated.merged > 0
+    assert conflated.delivered + conflated.merged + conflated.dropped == 20
+    assert values[0] == 1
+    assert sorted(values[-2:]) == [19, 20]
+
+
+async def test_conflation_async():
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    values = []
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+            await counter.OnValueChanged.connect(values.append, max_rate=20)
+            conflated = counter.OnValueChanged.get_conflated_handler(values.append)
+            assert conflated is not None
+            for _ in range(20):
+                await counter.Increment(1)
+            if task := conflated._task:
+                await task
+            await counter.OnValueChanged.disconnect(values.append)
+
+    assert conflated.received == 20
+    assert conflated.merged == 0
+    assert conflated.dropped > 0
+    assert conflated.delivered + conflated.dropped == 20
+    assert values[0] == 1
+    assert values[-1] == 20
@@ -0,0 +1,67 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import grpc
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_deferred_destroy():
+    with AxServeLocalServer([Counter]) as server:
+        with (
+            grpc.insecure_channel(server.address) as channel,
+            AxServeClient(channel, deferred_destroy=True) as client,
+        ):
+            counters = [
+                AxServeObject(Counter.__CLSID__, client=client) for _ in range(20)
+            ]
+            for counter in counters:
+                counter.__exit__(None, None, None)
+            assert client.flush(timeout=10)
+            assert not server.servicer._controls
+
+            for _ in range(5):
+                AxServeObject(Counter.__CLSID__, client=client).__exit__(
+                    None, None, None
+                )
+        assert not server.servicer._controls
+
+
+async def test_deferred_destroy_async():
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel, deferred_destroy=True) as client,
+        ):
+            for _ in range(20):
+                async with AxServeObject(Counter.__CLSID__, client=client):
+                    pass
+            await client.flush()
+            assert not server.servicer._controls
+
+            for _ in range(5):
+                async with AxServeObject(Counter.__CLSID__, client=client):
+                    pass
+        assert not server.servicer._controls
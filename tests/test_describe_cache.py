@@ -0,0 +1,103 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import grpc
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.common.describe_cache import AxServeDescribeCache
+from axserve.proto import active_pb2
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+from .utils import wait_until
+
+
+def test_describe_cache(tmp_path):
+    cache = AxServeDescribeCache(tmp_path)
+    with AxServeLocalServer([Counter]) as server:
+        for _ in range(2):
+            with (
+                grpc.insecure_channel(server.address) as channel,
+                AxServeClient(channel, describe_cache=cache) as client,
+                AxServeObject(Counter.__CLSID__, client=client) as counter,
+            ):
+                assert counter.Echo(1) == 1
+                assert counter.Value == 0
+        assert (cache.hits, cache.misses, cache.stale) == (1, 1, 0)
+        assert len(list(tmp_path.glob("*.pb"))) == 1
+
+
+def test_describe_cache_stale(tmp_path):
+    cache = AxServeDescribeCache(tmp_path)
+    response = active_pb2.DescribeResponse()
+    response.properties.add(index=0, name="Value", property_type="int")
+    cache.store(Counter.__CLSID__, response)
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel, describe_cache=cache) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        members_manager = counter.__axserve__._members_manager
+        wait_until(lambda: cache.stale == 1)
+        assert members_manager._has_member_name("Echo")
+        assert counter.Echo(1) == 1
+    fresh = cache.load(Counter.__CLSID__)
+    assert fresh is not None
+    assert len(fresh.methods) > 0
+
+
+def test_describe_cache_validate_in_event_handler(tmp_path, monkeypatch):
+    cache = AxServeDescribeCache(tmp_path)
+    requests = []
+    futures = []
+    results = []
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel, describe_cache=cache) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        describe = client._stub.Describe
+
+        def describe_future(request, *args, **kwargs):
+            requests.append(request)
+            futures.append(describe.future(request, *args, **kwargs))
+            return futures[-1]
+
+        monkeypatch.setattr(
+            client._stub, "Describe", SimpleNamespace(future=describe_future)
+        )
+        ax = counter.__axserve__
+
+        def handler(value):  # noqa: ARG001
+            client._members_managers._validate_members_manager(
+                Counter.__CLSID__, ax.instance, ax._members_manager
+            )
+            results.append(futures[-1].result(5))
+
+        counter.OnValueChanged.connect(handler)
+        counter.Increment(1)
+
+    [request] = requests
+    assert request.context.context_type == active_pb2.ContextType.EVENT
+    assert len(results) == 1
@@ -0,0 +1,113 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import grpc
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_early_ack():
+    elapsed = {}
+    values = {}
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        for early_ack in (False, True):
+            values[early_ack] = []
+            handled = threading.Semaphore(0)
+
+            def handler(value, values=values[early_ack], handled=handled):
+                time.sleep(0.02)
+                values.append(value)
+                handled.release()
+
+            counter.OnValueChanged.connect(handler, early_ack=early_ack)
+            start_time = time.perf_counter()
+            for _ in range(10):
+                counter.Increment(1)
+            elapsed[early_ack] = time.perf_counter() - start_time
+            for _ in range(10):
+                assert handled.acquire(timeout=10)
+            counter.OnValueChanged.disconnect(handler)
+
+    assert values[False] == list(range(1, 11))
+    assert values[True] == list(range(11, 21))
+    assert elapsed[False] >= 0.2
+    assert elapsed[True] < elapsed[False] / 2
+
+
+def test_early_ack_close():
+    values = []
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+
+        def handler(value):
+            time.sleep(0.05)
+            values.append(value)
+
+        counter.OnValueChanged.connect(handler, early_ack=True)
+        for _ in range(10):
+            counter.Increment(1)
+        assert len(values) < 10
+
+    assert values == list(range(1, 11))
+
+
+async def test_early_ack_async():
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    values = []
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+
+            async def handler(value):
+                await asyncio.sleep(0.02)
+                values.append(value)
+
+            await counter.OnValueChanged.connect(handler, early_ack=True)
+            start_time = time.perf_counter()
+            for _ in range(10):
+                await counter.Increment(1)
+            elapsed = time.perf_counter() - start_time
+            assert len(values) < 10
+
+    assert values == list(range(1, 11))
+    assert elapsed < 0.2
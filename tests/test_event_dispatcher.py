@@ -0,0 +1,225 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+
+import grpc
+import pytest
+
+from axserve.client.component import AxServeEventDispatcher
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+from .utils import wait_until
+from .utils import wait_until_async
+
+
+def test_event_dispatcher_partitions():
+    release = threading.Event()
+    done = threading.Event()
+    order = []
+
+    with AxServeEventDispatcher(4) as dispatcher:
+        dispatcher._dispatch("a", lambda: release.wait(10))
+        for i in range(10):
+            dispatcher._dispatch("b", lambda i=i: order.append(i))
+        dispatcher._dispatch("b", done.set)
+        assert done.wait(10)
+        assert order == list(range(10))
+        assert dispatcher.partitions["a"].depth == 0
+        assert dispatcher.partitions["a"].handled == 0
+        release.set()
+
+    partitions = dispatcher.partitions
+    assert partitions["a"].handled == 1
+    assert partitions["b"].handled == 11
+    assert partitions["b"].handler_time > 0
+
+
+def test_event_dispatcher_shutdown():
+    release = threading.Event()
+    order = []
+
+    dispatcher = AxServeEventDispatcher(1)
+    dispatcher._dispatch("a", lambda: release.wait(10))
+    for i in range(10):
+        dispatcher._dispatch("a", lambda i=i: order.append(i))
+    timer = threading.Timer(0.1, release.set)
+    timer.start()
+    try:
+        dispatcher.shutdown()
+    finally:
+        timer.cancel()
+
+    assert order == list(range(10))
+    assert dispatcher.partitions["a"].depth == 0
+    assert dispatcher.partitions["a"].handled == 11
+    with pytest.raises(RuntimeError):
+        dispatcher._dispatch("a", lambda: None)
+
+
+def test_event_dispatcher_client():
+    values = []
+    threads = set()
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        AxServeEventDispatcher(4) as dispatcher,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel, event_dispatcher=dispatcher) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+
+        def handler(value):
+            threads.add(threading.current_thread().name)
+            values.append((value, counter.Name))
+
+        counter.OnValueChanged.connect(handler)
+        for _ in range(5):
+            counter.Increment(1)
+        wait_until(lambda: len(values) == 5)
+
+    assert values == [(i, "counter") for i in range(1, 6)]
+    assert all(name.startswith("axserve-event") for name in threads)
+
+
+def test_event_dispatcher_parallel():
+    values = []
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        AxServeEventDispatcher(4) as dispatcher,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel, event_dispatcher=dispatcher) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as slow,
+        AxServeObject(Counter.__CLSID__, client=client) as fast,
+    ):
+        slow.OnValueChanged.connect(lambda value: time.sleep(1))  # noqa: ARG005
+        fast.OnValueChanged.connect(values.append)
+        start_time = time.monotonic()
+        slow.Increment(1)
+        fast.Increment(1)
+        wait_until(lambda: values)
+        elapsed_time = time.monotonic() - start_time
+
+    assert values == [1]
+    assert elapsed_time < 0.5
+    assert sum(p.handled for p in dispatcher.partitions.values()) == 2
+
+
+async def test_event_dispatcher_async_in_flight():
+    from axserve.aio.client.component import AxServeEventDispatcher
+
+    release = asyncio.Event()
+    order = []
+
+    async def wait():
+        await release.wait()
+
+    async def append(i):
+        order.append(i)
+
+    dispatcher = AxServeEventDispatcher(2, ordered=False)
+    await dispatcher._dispatch(None, wait)
+    await dispatcher._dispatch(None, wait)
+    blocked = asyncio.create_task(dispatcher._dispatch(None, wait))
+    await asyncio.sleep(0.1)
+    assert not blocked.done()
+    assert dispatcher.in_flight == 2
+    release.set()
+    await blocked
+    await dispatcher.join()
+    assert dispatcher.max_in_flight == 2
+
+    dispatcher = AxServeEventDispatcher(4)
+    for i in range(10):
+        await dispatcher._dispatch("a", functools.partial(append, i))
+    await dispatcher.join()
+    assert order == list(range(10))
+    assert dispatcher.partitions["a"].handled == 10
+
+
+async def test_event_dispatcher_async_client():
+    from axserve.aio.client.component import AxServeEventDispatcher
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    values = []
+    threads = set()
+
+    def sync_handler(value):  # noqa: ARG001
+        threads.add(threading.current_thread())
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(
+                channel, event_dispatcher=AxServeEventDispatcher(8)
+            ) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+
+            async def handler(value):
+                values.append((value, await counter.Name))
+
+            await counter.OnValueChanged.connect(handler)
+            await counter.OnValueChanged.connect(sync_handler)
+            for _ in range(5):
+                await counter.Increment(1)
+            await wait_until_async(lambda: len(values) == 5)
+
+    assert values == [(i, "counter") for i in range(1, 6)]
+    assert threading.main_thread() not in threads
+
+
+async def test_event_dispatcher_async_parallel():
+    from axserve.aio.client.component import AxServeEventDispatcher
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    values = []
+    dispatcher = AxServeEventDispatcher(8)
+
+    async def slow_handler(value):  # noqa: ARG001
+        await asyncio.sleep(1)
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel, event_dispatcher=dispatcher) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as slow,
+            AxServeObject(Counter.__CLSID__, client=client) as fast,
+        ):
+            await slow.OnValueChanged.connect(slow_handler)
+            await fast.OnValueChanged.connect(values.append)
+            start_time = time.monotonic()
+            await slow.Increment(1)
+            await fast.Increment(1)
+            await wait_until_async(lambda: values)
+            elapsed_time = time.monotonic() - start_time
+            await dispatcher.join()
+
+    assert values == [1]
+    assert elapsed_time < 0.5
+    assert dispatcher.max_in_flight == 2
+    assert dispatcher.handled == 2
@@ -0,0 +1,43 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import grpc
+import pytest
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_future():
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as first,
+        AxServeObject(Counter.__CLSID__, client=client) as second,
+    ):
+        futures = [first.Increment.future(1), second.Increment.future(2)]
+        assert [future.result(10) for future in futures] == [1, 2]
+        first["Value"].future_set(5).result(10)
+        assert first["Value"].future_get().result(10) == 5
+        assert second["Value"].future_get().result(10) == 2
+        with pytest.raises(grpc.RpcError):
+            first.Fail.future("failed").result(10)
@@ -0,0 +1,61 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import grpc
+import pytest
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_get_many():
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        counter.Value = 3
+        assert counter.get_many(["Name", "Value"]) == {"Name": "counter", "Value": 3}
+        assert counter.get_many([]) == {}
+        assert counter.snapshot() == {"Value": 3, "Name": "counter"}
+        with pytest.raises(ValueError, match="no property"):
+            counter.get_many(["Increment"])
+
+
+async def test_get_many_async():
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+            assert await counter.Increment(3) == 3
+            assert await counter.get_many(["Name", "Value"]) == {
+                "Name": "counter",
+                "Value": 3,
+            }
+            assert await counter.snapshot() == {"Value": 3, "Name": "counter"}
+            with pytest.raises(ValueError, match="no property"):
+                await counter.get_many(["Increment"])
@@ -0,0 +1,90 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_members_manager_single_flight():
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+    ):
+        members_managers = client.members_managers
+        create_members_manager = members_managers._create_members_manager
+
+        def slow_create_members_manager(c, i):
+            time.sleep(0.5)
+            return create_members_manager(c, i)
+
+        members_managers._create_members_manager = slow_create_members_manager
+
+        with ThreadPoolExecutor(8) as executor:
+            counters = list(
+                executor.map(
+                    lambda _: AxServeObject(Counter.__CLSID__, client=client),
+                    range(8),
+                )
+            )
+
+        assert members_managers.collapsed == 7
+        assert len({id(c.__axserve__.members_manager) for c in counters}) == 1
+        for counter in counters:
+            counter.__exit__(None, None, None)
+
+
+async def test_members_manager_single_flight_async():
+    from axserve.aio.client.stub import AxServeClient as AsyncAxServeClient
+    from axserve.aio.client.stub import AxServeObject as AsyncAxServeObject
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AsyncAxServeClient(channel) as client,
+        ):
+            members_managers = client.members_managers
+            create_members_manager = members_managers._create_members_manager
+
+            async def slow_create_members_manager(c, i):
+                await asyncio.sleep(0.5)
+                return await create_members_manager(c, i)
+
+            members_managers._create_members_manager = slow_create_members_manager
+
+            counters = await asyncio.gather(
+                *[
+                    AsyncAxServeObject(Counter.__CLSID__, client=client)
+                    for _ in range(8)
+                ]
+            )
+
+            assert members_managers.collapsed == 7
+            assert len({id(c.__axserve__.members_manager) for c in counters}) == 1
+            for counter in counters:
+                await counter.__aexit__(None, None, None)
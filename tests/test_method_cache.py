@@ -0,0 +1,67 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import grpc
+
+from axserve.client import decorator
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+class PureCounter(AxServeObject):
+    __CLSID__ = Counter.__CLSID__
+
+    @decorator.method(pure=True, cache_size=2)
+    def Echo(self, value): ...  # noqa: N802
+
+
+def test_method_cache():
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        PureCounter(client=client) as counter,
+    ):
+        cache = counter.__axserve__.method_cache
+        assert counter.Echo(1) == 1
+        assert counter.Echo(value=1) == 1
+        assert counter.Echo.future(1).result(10) == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+
+        assert counter.Echo(2) == 2
+        assert counter.Echo(3) == 3
+        assert len(cache) == 2
+        assert counter.Echo(1) == 1
+        assert (cache.hits, cache.misses) == (2, 4)
+
+        assert counter.Echo([1, 2]) == [1, 2]
+        assert (cache.hits, cache.misses) == (2, 4)
+
+        counter.Echo.cache_clear()
+        assert len(cache) == 0
+        cache.reset_stats()
+        assert counter.Echo(1) == 1
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        assert counter.Echo(value=True) is True
+        assert counter.Echo(1.0) == 1.0
+        assert type(counter.Echo(1.0)) is float
+        assert (cache.hits, cache.misses) == (1, 3)
@@ -0,0 +1,99 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import time
+
+import grpc
+import pytest
+
+from axserve.client.pool import AxServeObjectPool
+from axserve.client.stub import AxServeClient
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_object_pool():
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+    ):
+        checked = []
+
+        def check(o):
+            checked.append(o)
+            return o.Name == "pooled"
+
+        with AxServeObjectPool(
+            Counter.__CLSID__,
+            min_size=1,
+            max_size=2,
+            client=client,
+            init=lambda o: setattr(o, "Name", "pooled"),
+            reset=lambda o: setattr(o, "Value", 0),
+            check=check,
+            idle_timeout=0.2,
+        ) as pool:
+            assert pool.size == 1
+            assert pool.idle_size == 1
+            with pool.lease() as first:
+                assert first.Increment(2) == 2
+                second = pool.acquire()
+                with pytest.raises(TimeoutError):
+                    pool.acquire(timeout=0.1)
+                second.Name = "broken"
+                pool.release(second)
+            assert checked == [first]
+            assert pool.acquire() is first
+            assert first.Value == 0
+            pool.release(first)
+            assert pool.acquire() is first
+            replacement = pool.acquire()
+            assert replacement is not second
+            assert replacement.Name == "pooled"
+            pool.release(first)
+            pool.release(replacement)
+            assert pool.size == 2
+            time.sleep(0.3)
+            assert pool.evict_idle() == 1
+            assert pool.size == 1
+
+
+async def test_object_pool_async():
+    from axserve.aio.client.pool import AxServeObjectPool
+    from axserve.aio.client.stub import AxServeClient
+
+    async def init(o):
+        await o["Name"].set("pooled")
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel) as client,
+            AxServeObjectPool(
+                Counter.__CLSID__, 1, 1, client=client, init=init
+            ) as pool,
+        ):
+            async with pool.lease() as first:
+                assert await first.Name == "pooled"
+                with pytest.raises(TimeoutError):
+                    await pool.acquire(timeout=0.1)
+            async with pool.lease() as second:
+                assert second is first
+            assert pool.size == 1
@@ -0,0 +1,49 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import grpc
+import pytest
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_prepare():
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        increment = client.prepare(counter, "Increment")
+        assert increment(2) == 2
+        assert increment(step=3) == 5
+        assert increment.future(1).result(10) == 6
+        with client.batch():
+            futures = [increment(1), increment(1)]
+        assert [future.result(10) for future in futures] == [7, 8]
+
+        echo = client.prepare(counter, "Echo", validate=False)
+        assert echo([1, "a"]) == [1, "a"]
+        with pytest.raises(TypeError):
+            echo(value=1)
+        with pytest.raises(ValueError, match="no method"):
+            client.prepare(counter, "Value")
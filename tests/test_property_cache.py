@@ -0,0 +1,103 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+
+import grpc
+
+from axserve.client import decorator
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+class CachedCounter(AxServeObject):
+    __CLSID__ = Counter.__CLSID__
+
+    @decorator.property(cache=True, invalidated_by=["OnValueChanged"])
+    def Value(self) -> int: ...  # noqa: N802
+
+    @decorator.property(ttl=60)
+    def Name(self) -> str: ...  # noqa: N802
+
+
+def test_property_cache():
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        CachedCounter(client=client) as counter,
+    ):
+        cache = counter.__axserve__.property_cache
+        assert counter.Value == 0
+        assert counter.Value == 0
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        counter.Increment(2)
+        assert counter.Value == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        control = server.servicer.get_control(counter.__axserve__.instance)
+        assert counter.Name == "counter"
+        control.Name = "changed"
+        assert counter.Name == "counter"
+        cache.invalidate("Name")
+        assert counter.Name == "changed"
+
+        counter.Name = "renamed"
+        assert counter.Name == "renamed"
+
+
+async def test_property_cache_async():
+    from axserve.aio.client import decorator
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    class CachedCounter(AxServeObject):
+        __CLSID__ = Counter.__CLSID__
+
+        @decorator.property(cache=True, invalidated_by=["OnValueChanged"])
+        async def Value(self) -> int: ...  # noqa: N802
+
+        @decorator.property(ttl=0.5)
+        async def Name(self) -> str: ...  # noqa: N802
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel) as client,
+            CachedCounter(client=client) as counter,
+        ):
+            cache = counter.__axserve__.property_cache
+            assert await counter.Value == 0
+            assert await counter.Value == 0
+            assert (cache.hits, cache.misses) == (1, 1)
+
+            await counter.Increment(2)
+            assert await counter.Value == 2
+            assert (cache.hits, cache.misses) == (1, 2)
+
+            control = server.servicer.get_control(counter.__axserve__.instance)
+            assert await counter.Name == "counter"
+            control.Name = "changed"
+            assert await counter.Name == "counter"
+            await asyncio.sleep(0.6)
+            assert await counter.Name == "changed"
+            assert (cache.hits, cache.misses) == (2, 4)
@@ -0,0 +1,107 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from contextlib import AsyncExitStack
+from contextlib import ExitStack
+
+import grpc
+
+from axserve.client.pool import AxServeServerPool
+from axserve.client.stub import AxServeClient
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def _enter_clients(stack: ExitStack, count: int) -> list[AxServeClient]:
+    clients = []
+    for _ in range(count):
+        server = stack.enter_context(AxServeLocalServer([Counter]))
+        channel = stack.enter_context(grpc.insecure_channel(server.address))
+        clients.append(stack.enter_context(AxServeClient(channel)))
+    return clients
+
+
+def test_server_pool_placement():
+    with ExitStack() as stack:
+        clients = _enter_clients(stack, 2)
+        pool = stack.enter_context(AxServeServerPool(clients=clients))
+        counters = [pool.create(Counter.__CLSID__) for _ in range(4)]
+        placed = [counter.__axserve__.client for counter in counters]
+        assert placed.count(clients[0]) == 2
+        assert placed.count(clients[1]) == 2
+        for counter in counters:
+            assert counter.Increment(1) == 1
+        counters[0].__exit__(None, None, None)
+        assert pool.select() is placed[0]
+
+
+def test_server_pool_ewma():
+    with ExitStack() as stack:
+        slow, fast = _enter_clients(stack, 2)
+        pool = stack.enter_context(
+            AxServeServerPool(clients=[slow, fast], policy="ewma", alpha=0.0)
+        )
+        pool.observe(slow, 3.5)
+        pool.observe(fast, 1.0)
+        counters = [pool.create(Counter.__CLSID__) for _ in range(6)]
+        placed = [counter.__axserve__.client for counter in counters]
+        assert placed == [fast, fast, fast, slow, fast, fast]
+        assert pool.latencies == [3.5, 1.0]
+
+        pool = AxServeServerPool(clients=[slow, fast], policy="ewma", alpha=0.5)
+        pool.observe(slow, 1.0)
+        pool.observe(slow, 3.0)
+        assert pool.latencies[0] == 2.0
+
+
+async def test_server_pool_async():
+    from axserve.aio.client.pool import AxServeServerPool
+    from axserve.aio.client.stub import AxServeClient
+
+    async with AsyncExitStack() as stack:
+        clients = []
+        for _ in range(2):
+            server = stack.enter_context(AxServeLocalServer([Counter]))
+            channel = await stack.enter_async_context(
+                grpc.aio.insecure_channel(server.address)
+            )
+            clients.append(await stack.enter_async_context(AxServeClient(channel)))
+        slow, fast = clients
+
+        async with AxServeServerPool(clients=clients) as pool:
+            counters = [await pool.create(Counter.__CLSID__) for _ in range(4)]
+            placed = [counter.__axserve__.client for counter in counters]
+            assert placed.count(slow) == 2
+            assert placed.count(fast) == 2
+            for counter in counters:
+                assert await counter.Increment(1) == 1
+            await counters[0].__aexit__(None, None, None)
+            assert pool.select() is placed[0]
+            for counter in counters[1:]:
+                await counter.__aexit__(None, None, None)
+
+        async with AxServeServerPool(clients=clients, policy="ewma", alpha=0.0) as pool:
+            pool.observe(slow, 3.5)
+            pool.observe(fast, 1.0)
+            counters = [await pool.create(Counter.__CLSID__) for _ in range(6)]
+            placed = [counter.__axserve__.client for counter in counters]
+            assert placed == [fast, fast, fast, slow, fast, fast]
+            assert pool.latencies == [3.5, 1.0]
+
+        assert await counters[0].Increment(2) == 2
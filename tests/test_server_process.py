@@ -0,0 +1,321 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import os
+import platform
+import sys
+
+from pathlib import Path
+
+import grpc
+import pytest
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.server import process as server_process
+
+from .controls import Counter
+from .utils import wait_until
+from .utils import wait_until_async
+
+
+FAKE_SERVER = """\
+import os
+import sys
+import threading
+
+from axserve.server.servicer import AxServeLocalServer
+from tests.controls import Counter
+
+address = sys.argv[sys.argv.index("--address-uri") + 1]
+noise = int(os.environ.get("AXSERVE_FAKE_NOISE", "0"))
+with AxServeLocalServer([Counter], address) as server:
+    print("starting", flush=True)
+    print("AXSERVE_READY", server.address, flush=True)
+    for _ in range(noise):
+        print("x" * 1023, flush=True)
+    if noise:
+        open(os.environ["AXSERVE_FAKE_DONE"], "w").close()
+    threading.Event().wait()
+"""
+
+
+@pytest.fixture
+def fake_server_executable(tmp_path, monkeypatch):
+    executable = tmp_path / "axserve-console.py"
+    executable.write_text(f"#!{sys.executable}\n{FAKE_SERVER}")
+    executable.chmod(0o755)
+    root = Path(__file__).parent.parent
+    paths = [str(root / "src" / "python"), str(root)]
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(paths))
+    monkeypatch.setattr(
+        server_process,
+        "find_server_executable_for_machine",
+        lambda machine: executable,  # noqa: ARG005
+    )
+    return executable
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses a script")
+def test_server_process_ready(fake_server_executable):  # noqa: ARG001
+    process = server_process.AxServeServerProcess()
+    try:
+        assert not process.address.endswith(":0")
+        with (
+            grpc.insecure_channel(process.address) as channel,
+            AxServeClient(channel) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+            assert counter.Increment(3) == 3
+    finally:
+        process.terminate()
+        process.wait()
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses a script")
+def test_server_process_without_stdout(
+    fake_server_executable,  # noqa: ARG001
+    tmp_path,
+    monkeypatch,
+):
+    done = tmp_path / "done"
+    monkeypatch.setenv("AXSERVE_FAKE_NOISE", "1024")
+    monkeypatch.setenv("AXSERVE_FAKE_DONE", str(done))
+    monkeypatch.setattr(sys, "stdout", None)
+    process = server_process.AxServeServerProcess()
+    try:
+        wait_until(done.exists)
+        assert process._stdout_thread.is_alive()
+        assert process.poll() is None
+    finally:
+        process.terminate()
+        process.wait()
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses a script")
+def test_server_process_warm_pool(fake_server_executable):  # noqa: ARG001
+    server_process.enable_warm_pool(2)
+    try:
+        pool = server_process.get_warm_pool()
+        assert pool is not None
+        wait_until(lambda: len(pool._ready) == 2)
+        client = AxServeClient._spawn()
+        try:
+            with AxServeObject(Counter.__CLSID__, client=client) as counter:
+                assert counter.Increment(3) == 3
+            wait_until(lambda: len(pool._ready) == 2)
+        finally:
+            client.close()
+    finally:
+        server_process.disable_warm_pool()
+    assert server_process.get_warm_pool() is None
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses a script")
+def test_server_process_warm_pool_idle(fake_server_executable):  # noqa: ARG001
+    with server_process.AxServeServerProcessPool(1, idle_timeout=0.5) as pool:
+        wait_until(lambda: len(pool._ready) == 1)
+        wait_until(lambda: pool._idle and not pool._ready)
+        process, channel = pool.acquire()
+        try:
+            assert process.poll() is None
+        finally:
+            channel.close()
+            process.terminate()
+            process.wait()
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses a script")
+def test_server_process_supervisor(fake_server_executable):  # noqa: ARG001
+    client = AxServeClient._spawn()
+    try:
+        supervisor = client.supervise(interval=0.05)
+        with AxServeObject(Counter.__CLSID__, client=client) as counter:
+            values = []
+            counter.OnValueChanged.connect(values.append)
+            counter.initialize({"Name": "restored"})
+            assert counter.Increment(2) == 2
+            process = client._managed_process
+            assert process is not None
+            process.kill()
+            wait_until(lambda: supervisor.restarts == 1)
+            assert client._managed_process is not process
+            assert supervisor.last_recovery_time is not None
+            assert counter.Name == "restored"
+            assert counter.Increment(1) == 1
+            wait_until(lambda: values == [2, 1])
+    finally:
+        client.close()
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses a script")
+def test_server_process_supervisor_gives_up(fake_server_executable):
+    client = AxServeClient._spawn()
+    try:
+        supervisor = client.supervise(interval=0.05, max_restarts=2)
+        fake_server_executable.write_text(f"#!{sys.executable}\nraise SystemExit(1)\n")
+        process = client._managed_process
+        assert process is not None
+        process.kill()
+        wait_until(lambda: not supervisor.is_running())
+        assert supervisor.restarts == 0
+        assert supervisor.failures == 2
+        with pytest.raises(RuntimeError, match="after 2 attempts"):
+            supervisor.wait()
+        assert supervisor.error is not None
+        assert isinstance(supervisor.error.__cause__, RuntimeError)
+    finally:
+        client.close()
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses a script")
+def test_server_process_spawn_failure(fake_server_executable, monkeypatch):  # noqa: ARG001
+    spawned = []
+    spawn_process = AxServeClient._spawn_process
+
+    def record_spawn_process(machine, transport):
+        spawned.append(spawn_process(machine, transport))
+        return spawned[-1]
+
+    def fail(*args, **kwargs):  # noqa: ARG001
+        msg = "failed"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(AxServeClient, "_spawn_process", record_spawn_process)
+    monkeypatch.setattr(AxServeClient, "__init__", fail)
+    with pytest.raises(RuntimeError, match="failed"):
+        AxServeClient._spawn()
+    [(process, _)] = spawned
+    assert process.poll() is not None
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses a script")
+async def test_server_process_ready_async(fake_server_executable, monkeypatch):
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+    from axserve.aio.server import process as aio_server_process
+
+    monkeypatch.setattr(
+        aio_server_process,
+        "find_server_executable_for_machine",
+        lambda machine: fake_server_executable,  # noqa: ARG005
+    )
+
+    async with aio_server_process.AxServeServerProcess() as process:
+        assert not process.address.endswith(":0")
+        async with (
+            grpc.aio.insecure_channel(process.address) as channel,
+            AxServeClient(channel) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+            assert await counter.Increment(3) == 3
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses a script")
+async def test_server_process_supervisor_async(fake_server_executable, monkeypatch):
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+    from axserve.aio.server import process as aio_server_process
+
+    monkeypatch.setattr(
+        aio_server_process,
+        "find_server_executable_for_machine",
+        lambda machine: fake_server_executable,  # noqa: ARG005
+    )
+
+    client = await AxServeClient._spawn()
+    try:
+        supervisor = client.supervise(interval=0.05)
+        async with AxServeObject(Counter.__CLSID__, client=client) as counter:
+            values = []
+
+            async def handler(value):
+                values.append(value)
+
+            await counter.OnValueChanged.connect(handler)
+            await counter.initialize({"Name": "restored"})
+            assert await counter.Increment(2) == 2
+            process = client._managed_process
+            assert process is not None
+            process.kill()
+            await wait_until_async(lambda: supervisor.restarts == 1)
+            assert await counter.Name == "restored"
+            assert await counter.Increment(1) == 1
+            await wait_until_async(lambda: values == [2, 1])
+    finally:
+        await client.close()
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses a script")
+async def test_server_process_supervisor_gives_up_async(
+    fake_server_executable,
+    monkeypatch,
+):
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.server import process as aio_server_process
+
+    monkeypatch.setattr(
+        aio_server_process,
+        "find_server_executable_for_machine",
+        lambda machine: fake_server_executable,  # noqa: ARG005
+    )
+
+    client = await AxServeClient._spawn()
+    try:
+        supervisor = client.supervise(interval=0.05, max_restarts=2)
+        fake_server_executable.write_text(f"#!{sys.executable}\nraise SystemExit(1)\n")
+        process = client._managed_process
+        assert process is not None
+        process.kill()
+        await wait_until_async(lambda: not supervisor.is_running())
+        assert supervisor.restarts == 0
+        assert supervisor.failures == 2
+        with pytest.raises(RuntimeError, match="after 2 attempts"):
+            await supervisor.wait()
+    finally:
+        await client.close()
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses a script")
+async def test_server_process_spawn_failure_async(fake_server_executable, monkeypatch):
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.server import process as aio_server_process
+
+    monkeypatch.setattr(
+        aio_server_process,
+        "find_server_executable_for_machine",
+        lambda machine: fake_server_executable,  # noqa: ARG005
+    )
+
+    spawned = []
+    spawn_process = AxServeClient._spawn_process
+
+    async def record_spawn_process(machine, transport):
+        spawned.append(await spawn_process(machine, transport))
+        return spawned[-1]
+
+    async def fail(self):  # noqa: ARG001
+        msg = "failed"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(AxServeClient, "_spawn_process", record_spawn_process)
+    monkeypatch.setattr(AxServeClient, "__ainit__", fail)
+    with pytest.raises(RuntimeError, match="failed"):
+        await AxServeClient._spawn()
+    [(process, _)] = spawned
+    assert process.returncode is not None
@@ -0,0 +1,115 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import grpc
+import pytest
+
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_servicer_properties_and_methods():
+    from axserve.client.stub import AxServeClient
+    from axserve.client.stub import AxServeObject
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        assert counter.Value == 0
+        counter.Value = 3
+        assert counter.Value == 3
+        assert counter.Increment(2) == 5
+        assert counter.Echo([1, "a", {"b": 2.5}]) == [1, "a", {"b": 2.5}]
+        counter.Name = "renamed"
+        assert counter.Name == "renamed"
+
+
+def test_servicer_events_with_nested_calls():
+    from axserve.client.stub import AxServeClient
+    from axserve.client.stub import AxServeObject
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        AxServeObject(Counter.__CLSID__, client=client) as counter,
+    ):
+        values = []
+        fired = threading.Event()
+
+        def on_value_changed(value):
+            # nested call is executed inside the event context on server side
+            values.append((value, counter.Value))
+            fired.set()
+
+        counter.OnValueChanged.connect(on_value_changed)
+        counter.Increment(4)
+        assert fired.wait(10)
+        assert values == [(4, 4)]
+
+        fired.clear()
+        control = server.servicer.get_control(counter.__axserve__.instance)
+        control.OnValueChanged(7).result(10)
+        assert fired.wait(10)
+        assert values[-1] == (7, 4)
+
+        counter.OnValueChanged.disconnect(on_value_changed)
+
+
+def test_servicer_unknown_clsid():
+    from axserve.client.stub import AxServeClient
+    from axserve.client.stub import AxServeObject
+
+    with (
+        AxServeLocalServer([Counter]) as server,
+        grpc.insecure_channel(server.address) as channel,
+        AxServeClient(channel) as client,
+        pytest.raises(grpc.RpcError),
+    ):
+        AxServeObject("AxServe.Unknown", client=client)
+
+
+async def test_servicer_async():
+    from axserve.aio.client.stub import AxServeClient
+    from axserve.aio.client.stub import AxServeObject
+
+    with AxServeLocalServer([Counter]) as server:
+        async with (
+            grpc.aio.insecure_channel(server.address) as channel,
+            AxServeClient(channel) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+            values = []
+            fired = asyncio.Event()
+
+            async def on_value_changed(value):
+                values.append((value, await counter.Value))
+                fired.set()
+
+            await counter.OnValueChanged.connect(on_value_changed)
+            assert await counter.Increment(3) == 3
+            async with asyncio.timeout(10):
+                await fired.wait()
+            assert values == [(3, 3)]
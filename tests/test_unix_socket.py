@@ -0,0 +1,42 @@
+# Copyright 2023 Yunseong Hwang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import grpc
+
+from axserve.client.stub import AxServeClient
+from axserve.client.stub import AxServeObject
+from axserve.common.socket import get_unix_socket_path
+from axserve.common.socket import make_unix_socket_address
+from axserve.server.servicer import AxServeLocalServer
+
+from .controls import Counter
+
+
+def test_unix_socket():
+    address = make_unix_socket_address()
+    path = get_unix_socket_path(address)
+    with AxServeLocalServer([Counter], address) as server:
+        assert server.address == address
+        with (
+            grpc.insecure_channel(server.address) as channel,
+            AxServeClient(channel) as client,
+            AxServeObject(Counter.__CLSID__, client=client) as counter,
+        ):
+            assert counter.Increment(2) == 2
+    assert path is not None
+    assert not path.exists()